@@ -0,0 +1,38 @@
+"""
+Benchmark of parsing a compound library with parse_many, showing how the throughput scales with the number of workers.
+The library is a temporary SD file holding the molecules of Program/Data/Molecules many times over.
+
+Run with: python -m Program.Benchmarks.bench_bulk
+"""
+
+import os
+import tempfile
+
+from Program.Symmetry.bulk import parse_many
+
+MOLECULES = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Data', 'Molecules'))
+
+
+def main(n_molecules=20000, chunk_size=256):
+    records = []
+    for name in sorted(os.listdir(MOLECULES)):
+        with open(os.path.join(MOLECULES, name), 'rb') as file:
+            records.append(file.read())
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'library.sdf')
+        with open(path, 'wb') as file:
+            file.write(b''.join(records) * (n_molecules // len(records)))
+
+        print(f'{n_molecules} molecules on {os.cpu_count()} CPUs:')
+        workers = 1
+        while workers <= os.cpu_count():
+            results = parse_many(path, workers=workers, chunk_size=chunk_size)
+            for _ in results:
+                pass
+            print(f'    {workers:3} workers: {results.throughput:10.0f} molecules/s')
+            workers *= 2
+
+
+if __name__ == '__main__':
+    main()
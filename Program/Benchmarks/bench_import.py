@@ -0,0 +1,40 @@
+"""
+Benchmark of the start-up cost of the program, ie. importing Program.Symmetry.symmetry and accessing one character
+table. The cost of creating every character table, which used to be paid at import time, is shown for comparison.
+Each measurement is done in a fresh interpreter.
+
+Run with: python -m Program.Benchmarks.bench_import
+"""
+
+import os
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+# Each snippet is timed after Program.Symmetry.symmetry (and so pandas) has been imported, which is timed separately:
+SNIPPETS = {
+    'first table (lazy)': 'from Program.Data.character_tables import character_tables\n'
+                          'character_tables["Td"]',
+    'every table (as previously at import)': 'from Program.Data.character_tables import character_tables\n'
+                                             'list(character_tables.values())',
+}
+
+
+def time_snippet(snippet: str, repeat: int) -> tuple:
+    """Returns the best times (in s) of importing the program and then running the snippet in a fresh interpreter."""
+    code = ('import time\nstart = time.perf_counter()\nimport Program.Symmetry.symmetry\n'
+            f'middle = time.perf_counter()\n{snippet}\nprint(middle - start, time.perf_counter() - middle)')
+    times = [subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True,
+                            check=True).stdout.split() for _ in range(repeat)]
+    return min(float(i[0]) for i in times), min(float(i[1]) for i in times)
+
+
+def main(repeat=10):
+    for name, snippet in SNIPPETS.items():
+        import_time, snippet_time = time_snippet(snippet, repeat)
+        print(f'import symmetry + {name + ":":40}{import_time * 1e3:8.1f} ms + {snippet_time * 1e3:6.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+"""
+Benchmark of parsing large .mol files, comparing the vectorised fixed-width parsing of the atoms and bonds blocks with
+parsing them line by line. A synthetic V2000 molecule is used. Its bonds join random pairs of the first 99 atoms, so
+that the numbers in the bonds block stay separated by spaces, which parsing line by line relies on. The same molecule is
+also written in the V3000 format, which holds any number of atoms, to measure the throughput of the V3000 reader.
+
+Run with: python -m Program.Benchmarks.bench_parsing
+"""
+
+import timeit
+import warnings
+
+import numpy as np
+
+from Program.Symmetry.MolParser import MolParser
+
+
+def synthetic_mol(n_atoms: int, seed: int = 0) -> list:
+    """
+    Creates the lines of a V2000 .mol file of a molecule with random coordinates and elements.
+
+    :param n_atoms: The number of atoms. There are n_atoms - 1 bonds.
+    :type n_atoms: int
+    :param seed: The seed of the random number generator.
+    :type seed: int
+
+    :return: The lines of the file.
+    :rtype: list of str
+    """
+    rng = np.random.default_rng(seed)
+    coordinates = rng.uniform(-999, 999, (n_atoms, 3))
+    symbols = rng.choice(['C', 'H', 'N', 'O', 'Cl'], n_atoms)
+    bonds = rng.integers(1, min(n_atoms, 99) + 1, (n_atoms - 1, 2))
+
+    # The counts do not fit in the 3 characters of the counts block, so they are separated by a space to keep them apart:
+    lines = ['synthetic\n', '  benchmark\n', '\n', f'{n_atoms:>3} {n_atoms - 1:>3}  0  0  0  0            999 V2000\n']
+    lines += [f'{x:10.4f}{y:10.4f}{z:10.4f} {symbol:<3} 0  0  0  0  0  0  0  0  0  0  0  0\n'
+              for (x, y, z), symbol in zip(coordinates, symbols)]
+    lines += [f'{first:>3}{second:>3}  1  0  0  0  0\n' for first, second in bonds]
+    lines += ['M  END\n', '$$$$\n']
+    return lines
+
+
+def synthetic_v3000(n_atoms: int, seed: int = 0) -> list:
+    """
+    Creates the lines of a V3000 .mol file of the same molecule as synthetic_mol. Every tenth atom line is continued on
+    a second line.
+
+    :param n_atoms: The number of atoms. There are n_atoms - 1 bonds.
+    :type n_atoms: int
+    :param seed: The seed of the random number generator.
+    :type seed: int
+
+    :return: The lines of the file.
+    :rtype: list of str
+    """
+    lines = synthetic_mol(n_atoms, seed)
+    atoms, bonds = lines[4:4 + n_atoms], lines[4 + n_atoms:3 + 2 * n_atoms]
+
+    v3000 = ['synthetic\n', '  benchmark\n', '\n', '  0  0  0     0  0            999 V3000\n', 'M  V30 BEGIN CTAB\n',
+             f'M  V30 COUNTS {n_atoms} {n_atoms - 1} 0 0 0\n', 'M  V30 BEGIN ATOM\n']
+    for index, line in enumerate(atoms, 1):
+        x, y, z, symbol = line.split()[:4]
+        if index % 10:
+            v3000.append(f'M  V30 {index} {symbol} {x} {y} {z} 0\n')
+        else:
+            v3000 += [f'M  V30 {index} {symbol} {x} {y} {z} 0 -\n', 'M  V30 CHG=0\n']
+    v3000 += ['M  V30 END ATOM\n', 'M  V30 BEGIN BOND\n']
+    v3000 += [f'M  V30 {index} 1 {line[:3].strip()} {line[3:6].strip()}\n' for index, line in enumerate(bonds, 1)]
+    v3000 += ['M  V30 END BOND\n', 'M  V30 END CTAB\n', 'M  END\n', '$$$$\n']
+    return v3000
+
+
+def main(n_atoms=100000, repeat=3):
+    lines = np.array(synthetic_mol(n_atoms))
+    atoms_block = lines[4:4 + n_atoms]
+    bonds_block = lines[4 + n_atoms:3 + 2 * n_atoms]
+
+    molecule = MolParser(lines)
+    buffer = ''.join(lines).encode()
+
+    # Make sure that both ways of parsing give the same result:
+    structure, symbols = molecule._read_atoms_by_tokens(atoms_block)
+    assert np.array_equal(structure, molecule.structure.to_numpy()) and list(symbols) == list(molecule.structure.index)
+    assert np.array_equal(molecule._read_bonds_by_tokens(bonds_block), molecule.bonds.to_numpy())
+
+    timings = {
+        'atoms block, line by line': lambda: molecule._read_atoms_by_tokens(atoms_block),
+        'atoms block, fixed-width': lambda: molecule._read_atoms_fixed_width(atoms_block),
+        'bonds block, line by line': lambda: molecule._read_bonds_by_tokens(bonds_block),
+        'bonds block, fixed-width': lambda: molecule._parse_bonds_block(bonds_block),
+        'whole file': lambda: MolParser(lines),
+        'whole file, from bytes': lambda: MolParser(buffer),
+    }
+
+    print(f'Synthetic molecule with {n_atoms} atoms and {n_atoms - 1} bonds:')
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        for name, function in timings.items():
+            time = min(timeit.repeat(function, number=1, repeat=repeat))
+            print(f'    {name + ":":28}{time * 1000:8.1f} ms')
+
+    main_v3000(n_atoms // 2, repeat)
+
+
+def main_v3000(n_atoms=50000, repeat=3):
+    v2000, v3000 = np.array(synthetic_mol(n_atoms)), np.array(synthetic_v3000(n_atoms))
+
+    # Make sure that both formats give the same molecule:
+    expected, molecule = MolParser(v2000), MolParser(v3000)
+    assert molecule.structure.equals(expected.structure) and molecule.bonds.equals(expected.bonds)
+
+    print(f'Synthetic molecule with {n_atoms} atoms and {n_atoms - 1} bonds:')
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        for name, lines in (('V2000 file', v2000), ('V3000 file', v3000)):
+            time = min(timeit.repeat(lambda: MolParser(lines), number=1, repeat=repeat))
+            print(f'    {name + ":":28}{time * 1000:8.1f} ms ({n_atoms / time / 1e6:.2f} million atoms/s)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+"""
+Benchmark of reducing many reducible representations, comparing repeated calls of PointGroup.reduction with a single
+call of PointGroup.reduce_many, as well as the latency of a single call of each (and of reduction returning an array).
+
+Run with: python -m Program.Benchmarks.bench_reduction
+"""
+
+import timeit
+
+import numpy as np
+
+from Program.Symmetry.symmetry import PointGroup
+
+
+def main(n_representations=10000, point_group='Td'):
+    point_group = PointGroup(point_group)
+
+    # Create valid reducible representations by summing random numbers of each irreducible representation:
+    rng = np.random.default_rng(0)
+    multiplicities = rng.integers(0, 5, (n_representations, len(point_group.character_table) - 1))
+    representations = multiplicities @ point_group.character_table.iloc[1:].to_numpy()
+
+    loop_time = timeit.timeit(lambda: [point_group.reduction(r) for r in representations], number=1)
+    batch_time = min(timeit.repeat(lambda: point_group.reduce_many(representations), number=1, repeat=5))
+
+    assert (point_group.reduce_many(representations) == multiplicities).all()
+
+    print(f'{n_representations} representations of {point_group!r}:')
+    print(f'    reduction (per call): {loop_time:.4f} s ({loop_time / n_representations * 1e6:.1f} µs each)')
+    print(f'    reduce_many:          {batch_time:.4f} s ({batch_time / n_representations * 1e6:.3f} µs each)')
+    print(f'    speed-up:             {loop_time / batch_time:.0f}x')
+
+    single_time = min(timeit.repeat(lambda: point_group.reduction(representations[0]), number=1000, repeat=5)) / 1000
+    single_array_time = min(timeit.repeat(lambda: point_group.reduction(representations[0], as_frame=False),
+                                          number=1000, repeat=5)) / 1000
+    single_batch_time = min(timeit.repeat(lambda: point_group.reduce_many(representations[:1]), number=1000,
+                                          repeat=5)) / 1000
+    print('Single representation:')
+    print(f'    reduction:            {single_time * 1e6:.1f} µs')
+    print(f'    reduction (array):    {single_array_time * 1e6:.1f} µs')
+    print(f'    reduce_many:          {single_batch_time * 1e6:.1f} µs')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,272 @@
+"""
+Compact binary store of the character tables provided in the standard distribution.
+
+The csv files in Program/Data/CSV/ are the editable source of truth. This module compiles all of them into a single
+binary bundle, which PointGroup memory-maps so that the numerical data is read without copying or parsing, and so that
+many processes share one page-cached copy of it. The bundle is rebuilt by running:
+
+    python -m Program.Data.bundle
+
+The bundle consists of:
+    - 8 bytes identifying the format,
+    - 8 bytes holding the length of the header as a little-endian unsigned integer,
+    - the header, a JSON object holding the string metadata of each table (names of the irreducible representations
+      and classes, the contents of the columns with functions, eg. z or $R_z$, the dtype of each column) as well as
+      the checksum of the csv file it was compiled from and the location of its numerical data,
+    - the numerical data block, holding the number of symmetry elements in each class and the characters of each
+      table as contiguous arrays, each starting at a multiple of 8 bytes.
+"""
+
+import functools
+import hashlib
+import io
+import json
+import mmap
+import os
+
+import numpy as np
+import pandas as pd
+
+# Directory holding the csv files from which the bundle is compiled:
+CSV_DIRECTORY = os.path.abspath(os.path.join(os.path.dirname(__file__), 'CSV'))
+
+# Location of the bundle provided in the standard distribution:
+BUNDLE_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), 'character_tables.bin'))
+
+MAGIC = b'SYMCTB\x00\x01'  # Identifies the format (and its version) of the bundle.
+_ALIGNMENT = 8
+
+
+class StaleBundleWarning(Warning):
+    pass
+
+
+class CharacterTableBundle:
+    """
+    Read-only view of a memory-mapped bundle of character tables.
+    """
+
+    def __init__(self, path: str = BUNDLE_PATH):
+        """
+        Memory-maps the bundle and reads its header.
+
+        :param path: The path to the bundle.
+        :type path: str
+        """
+        with open(path, 'rb') as file:
+            self._buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self._buffer[:len(MAGIC)] != MAGIC:
+            raise ValueError(f'The file at {path} is not a character table bundle.')
+
+        header_length = int.from_bytes(self._buffer[8:16], 'little')
+        self._header = json.loads(self._buffer[16:16 + header_length].decode('utf-8'))
+        self._data_offset = 16 + header_length
+        self._path = path
+
+    def __contains__(self, point_group: str) -> bool:
+        return point_group in self._header['tables']
+
+    def __repr__(self):
+        return f'CharacterTableBundle({self._path!r})'
+
+    @property
+    def point_groups(self) -> list:
+        """
+        :return: The names of the point groups (ie. of the csv files) stored in the bundle.
+        :rtype: list of str
+        """
+        return list(self._header['tables'])
+
+    def metadata(self, point_group: str) -> dict:
+        """
+        :param point_group: The name of the point group.
+        :type point_group: str
+
+        :return: The string metadata of the character table: its 'index', 'columns', the 'dtypes' of the columns and
+            the 'strings' held in each non-numerical column, by position.
+        :rtype: dict
+        """
+        return self._header['tables'][point_group]
+
+    def arrays(self, point_group: str) -> tuple:
+        """
+        Returns the numerical data of a character table as read-only arrays backed directly by the memory-mapped bundle.
+
+        :param point_group: The name of the point group.
+        :type point_group: str
+
+        :return: The number of symmetry elements in each class, and the characters of the irreducible representations.
+        :rtype: tuple of numpy.ndarray
+        """
+        entry = self._header['tables'][point_group]
+        return tuple(self._array(entry[key]) for key in ('class_orders', 'characters'))
+
+    def _array(self, location: dict) -> np.ndarray:
+        """Creates an array over the part of the numerical data block described by the location."""
+        dtype = np.dtype(location['dtype'])
+        return np.frombuffer(self._buffer, dtype, int(np.prod(location['shape'])),
+                             self._data_offset + location['offset']).reshape(location['shape'])
+
+    def full_character_table(self, point_group: str) -> pd.DataFrame:
+        """
+        Recreates the full character table, as it would be read from its csv file.
+
+        :param point_group: The name of the point group.
+        :type point_group: str
+
+        :return: The character table including the columns holding the functions.
+        :rtype: pandas.DataFrame
+        """
+        return _assemble_table(self.metadata(point_group), *self.arrays(point_group))
+
+    def is_stale(self, point_group: str, csv_directory: str = CSV_DIRECTORY) -> bool:
+        """
+        Checks whether the csv file of a point group has been changed since the bundle was built.
+
+        :param point_group: The name of the point group.
+        :type point_group: str
+        :param csv_directory: The directory holding the csv files the bundle was compiled from.
+        :type csv_directory: str
+
+        :return: True if the csv file no longer matches the bundle (or no longer exists), otherwise False.
+        :rtype: bool
+        """
+        path = os.path.join(csv_directory, f'{point_group}.csv')
+        try:
+            status = os.stat(path)
+            # The file is only read again if it has been modified:
+            return _file_checksum(path, status.st_mtime_ns, status.st_size) != \
+                self._header['tables'][point_group]['checksum']
+        except FileNotFoundError:
+            return True
+
+
+@functools.lru_cache(maxsize=None)
+def load_bundle(path: str = BUNDLE_PATH):
+    """
+    Memory-maps the bundle once per process.
+
+    :param path: The path to the bundle.
+    :type path: str
+
+    :return: The bundle, or None if it does not exist.
+    :rtype: CharacterTableBundle
+    """
+    try:
+        return CharacterTableBundle(path)
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def build_bundle(csv_directory: str = CSV_DIRECTORY, path: str = BUNDLE_PATH) -> list:
+    """
+    Compiles all csv files in the directory into a bundle.
+
+    :param csv_directory: The directory holding the csv files with the character tables.
+    :type csv_directory: str
+    :param path: Where to save the bundle.
+    :type path: str
+
+    :return: The names of the point groups stored in the bundle.
+    :rtype: list of str
+    """
+    from Program.Symmetry.symmetry import PointGroup
+
+    tables = {}
+    blocks = []
+    offset = 0
+    for file in sorted(os.listdir(csv_directory)):
+        if not file.endswith('.csv'):
+            continue
+
+        with open(os.path.join(csv_directory, file), 'rb') as csv:
+            contents = csv.read()
+        table = pd.read_csv(io.BytesIO(contents), index_col=0, sep=';')
+        point_group = PointGroup(table)  # Compile the numerical data the same way as for any other table
+
+        entry = {'checksum': _checksum(contents),
+                 'index_name': table.index.name,
+                 'index': table.index.tolist(),
+                 'columns': table.columns.tolist(),
+                 'dtypes': [str(dtype) for dtype in table.dtypes],
+                 'strings': {str(position): [None if pd.isna(value) else value for value in table.iloc[:, position]]
+                             for position, dtype in enumerate(table.dtypes) if dtype == object}}
+
+        for key, array in (('class_orders', point_group._class_orders), ('characters', point_group._characters)):
+            data = np.ascontiguousarray(array).tobytes()
+            entry[key] = {'offset': offset, 'dtype': array.dtype.str, 'shape': list(array.shape)}
+            blocks.append(data + bytes(-len(data) % _ALIGNMENT))
+            offset += len(blocks[-1])
+
+        # Make sure that nothing is lost by storing the table in the bundle:
+        if not _tables_identical(_assemble_table(entry, point_group._class_orders, point_group._characters), table):
+            raise ValueError(f'The character table in {file} cannot be stored in the bundle without changing it.')
+        tables[file[:-4]] = entry
+
+    header = json.dumps({'tables': tables}, ensure_ascii=False).encode('utf-8')
+    header += b' ' * (-(len(MAGIC) + 8 + len(header)) % _ALIGNMENT)
+
+    with open(path, 'wb') as bundle:
+        bundle.write(MAGIC)
+        bundle.write(len(header).to_bytes(8, 'little'))
+        bundle.write(header)
+        bundle.writelines(blocks)
+
+    return list(tables)
+
+
+def _checksum(contents: bytes) -> str:
+    """Checksum of the contents of a csv file, used to detect that the bundle is stale."""
+    return hashlib.sha256(contents).hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def _file_checksum(path: str, modified: int, size: int) -> str:
+    """
+    Checksum of a csv file, computed once per process for each time it was modified (and size), so that creating a
+    PointGroup does not read and hash its csv file every time.
+    """
+    with open(path, 'rb') as file:
+        return _checksum(file.read())
+
+
+def _assemble_table(entry: dict, class_orders: np.ndarray, characters: np.ndarray) -> pd.DataFrame:
+    """
+    Creates the full character table from the metadata and the numerical data stored in the bundle.
+
+    :param entry: The metadata of the character table.
+    :type entry: dict
+    :param class_orders: The number of symmetry elements in each class.
+    :type class_orders: numpy.ndarray
+    :param characters: The characters of the irreducible representations.
+    :type characters: numpy.ndarray
+
+    :return: The character table including the columns holding the functions.
+    :rtype: pandas.DataFrame
+    """
+    numeric = np.vstack((class_orders, characters)).T
+    numeric_columns = iter(numeric)
+
+    columns = {}
+    for position, dtype in enumerate(entry['dtypes']):
+        if dtype == 'object':
+            columns[position] = pd.Series([np.nan if value is None else value
+                                           for value in entry['strings'][str(position)]], dtype=object)
+        else:
+            columns[position] = pd.Series(next(numeric_columns).astype(dtype))
+
+    table = pd.DataFrame(columns)
+    table.columns = entry['columns']
+    table.index = pd.Index(entry['index'], name=entry['index_name'])
+    return table
+
+
+def _tables_identical(table: pd.DataFrame, other: pd.DataFrame) -> bool:
+    """Checks that two tables have the same values, labels and dtypes."""
+    return (table.equals(other) and table.index.equals(other.index) and table.columns.equals(other.columns)
+            and (table.dtypes == other.dtypes).all())
+
+
+if __name__ == '__main__':
+    print('Compiled point groups:', ', '.join(build_bundle()))
@@ -1,52 +1,322 @@
+import hashlib
+import mmap
+import os
+import re
 import warnings
 
 import numpy as np
 import pandas as pd
 
+from Program.Data.elements import ATOMIC_NUMBERS, SYMBOL_ARRAY
+
+# Directory holding the molecules provided in the standard distribution, which can be read by name, eg. '937':
+MOLECULE_DIRECTORY = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Data', 'Molecules'))
+
+# Encoding of .mol data given as bytes, eg. a file or a memory-mapped buffer:
+ENCODING = 'utf-8'
+
+# Fixed-width layout of the V2000 format: (start, width) of the fields that are read from each line of a block.
+ATOMS_BLOCK_COORDINATES = ((0, 10), (10, 10), (20, 10))  # x, y, z as 10.4 floats
+ATOMS_BLOCK_SYMBOL = (31, 3)
+ATOMS_BLOCK_WIDTH = 34
+BONDS_BLOCK_FIELDS = ((0, 3), (3, 3), (6, 3), (9, 3))  # first atom, second atom, bond type, stereochemistry
+BONDS_BLOCK_WIDTH = 12
+
+_SPACE = ord(' ')
+_NEWLINE = ord('\n')
+_FULL_STOP = ord('.')
+_M = ord('M')
+
+# Codes of the problems found in corrupted .mol data, which are recorded as diagnostics, and their descriptions:
+COUNTS_CORRUPTED = 1
+CHIRALITY_CORRUPTED = 2
+NATOMS_ESTIMATED = 3
+NATOMS_UNKNOWN = 4
+NBONDS_ESTIMATED = 5
+NBONDS_UNKNOWN = 6
+ATOMS_CORRUPTED = 7
+BONDS_CORRUPTED = 8
+BOND_TYPES_UNKNOWN = 9
+COUNTS_MISMATCH = 10
+DIAGNOSTIC_CODES = {COUNTS_CORRUPTED: 'value of the counts line is not a number',
+                    CHIRALITY_CORRUPTED: 'chirality is not 0 or 1',
+                    NATOMS_ESTIMATED: 'number of atoms estimated from the atoms block',
+                    NATOMS_UNKNOWN: 'number of atoms could not be estimated',
+                    NBONDS_ESTIMATED: 'number of bonds estimated from the bonds block',
+                    NBONDS_UNKNOWN: 'number of bonds could not be estimated',
+                    ATOMS_CORRUPTED: 'atom could not be read',
+                    BONDS_CORRUPTED: 'bond could not be read',
+                    BOND_TYPES_UNKNOWN: 'bonds read without atoms',
+                    COUNTS_MISMATCH: 'numbers of atoms and bonds differ from the counts'}
+
+# A diagnostic: the index of the record (eg. in an SD file), the line (from 0, in the record) and field (eg. 'natoms')
+# where the problem was found, and its code:
+DIAGNOSTIC_DTYPE = np.dtype([('record', np.int32), ('line', np.int32), ('field', 'U11'), ('code', np.uint8)])
+
+# The V3000 format: every line of the connection table starts with the prefix, and a line ending with '-' is continued
+# on the next line. The stereochemistry of bonds (CFG=) is translated to the V2000 values: none, up, either and down.
+V3000_PREFIX = 'M  V30 '
+V3000_BOND_STEREO = np.array([0, 1, 4, 6], dtype=np.int8)
+
+# The end of a continued line of a V3000 connection table, up to the prefix of the next line:
+_V3000_CONTINUATION = re.compile(r'-[ \t]*\r?\n' + V3000_PREFIX)
+
+# Header of a data item of an SD file, eg. '> <StdInChI>' or '>  <CSID> (1)', capturing the name of the field:
+_DATA_HEADER = re.compile(r'>.*?<([^>]*)>')
+
 
 class CorruptedFileWarning(Warning):
     pass
 
 
 class MolParser:
+    """
+    Molecule read from .mol data.
+
+    The molecule is stored as compact arrays: the coordinates of the atoms, their atomic numbers, the pairs of atoms
+    making up each bond, and the type and stereochemistry of each bond. The structure and bonds DataFrames are only
+    created when they are first accessed.
+    """
+    __slots__ = ('_natoms', '_nbonds', '_chiral', '_coordinates', '_atomic_numbers', '_other_symbols', '_bond_atoms',
+                 '_bond_orders', '_bond_stereo', '_data', '_structure', '_bonds', '_error_line', '_derived',
+                 '_derived_key', '_strict', '_diagnostics')
+
     # TODO: add method to change properties from file
-    def __init__(self, mol):
-        if type(mol) is str:
-            with open(fr'C:\Users\TACHYON\Documents\GitHub\symmetry\Program\Data\Molecules\{mol}.mol', 'r') as file:
-                file = np.array(list(file))
-                self._parse_mol(file)
+    def __init__(self, mol, strict: bool = True):
+        """
+        :param mol: The .mol data: the name of a molecule provided in the standard distribution (eg. '937', found in
+            Program/Data/Molecules/), the path to a .mol file, the contents of a .mol file as a str, bytes, memoryview
+            or mmap, or the lines of a .mol file. Files and buffers are parsed in place, using the offsets of their
+            lines, without copying each line into a separate str.
+        :type mol: str, os.PathLike, bytes, memoryview, mmap.mmap or list of str
+        :param strict: If True, each problem found in corrupted data is reported with a warning (and a number of atoms
+            which cannot be estimated raises a CorruptedFileWarning). If False, problems are only recorded in
+            diagnostics, which is much cheaper when parsing many (possibly dirty) records.
+        :type strict: bool
+        """
+        self._data = {}
+        self._structure = None
+        self._bonds = None
+        self._strict = strict
+        self._diagnostics = []
+
+        if isinstance(mol, (bytes, bytearray, memoryview, mmap.mmap)):
+            self._parse_mol(_Lines(mol))
+        elif isinstance(mol, str) and '\n' in mol:  # The contents of a .mol file
+            self._parse_mol(_Lines(mol.encode(ENCODING)))
+        elif isinstance(mol, (str, os.PathLike)):
+            # Molecules provided in the standard distribution are found by name, anything else is taken as a path:
+            path = os.path.join(MOLECULE_DIRECTORY, f'{mol}.mol') if isinstance(mol, str) else mol
+            if not os.path.isfile(path):
+                path = mol
+            try:
+                self._parse_file(path)
+            except FileNotFoundError:
+                print(f'FileNotFoundError: The molecule {mol} could not be found in {MOLECULE_DIRECTORY} or at {mol}')
         else:
             try:
                 mol = np.array(mol)
                 self._parse_mol(mol)
             except TypeError:
-                print('MoleculeError: mol is not a string and is not an iterable. mol should either identify a '
-                      'molecule, be a path to a .mol file, or be a str or list representing the contents of a mol file')
+                print('MoleculeError: mol is not a string, a path, a buffer or an iterable. mol should either identify '
+                      'a molecule, be a path to a .mol file, or be a str, bytes or list representing the contents of a '
+                      'mol file')
+
+    def _parse_file(self, path):
+        """
+        Parses a .mol file by memory-mapping it, so that the file is not read into memory as a whole.
+
+        :param path: The path to the file.
+        :type path: str or os.PathLike
+        """
+        with open(path, 'rb') as file:
+            try:
+                buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # Empty files cannot be memory-mapped
+                buffer = None
+        if buffer is None:
+            self._parse_mol(_Lines(b''))
+            return
+
+        try:
+            self._parse_mol(_Lines(buffer))
+        finally:
+            try:
+                buffer.close()
+            except BufferError:  # Still referenced, eg. by a traceback, so it is closed once it is garbage collected
+                pass
+
+    @classmethod
+    def from_arrays(cls, coordinates, atomic_numbers, bond_atoms=None, bond_orders=None, chiral: bool = False,
+                    data: dict = None):
+        """
+        Creates a molecule directly from the arrays describing it, without any .mol data.
+
+        :param coordinates: The coordinates (in Angstrom) of each atom.
+        :type coordinates: array-like of floats with shape (N, 3)
+        :param atomic_numbers: The atomic number of each atom.
+        :type atomic_numbers: array-like of ints
+        :param bond_atoms: The indices (starting from 0) of the two atoms making up each bond. Defaults to no bonds.
+        :type bond_atoms: array-like of ints with shape (M, 2)
+        :param bond_orders: The type of each bond. Defaults to single bonds.
+        :type bond_orders: array-like of ints
+        :param chiral: The chirality of the molecule.
+        :type chiral: bool
+        :param data: Data items stored with the molecule, eg. its InChI.
+        :type data: dict
+
+        :return: The molecule.
+        :rtype: MolParser
+        """
+        molecule = cls.__new__(cls)
+        molecule._data = dict(data) if data else {}
+        molecule._chiral = chiral
+        molecule._strict, molecule._diagnostics = True, []
+
+        molecule._set_atoms(coordinates, atomic_numbers)
+        if molecule._coordinates.ndim != 2 or molecule._coordinates.shape[1] != 3 or \
+                molecule._atomic_numbers.shape != (len(molecule._coordinates),):
+            raise ValueError('The coordinates must have shape (N, 3) and there must be one atomic number per atom.')
+
+        bond_atoms = np.zeros((0, 2), dtype=np.int32) if bond_atoms is None else bond_atoms
+        molecule._set_bonds(bond_atoms, np.ones(len(bond_atoms), dtype=np.int8) if bond_orders is None else bond_orders)
+        if len(molecule._bond_orders) != len(molecule._bond_atoms):
+            raise ValueError('There must be one bond order per bond.')
+
+        molecule._natoms = len(molecule._coordinates)
+        molecule._nbonds = len(molecule._bond_atoms)
+        return molecule
 
     def _parse_mol(self, file):
-        # TODO: add compatibility with V3000
+        if len(file) > 3 and file[3].rstrip().endswith('V3000'):
+            self._parse_v3000(file)
+            return
+
         self._assign_counts_block_values(file, self._read_counts_block(file))
         atoms_block_end = 4 + self.natoms
 
         try:
             self._parse_atoms_block(file[4:atoms_block_end])
         except ValueError:
-            warnings.warn('The structure of the molecule could not be set because the coordinates part '
-                          f'of the atoms block, specifically line {self._error_line + 1} of the atoms block in the '
-                          'provided .mol data contains non-numeric values. Please ensure all the data follows the .mol '
-                          'standard. Then you can set the structure attribute again.', CorruptedFileWarning)
+            self._report(ATOMS_CORRUPTED, 4 + self._error_line, 'coordinates',
+                         'The structure of the molecule could not be set because the coordinates part of the atoms '
+                         f'block, specifically line {self._error_line + 1} of the atoms block in the provided .mol data '
+                         'contains non-numeric values. Please ensure all the data follows the .mol standard. Then you '
+                         'can set the structure attribute again.')
 
         try:
             self._parse_bonds_block(file[atoms_block_end:(atoms_block_end + self.nbonds)])
         except ValueError:
-            warnings.warn('The bonds of the molecule could not be set because the data on line '
-                          f'{self._error_line + 1} in the provided .mol data contains non-numeric values. '
-                          'Please ensure all the data follows the .mol standard. Then you can set the '
-                          'structure attribute again.', CorruptedFileWarning)
+            self._report(BONDS_CORRUPTED, atoms_block_end + self._error_line, 'bond',
+                         f'The bonds of the molecule could not be set because the data on line {self._error_line + 1} '
+                         'in the provided .mol data contains non-numeric values. Please ensure all the data follows '
+                         'the .mol standard. Then you can set the structure attribute again.')
+
+        self._parse_data_items(file[atoms_block_end + self.nbonds:])
         # TODO: check_consistency function
 
-    @staticmethod
-    def _read_counts_block(file: np.array) -> list:
+    def _parse_v3000(self, file):
+        """
+        Extracts the atoms and bonds from V3000 .mol data, in a single pass over the lines of its connection table. The
+        fields of each atom and bond are stored in rows allocated up front using the numbers of atoms and bonds given on
+        the COUNTS line (which are only extended if these are wrong), and each kind of field is then converted to numbers
+        at once.
+
+        :param file: The whole .mol file.
+        :type file: array-like
+        """
+        natoms = nbonds = n_atoms_read = n_bonds_read = 0
+        atoms, bonds = [], []
+        self._chiral = False
+        block = None
+
+        ctab, end = _v3000_ctab(file, 4)
+        for line in ctab:
+            if not line.startswith(V3000_PREFIX):
+                continue
+            tokens = line[len(V3000_PREFIX):].split()
+            if not tokens:
+                continue
+
+            if block == 'ATOM' and tokens[0] != 'END':
+                # The fields of an atom are its index, type (symbol) and coordinates, followed by optional properties. The
+                # type may be a negated list of elements, eg. 'NOT [N,O]':
+                if len(tokens) > 2 and tokens[1] == 'NOT':
+                    tokens[1:3] = [tokens[1] + ' ' + tokens[2]]
+                if n_atoms_read < natoms:
+                    atoms[n_atoms_read] = tokens[:5]
+                else:  # More atoms than counted
+                    atoms.append(tokens[:5])
+                n_atoms_read += 1
+
+            elif block == 'BOND' and tokens[0] != 'END':
+                # The fields of a bond are its index, type and two atoms, followed by optional properties, of which only
+                # the stereochemistry (CFG=) is kept:
+                row = tokens[1:4]
+                row.append('0')
+                if len(tokens) > 4:
+                    for field in tokens[4:]:
+                        if field.startswith('CFG='):
+                            row[-1] = field[4:]
+                if n_bonds_read < nbonds:
+                    bonds[n_bonds_read] = row
+                else:  # More bonds than counted
+                    bonds.append(row)
+                n_bonds_read += 1
+
+            elif tokens[0] == 'BEGIN' and len(tokens) > 1:
+                block = tokens[1]
+            elif tokens[0] == 'END':
+                block = None
+            elif tokens[0] == 'COUNTS':
+                try:
+                    natoms, nbonds = int(tokens[1]), int(tokens[2])
+                    self._chiral = len(tokens) > 5 and tokens[5] == '1'
+                except (IndexError, ValueError):
+                    self._report(COUNTS_CORRUPTED, -1, 'counts', 'The COUNTS line of the provided V3000 .mol data is '
+                                 'corrupted. Please ensure all the data follows the .mol standard.')
+                atoms, bonds = [None] * natoms, [None] * nbonds
+
+        if n_atoms_read != natoms or n_bonds_read != nbonds:
+            self._report(COUNTS_MISMATCH, -1, 'counts',
+                         f'The V3000 COUNTS line gives {natoms} atoms and {nbonds} bonds, but the connection table '
+                         f'holds {n_atoms_read} atoms and {n_bonds_read} bonds. The numbers of atoms and bonds were '
+                         'taken from the connection table.')
+        self._natoms, self._nbonds = n_atoms_read, n_bonds_read
+        self._parse_data_items(file[end:])
+
+        atom_ids = np.arange(1, n_atoms_read + 1)
+        try:
+            ids, coordinates = _v3000_numbers(atoms[:n_atoms_read], 5, (0, 1), (2, 5))
+        except ValueError as error:
+            self._error_line = error.args[0]
+            self._report(ATOMS_CORRUPTED, -1, 'coordinates',
+                         f'The structure of the molecule could not be set because line {self._error_line + 1} of the '
+                         'atoms block in the provided V3000 .mol data does not hold the index and coordinates of an '
+                         'atom. Please ensure all the data follows the .mol standard.')
+        else:
+            atom_ids = ids[:, 0].astype(np.int64)
+            symbols = [row[1].strip('"') for row in atoms[:n_atoms_read]]  # The type may be quoted, eg. '"NOT [N,O]"'
+            self._set_atoms(coordinates, *_atomic_numbers(symbols))
+
+        try:
+            bonds = _v3000_numbers(bonds[:n_bonds_read], 4, (0, 4))[0].astype(np.int64)
+        except ValueError as error:
+            self._error_line = error.args[0]
+            self._report(BONDS_CORRUPTED, -1, 'bond',
+                         f'The bonds of the molecule could not be set because line {self._error_line + 1} of the bonds '
+                         'block in the provided V3000 .mol data does not hold the type and atoms of a bond. Please '
+                         'ensure all the data follows the .mol standard.')
+            return
+
+        # The bonds refer to the atoms by their index in the connection table, which is usually their position:
+        bond_atoms = bonds[:, 1:3]
+        if not np.array_equal(atom_ids, np.arange(1, n_atoms_read + 1)):
+            order = np.argsort(atom_ids)
+            bond_atoms = order[np.searchsorted(atom_ids, bond_atoms, sorter=order).clip(max=n_atoms_read - 1)] + 1
+        self._set_bonds(bond_atoms - 1, bonds[:, 0], V3000_BOND_STEREO[bonds[:, 3].clip(0, 3)])
+
+    def _read_counts_block(self, file: np.array) -> list:
         """
         Extracts data from the counts block of a .mol file. This data consists of the number of atoms in the
         molecule, the number of bonds in the molecule, and the chirality.
@@ -64,9 +334,10 @@ class MolParser:
                     line_block.append(int(value))
                 except ValueError:
                     line_block.append(None)
-                    warnings.warn('The counts block of the provided .mol data is corrupted. Please ensure all the data'
-                                  ' follows the .mol standard, then you can set the attributes again.',
-                                  CorruptedFileWarning)
+                    field = ('natoms', 'nbonds', 'atom_lists', 'chiral')[min(len(line_block) - 1, 3)]
+                    self._report(COUNTS_CORRUPTED, 3, field, 'The counts block of the provided .mol data is '
+                                 'corrupted. Please ensure all the data follows the .mol standard, then you can set the '
+                                 'attributes again.')
         return line_block
 
     def _assign_counts_block_values(self, file: np.array, line_block: list):
@@ -88,10 +359,10 @@ class MolParser:
         else:
             self._nbonds = line_block[1]
         if line_block[3] not in [0, 1]:
-            warnings.warn('The chirality in the provided .mol data is corrupted. The 4th value in the counts block'
-                          'must be either 0 (achiral) or 1 (chiral). Please ensure all data follows the .mol standard,'
-                          'then you can restart the process. Alternatively you can change this manually.',
-                          CorruptedFileWarning)
+            self._report(CHIRALITY_CORRUPTED, 3, 'chiral', 'The chirality in the provided .mol data is corrupted. The '
+                         '4th value in the counts block must be either 0 (achiral) or 1 (chiral). Please ensure all '
+                         'data follows the .mol standard, then you can restart the process. Alternatively you can '
+                         'change this manually.')
             self._chiral = None
         else:
             self._chiral = bool(line_block[3])
@@ -99,48 +370,120 @@ class MolParser:
     def _guess_natoms(self, file: np.array):
         """
         Estimate the number of atoms using the atoms block. Assumes that the coordinates in the atoms block are floats
-        (indicated by '.') while the bonds block has only ints (no'.').
+        (indicated by '.') while the bonds block has only ints (no'.'). All lines are checked at once.
 
         :param file: The whole .mol file
         :type file: array-like
         """
-        for index, value in enumerate(file[4:]):
-            if value.find('.') == -1:
-                self._natoms = index
-                warnings.warn('The molecule\'s number of atoms was estimated from the number of rows in the atoms'
-                              ' block. This may not be accurate, so please check and if necessary correct this.')
-                break
-        else:
-            raise CorruptedFileWarning('The number of atoms could not be estimated because the provided data. '
-                                       'contains a full stop (".") in every line past 4th.')
+        without_full_stop = np.flatnonzero(~_lines_containing(file[4:], _FULL_STOP))
+        if len(without_full_stop):
+            self._natoms = int(without_full_stop[0])
+            self._report(NATOMS_ESTIMATED, 3, 'natoms', 'The molecule\'s number of atoms was estimated from the number '
+                         'of rows in the atoms block. This may not be accurate, so please check and if necessary '
+                         'correct this.', UserWarning)
+            return
+
+        message = ('The number of atoms could not be estimated because the provided data contains a full stop (".") '
+                   'in every line past 4th.')
+        if self._strict:
+            raise CorruptedFileWarning(message)
+        # Without the bonds block, the atoms block is taken to end with the properties block (or 'M  END'):
+        properties = np.flatnonzero(_first_characters(file[4:]) == _M)
+        self._natoms = int(properties[0]) if len(properties) else len(file) - 4
+        self._report(NATOMS_UNKNOWN, 3, 'natoms', message)
 
     def _guess_nbonds(self, file: np.array):
         """
         Estimates the number of bonds using the bonds block. Assumes that the information following the bonds block
-        (either the properties block of END) starts with first character being 'M'.
+        (either the properties block of END) starts with first character being 'M'. All lines are checked at once.
 
         :param file: The whole .mol file.
         :type file: array-like
         """
-        for index, value in enumerate(file[(4 + self.natoms):]):
-            if value[0] == 'M':
-                self._nbonds = index
-                warnings.warn('The molecule\'s number of bonds was estimated from the number of rows in the bonds'
-                              ' block. This may not be accurate, so please check and if necessary correct this.')
-                break
+        properties = np.flatnonzero(_first_characters(file[(4 + self.natoms):]) == _M)
+        if len(properties):
+            self._nbonds = int(properties[0])
+            self._report(NBONDS_ESTIMATED, 3, 'nbonds', 'The molecule\'s number of bonds was estimated from the number '
+                         'of rows in the bonds block. This may not be accurate, so please check and if necessary '
+                         'correct this.', UserWarning)
         else:
-            warnings.warn('The number of bonds could not be estimated because the provided data '
-                          'does not contain a line starting wtih "M". Please change the file to follow'
-                          'the .mol format or set the number of bonds manually', CorruptedFileWarning)
+            self._report(NBONDS_UNKNOWN, 3, 'nbonds', 'The number of bonds could not be estimated because the '
+                         'provided data does not contain a line starting wtih "M". Please change the file to follow'
+                         'the .mol format or set the number of bonds manually')
 
     def _parse_atoms_block(self, data: np.array):
         """
         Extracts data from the atoms block of a .mol file. This data consists of the coordinate (in Angstrom) of each
         atom in the molecule. Each atom has a separate row. The numeric columns at the end contain extra data.
 
+        The whole block is parsed at once using the fixed-width layout of the V2000 format. If the block does not follow
+        that layout, it is parsed line by line instead, which also finds the line that is corrupted.
+
         :param data: The data contained in a .mol file. This should follow the standards of the format.
         :type data: array-like
         """
+        try:
+            coordinates, symbols = self._read_atoms_fixed_width(data)
+        except ValueError:
+            coordinates, symbols = self._read_atoms_by_tokens(data)
+
+        self._set_atoms(coordinates, *_atomic_numbers(symbols))
+
+    def _set_atoms(self, coordinates: np.ndarray, atomic_numbers: np.ndarray, other_symbols: dict = None):
+        """
+        Stores the atoms of the molecule.
+
+        :param coordinates: The coordinates of each atom.
+        :type coordinates: array-like of floats with shape (N, 3)
+        :param atomic_numbers: The atomic number of each atom, 0 for atoms which are not elements.
+        :type atomic_numbers: array-like of ints
+        :param other_symbols: The symbols of the atoms which are not elements, by the index of the atom.
+        :type other_symbols: dict
+        """
+        self._coordinates = np.ascontiguousarray(coordinates, dtype=np.float64)
+        self._atomic_numbers = np.ascontiguousarray(atomic_numbers, dtype=np.uint8)
+        self._other_symbols = other_symbols or None
+        self._structure = None
+        self._derived, self._derived_key = {}, None
+
+    @staticmethod
+    def _read_atoms_fixed_width(data: np.array) -> tuple:
+        """
+        Reads the coordinates and chemical symbols of all atoms in one vectorised pass over the fixed-width columns of
+        the atoms block.
+
+        :param data: The lines of the atoms block.
+        :type data: array-like
+
+        :return: The coordinates of each atom, and the chemical symbol of each atom.
+        :rtype: tuple of numpy.ndarray
+
+        :raises ValueError: If the block does not follow the fixed-width layout.
+        """
+        block = _fixed_width_block(data, ATOMS_BLOCK_WIDTH)
+        structure = _fields(block, ATOMS_BLOCK_COORDINATES).astype(np.float64)
+
+        # The symbols are left-aligned, so turning the spaces into the zeros used to pad numpy strings strips them:
+        start, width = ATOMS_BLOCK_SYMBOL
+        symbols = block[:, start:start + width].copy()
+        symbols[symbols == _SPACE] = 0
+        if (symbols[:, 0] == 0).any():
+            raise ValueError('The atoms block contains an atom without a left-aligned chemical symbol.')
+
+        return structure, symbols.view(f'S{width}')[:, 0].astype(f'U{width}')
+
+    def _read_atoms_by_tokens(self, data: np.array) -> tuple:
+        """
+        Reads the coordinates and chemical symbols of the atoms line by line, by splitting each line on spaces.
+
+        :param data: The lines of the atoms block.
+        :type data: array-like
+
+        :return: The coordinates of each atom, and the chemical symbol of each atom.
+        :rtype: tuple
+
+        :raises ValueError: If the coordinates on any line are not numeric. The line is stored in _error_line.
+        """
         structure = np.zeros((self.natoms, 3))  # Set up table containing coordinates of each atom.
         row_names = []  # Set up list containing the chemical symbols of each atom.
 
@@ -155,16 +498,59 @@ class MolParser:
                 raise ValueError
             row_names.append(line[3])  # Store chemical symbol of the atom.
 
-        self._structure = pd.DataFrame(structure, row_names, ['x', 'y', 'z'])  # Create df from the extracted data.
+        return structure, row_names
 
     def _parse_bonds_block(self, data: np.array):
         """
         Extract data from the bonds block of a .mol file. This data shows for each bond which atoms participate in it,
         the type of the bond, and its stereochemistry.
 
+        The whole block is parsed at once using the fixed-width layout of the V2000 format. If the block does not follow
+        that layout, it is parsed line by line instead, which also finds the line that is corrupted.
+
         :param data: The data contained in a .mol file. This should follow the standards of the format.
         :type data: list
         """
+        try:
+            bonds = _fields(_fixed_width_block(data, BONDS_BLOCK_WIDTH), BONDS_BLOCK_FIELDS).astype(int)
+        except ValueError:
+            bonds = self._read_bonds_by_tokens(data)
+
+        if not hasattr(self, '_atomic_numbers'):
+            self._report(BOND_TYPES_UNKNOWN, -1, 'bond', 'The bond types could not be identified because structure '
+                         'attribute failed to be set.')
+
+        self._set_bonds(bonds[:, :2] - 1, bonds[:, 2], bonds[:, 3])
+
+    def _set_bonds(self, bond_atoms: np.ndarray, bond_orders: np.ndarray, bond_stereo: np.ndarray = None):
+        """
+        Stores the bonds of the molecule.
+
+        :param bond_atoms: The indices (starting from 0) of the two atoms making up each bond.
+        :type bond_atoms: array-like of ints with shape (M, 2)
+        :param bond_orders: The type of each bond, eg. 1 for a single bond.
+        :type bond_orders: array-like of ints
+        :param bond_stereo: The stereochemistry of each bond. Defaults to 0 for every bond.
+        :type bond_stereo: array-like of ints
+        """
+        self._bond_atoms = np.ascontiguousarray(bond_atoms, dtype=np.int32).reshape(-1, 2)
+        self._bond_orders = np.ascontiguousarray(bond_orders, dtype=np.int8)
+        self._bond_stereo = (np.zeros(len(self._bond_orders), dtype=np.int8) if bond_stereo is None
+                             else np.ascontiguousarray(bond_stereo, dtype=np.int8))
+        self._bonds = None
+
+    def _read_bonds_by_tokens(self, data: np.array) -> np.ndarray:
+        """
+        Reads the bonds block line by line, by splitting each line on spaces.
+
+        :param data: The lines of the bonds block.
+        :type data: array-like
+
+        :return: The two atoms, the bond type and the stereochemistry of each bond.
+        :rtype: numpy.ndarray of ints
+
+        :raises ValueError: If any line contains non-numeric values. The line is stored in _error_line.
+        """
         # Set up the table for the data, relying on number of bonds to know how many rows will be needed.
         bonds = np.zeros((self.nbonds, 4), dtype=int)
 
@@ -177,16 +563,87 @@ class MolParser:
                 self._error_line = index
                 raise ValueError  # Interrupt the parsing
 
-        # Create the row names by taking the the involved atoms' chemical symbols from structure df.
-        try:
-            row_names = [f'{self.structure.index[bonds[i, 0] - 1]}-{self.structure.index[bonds[i, 1] - 1]}'
-                         for i in range(self.nbonds)]
-        except AttributeError:
-            row_names = [i for i in range(1, self.nbonds + 1)]  # Create dummy row names
-            warnings.warn('The bond types could not be identified because structure attribute failed to be set.',
-                          CorruptedFileWarning)
+        return bonds
+
+    def _parse_data_items(self, data: np.array):
+        """
+        Extracts the data items which follow the molecule in an SD file, eg. its InChI or InChIKey. Each item starts with
+        a header line holding its name in angle brackets, followed by its value, which ends with a blank line.
 
-        self._bonds = pd.DataFrame(bonds, row_names, ['Atom1', 'Atom2', 'Bond type', 'Stereochemistry'])
+        :param data: The part of the .mol data following the bonds block.
+        :type data: array-like
+        """
+        self._data = {}
+        lines = iter(data if isinstance(data, _Lines) else np.asarray(data).tolist())
+
+        # The data items only start after the properties block:
+        for line in lines:
+            if line.startswith('M  END'):
+                break
+
+        name = None
+        for line in lines:
+            line = line.rstrip('\r\n')
+            if line.startswith('$$$$'):
+                break
+            elif name is None:
+                header = _DATA_HEADER.match(line)
+                if header:
+                    name, value = header.group(1), []
+            elif line.strip():
+                value.append(line)
+            else:
+                self._data[name] = '\n'.join(value)
+                name = None
+
+        if name is not None:  # The last item was not followed by a blank line
+            self._data[name] = '\n'.join(value)
+
+    def _report(self, code: int, line: int, field: str, message: str, category=CorruptedFileWarning):
+        """
+        Records a problem found in the .mol data, and warns about it unless the molecule is not strict.
+
+        :param code: The code of the problem, eg. ATOMS_CORRUPTED.
+        :type code: int
+        :param line: The index of the line (starting from 0) holding the problem, or -1 if it is not known.
+        :type line: int
+        :param field: The field holding the problem, eg. 'natoms'.
+        :type field: str
+        :param message: The message of the warning.
+        :type message: str
+        :param category: The category of the warning.
+        :type category: type
+        """
+        self._diagnostics.append((0, line, field, code))
+        if self._strict:
+            warnings.warn(message, category)
+
+    @property
+    def diagnostics(self) -> np.ndarray:
+        """
+        :return: The problems found in the .mol data: the record (always 0 for a single molecule), line and field holding
+            each problem, and its code (see DIAGNOSTIC_CODES).
+        :rtype: numpy.ndarray with dtype DIAGNOSTIC_DTYPE
+        """
+        return np.array(self._diagnostics, dtype=DIAGNOSTIC_DTYPE)
+
+    def _derived_results(self) -> dict:
+        """
+        The cache of the results derived from the atoms of the molecule, eg. its permutation tables (see
+        Program/Symmetry/representations.py). It is emptied whenever the coordinates or the elements of the atoms have
+        changed since it was last used, eg. when the coordinates have been modified in place.
+
+        :return: The cached results, by a key chosen by the module which derives them.
+        :rtype: dict
+        """
+        key = hashlib.blake2b(self._coordinates.tobytes(), digest_size=16)
+        key.update(self._atomic_numbers.tobytes())
+        key.update(repr(self._other_symbols).encode())
+        key = key.digest()
+
+        if key != self._derived_key:
+            self._derived, self._derived_key = {}, key
+        return self._derived
 
     @property
     def natoms(self) -> int:
@@ -212,12 +669,57 @@ class MolParser:
         """
         return self._chiral
 
+    @property
+    def coordinates(self) -> np.ndarray:
+        """
+        :return: The coordinates (in Angstrom) of all atoms in the molecule.
+        :rtype: numpy.ndarray of numpy.float64 with shape (N, 3)
+        """
+        return self._coordinates
+
+    @property
+    def atomic_numbers(self) -> np.ndarray:
+        """
+        :return: The atomic number of each atom in the molecule, 0 for atoms which are not elements.
+        :rtype: numpy.ndarray of numpy.uint8
+        """
+        return self._atomic_numbers
+
+    @property
+    def symbols(self) -> np.ndarray:
+        """
+        :return: The chemical symbol of each atom in the molecule.
+        :rtype: numpy.ndarray of str
+        """
+        symbols = SYMBOL_ARRAY[self._atomic_numbers]
+        if self._other_symbols:
+            symbols[list(self._other_symbols)] = list(self._other_symbols.values())
+        return symbols
+
+    @property
+    def bond_atoms(self) -> np.ndarray:
+        """
+        :return: The indices (starting from 0) of the two atoms making up each bond.
+        :rtype: numpy.ndarray of numpy.int32 with shape (M, 2)
+        """
+        return self._bond_atoms
+
+    @property
+    def bond_orders(self) -> np.ndarray:
+        """
+        :return: The type of each bond, eg. 1 for a single bond.
+        :rtype: numpy.ndarray of numpy.int8
+        """
+        return self._bond_orders
+
     @property
     def structure(self) -> pd.DataFrame:
         """
         :return: The coordinates of all atoms in the molecule.
         :rtype: pandas.DataFrame
         """
+        if self._structure is None:
+            self._structure = pd.DataFrame(self._coordinates, self.symbols, ['x', 'y', 'z'])
         return self._structure
 
     @property
@@ -226,4 +728,298 @@ class MolParser:
         :return: The bonds in the molecule.
         :rtype: pandas.DataFrame
         """
+        if self._bonds is None:
+            # Create the row names by taking the involved atoms' chemical symbols:
+            try:
+                symbols = self.symbols
+                row_names = symbols[self._bond_atoms[:, 0]] + '-' + symbols[self._bond_atoms[:, 1]]
+            except AttributeError:
+                row_names = [i for i in range(1, self.nbonds + 1)]  # Create dummy row names
+
+            bonds = np.column_stack((self._bond_atoms + 1, self._bond_orders, self._bond_stereo)).astype(int)
+            self._bonds = pd.DataFrame(bonds, row_names, ['Atom1', 'Atom2', 'Bond type', 'Stereochemistry'])
         return self._bonds
+
+    @property
+    def data(self) -> dict:
+        """
+        :return: The data items stored with the molecule in an SD file, eg. {'StdInChI': 'InChI=1S/H2O/h1H2', ...}. Items
+            with values spanning several lines are joined with new lines.
+        :rtype: dict of str
+        """
+        return self._data
+
+
+class _Lines:
+    """
+    The lines of .mol data held in a buffer (eg. a memory-mapped file), found by the offsets at which they start and end
+    instead of being copied into separate str objects. Slicing gives the lines of a block without copying the buffer,
+    the fixed-width fields of a block are cut out of the buffer at once, and only the lines which are parsed one by one
+    are decoded.
+    """
+
+    __slots__ = ('_bytes', '_starts', '_ends')
+
+    def __init__(self, buffer, starts: np.ndarray = None, ends: np.ndarray = None):
+        """
+        :param buffer: The .mol data.
+        :type buffer: bytes, bytearray, memoryview or mmap.mmap
+        :param starts: The offset at which each line starts. Defaults to all lines of the buffer.
+        :type starts: numpy.ndarray of ints
+        :param ends: The offset at which each line ends, after its new line character.
+        :type ends: numpy.ndarray of ints
+        """
+        self._bytes = np.frombuffer(buffer, dtype=np.uint8)
+        if starts is None:
+            ends = np.flatnonzero(self._bytes == _NEWLINE) + 1
+            if not len(ends) or ends[-1] != len(self._bytes):  # The last line does not end with a new line
+                ends = np.append(ends, len(self._bytes))
+            starts = np.concatenate(([0], ends[:-1])) if len(self._bytes) else np.zeros(0, dtype=np.int64)
+            ends = ends if len(self._bytes) else np.zeros(0, dtype=np.int64)
+        self._starts, self._ends = starts, ends
+
+    def __len__(self):
+        return len(self._starts)
+
+    def __getitem__(self, index):
+        """
+        :return: The decoded line (including its new line), or the lines in a slice.
+        :rtype: str or _Lines
+        """
+        if isinstance(index, slice):
+            lines = _Lines.__new__(_Lines)
+            lines._bytes, lines._starts, lines._ends = self._bytes, self._starts[index], self._ends[index]
+            return lines
+        return self._bytes[self._starts[index]:self._ends[index]].tobytes().decode(ENCODING, errors='replace')
+
+    def __iter__(self):
+        return iter(self.tolist())
+
+    def tolist(self) -> list:
+        """
+        :return: The decoded lines.
+        :rtype: list of str
+        """
+        lines = self.text().split('\n')
+        last = lines.pop()
+        return [line + '\n' for line in lines] + ([last] if last else [])
+
+    def text(self) -> str:
+        """
+        :return: All the lines decoded as one str.
+        :rtype: str
+        """
+        if not len(self):
+            return ''
+        return self._bytes[self._starts[0]:self._ends[-1]].tobytes().decode(ENCODING, errors='replace')
+
+    def containing(self, character: int) -> np.ndarray:
+        """
+        :param character: The ASCII code of the character.
+        :type character: int
+
+        :return: Whether each line contains the character, found with a single scan of the buffer.
+        :rtype: numpy.ndarray of bools
+        """
+        if not len(self):
+            return np.zeros(0, dtype=bool)
+        start = self._starts[0]
+        positions = start + np.flatnonzero(self._bytes[start:self._ends[-1]] == character)
+        lines = np.searchsorted(self._starts, positions, side='right') - 1
+        containing = np.zeros(len(self), dtype=bool)
+        containing[lines] = True
+        return containing
+
+    def first_characters(self) -> np.ndarray:
+        """
+        :return: The ASCII code of the first character of each line, 0 for empty lines.
+        :rtype: numpy.ndarray of numpy.uint8
+        """
+        characters = np.zeros(len(self), dtype=np.uint8)
+        not_empty = self._ends > self._starts
+        characters[not_empty] = self._bytes[self._starts[not_empty]]
+        return characters
+
+    def fixed_width_block(self, width: int) -> np.ndarray:
+        """
+        Copies the first characters of every line straight from the buffer, like _fixed_width_block.
+
+        :param width: The number of characters to keep from each line.
+        :type width: int
+
+        :return: The characters of each line (rows) as ASCII codes, padded with spaces.
+        :rtype: numpy.ndarray of numpy.uint8
+
+        :raises ValueError: If the block contains non-ASCII characters.
+        """
+        # The block is filled a column at a time, so no array of the positions of all its characters is needed:
+        block = np.full((len(self), width), _SPACE, dtype=np.uint8)
+        lengths = self._ends - self._starts
+        for column in range(width):
+            inside = np.flatnonzero(lengths > column)
+            block[inside, column] = self._bytes[self._starts[inside] + column]
+        if (block > 127).any():
+            raise ValueError('The block contains non-ASCII characters.')
+
+        block[block <= _SPACE] = _SPACE  # Line endings and other whitespace
+        return block
+
+
+def _lines_containing(data, character: int) -> np.ndarray:
+    """
+    :param data: The lines of a block.
+    :type data: array-like of str or _Lines
+    :param character: The ASCII code of the character.
+    :type character: int
+
+    :return: Whether each line contains the character.
+    :rtype: numpy.ndarray of bools
+    """
+    if isinstance(data, _Lines):
+        return data.containing(character)
+    return np.char.find(np.asarray(data, dtype=str), chr(character)) != -1
+
+
+def _first_characters(data) -> np.ndarray:
+    """
+    :param data: The lines of a block.
+    :type data: array-like of str or _Lines
+
+    :return: The ASCII code of the first character of each line, 0 for empty lines.
+    :rtype: numpy.ndarray of ints
+    """
+    if isinstance(data, _Lines):
+        return data.first_characters()
+    data = np.asarray(data, dtype=str)
+    if not data.size:
+        return np.zeros(0, dtype=np.uint32)
+    return np.ascontiguousarray(data).view(np.uint32).reshape(len(data), -1)[:, 0]
+
+
+def _atomic_numbers(symbols) -> tuple:
+    """
+    Converts the chemical symbols of the atoms to atomic numbers.
+
+    :param symbols: The chemical symbol of each atom.
+    :type symbols: array-like of str
+
+    :return: The atomic number of each atom (0 if the symbol is not an element), and the symbols which are not
+        elements by the index of their atom.
+    :rtype: tuple
+    """
+    symbols = np.asarray(symbols).tolist()
+    atomic_numbers = np.array([ATOMIC_NUMBERS.get(symbol, 0) for symbol in symbols], dtype=np.uint8)
+    other_symbols = {index: symbols[index] for index in np.flatnonzero(atomic_numbers == 0).tolist()}
+    return atomic_numbers, other_symbols
+
+
+def _v3000_ctab(file, start: int) -> tuple:
+    """
+    Finds the lines of a V3000 connection table, joining each line ending with '-' with the line continuing it.
+
+    :param file: The whole .mol file.
+    :type file: array-like of str
+    :param start: The index of the line from which to read.
+    :type start: int
+
+    :return: The lines of the connection table (still starting with 'M  V30 '), and the index of the 'M  END' line
+        (or the number of lines if there is none).
+    :rtype: tuple of list of str and int
+    """
+    if isinstance(file, _Lines):
+        lines = file[start:]
+        text = lines.text()
+    else:
+        lines = np.asarray(file[start:]).tolist()
+        text = ('' if not lines or lines[0].endswith('\n') else '\n').join(lines)
+    if text.startswith('M  END'):
+        return [], start
+    end = text.find('\nM  END')
+    end = len(text) if end == -1 else end + 1
+
+    # The continuations are removed from the whole table at once:
+    ctab = text[:end]
+    end = ctab.count('\n') if end < len(text) else len(lines)
+    return _V3000_CONTINUATION.sub('', ctab).split('\n'), start + end
+
+
+def _v3000_numbers(rows: list, n_fields: int, *columns) -> list:
+    """
+    Converts the fields of the atoms or bonds of a V3000 connection table to numbers, a range of columns at a time.
+
+    :param rows: The fields of each atom or bond.
+    :type rows: list of list of str
+    :param n_fields: The number of fields each row must have.
+    :type n_fields: int
+    :param columns: The start and end of each range of columns to convert.
+    :type columns: tuple of int
+
+    :return: The numbers in each range of columns.
+    :rtype: list of numpy.ndarray of numpy.float64
+
+    :raises ValueError: If a row has too few fields, or a field is not a number. The error holds the index of the row.
+    """
+    try:
+        return [np.array([row[start:end] for row in rows], dtype=np.float64).reshape(len(rows), end - start)
+                for start, end in columns]
+    except ValueError:
+        pass
+
+    # Find the first row which is wrong:
+    for index, row in enumerate(rows):
+        try:
+            if len(row) < n_fields:
+                raise ValueError
+            [float(field) for start, end in columns for field in row[start:end]]
+        except ValueError:
+            raise ValueError(index)
+    raise ValueError(0)
+
+
+def _fixed_width_block(data, width: int) -> np.ndarray:
+    """
+    Copies the first characters of every line of a block into a 2D array of bytes, so that the fixed-width fields of all
+    lines can be sliced out at once. Lines shorter than the width are padded with spaces.
+
+    :param data: The lines of the block.
+    :type data: array-like of str
+    :param width: The number of characters to keep from each line.
+    :type width: int
+
+    :return: The characters of each line (rows) as ASCII codes.
+    :rtype: numpy.ndarray of numpy.uint8
+
+    :raises ValueError: If the block contains non-ASCII characters.
+    """
+    if isinstance(data, _Lines):
+        return data.fixed_width_block(width)
+    data = np.asarray(data, dtype=str)
+
+    # A numpy array of str holds every line as the same number of UCS4 characters, padded with zeros, so the characters
+    # can be viewed as a 2D array of ints without copying:
+    characters = np.ascontiguousarray(data).view(np.uint32).reshape(len(data), -1)[:, :width]
+    if (characters > 127).any():
+        raise ValueError('The block contains non-ASCII characters.')
+
+    block = np.full((len(data), width), _SPACE, dtype=np.uint8)
+    block[:, :characters.shape[1]] = characters
+    block[block <= _SPACE] = _SPACE  # Padding, line endings and other whitespace
+    return block
+
+
+def _fields(block: np.ndarray, fields: tuple) -> np.ndarray:
+    """
+    Slices the fields out of every line of a block at once. The result can be converted to numbers with astype, which
+    raises a ValueError if any field is not a number.
+
+    :param block: The characters of each line of a block, as made by _fixed_width_block.
+    :type block: numpy.ndarray of numpy.uint8
+    :param fields: The start and width of each field. All fields must have the same width.
+    :type fields: tuple of tuple
+
+    :return: The contents of each field (columns) of each line (rows), eg. b'   -0.2309'.
+    :rtype: numpy.ndarray of bytes
+    """
+    width = fields[0][1]
+    characters = np.stack([block[:, start:start + width] for start, width in fields], axis=1)
+    return characters.view(f'S{width}')[..., 0]
@@ -0,0 +1,236 @@
+"""
+Compression of symmetric molecules into their asymmetric unit: one atom of each set of symmetry-equivalent atoms
+(orbit), plus the operations of the point group which regenerate the others.
+
+An atom lying on a symmetry element (eg. on the C3 axis of NH3) is not moved by some of the operations, its site
+symmetry (stabiliser), so its orbit holds h / |stabiliser| atoms instead of h. Two operations g and g' move such an atom
+onto the same atom exactly when g' = g s for some operation s of its stabiliser, so each atom of the orbit is labelled
+by the first operation of such a set (coset), found with the multiplication table of the point group. Only the few
+different site symmetries are stored, each atom of the unit storing just the index of its own, so the asymmetric unit
+takes O(N / h) memory, and the full structure is regenerated exactly, without matching any atoms, only when needed.
+"""
+
+import numpy as np
+
+from Program.Symmetry.MolParser import MolParser
+from Program.Symmetry.perception import DEFAULT_TOLERANCE
+from Program.Symmetry.representations import _permutation_table, standard_frame
+from Program.Symmetry.symmetry import PointGroup
+
+
+class AsymmetricUnit:
+    """
+    The symmetry-unique atoms of a molecule, in the standard frame of its point group, and its symmetry-unique bonds.
+    """
+
+    __slots__ = ('point_group', 'centre', 'axes', 'coordinates', 'atomic_numbers', 'other_symbols', 'sites',
+                 'site_symmetries', 'bond_atoms', 'bond_operations', 'bond_orders', 'chiral', 'data')
+
+    def __init__(self, point_group: PointGroup, centre: np.ndarray, axes: np.ndarray, coordinates: np.ndarray,
+                 atomic_numbers: np.ndarray, sites: np.ndarray, site_symmetries: np.ndarray, bond_atoms: np.ndarray,
+                 bond_operations: np.ndarray, bond_orders: np.ndarray, other_symbols: dict = None,
+                 chiral: bool = False, data: dict = None):
+        """
+        :param point_group: The point group of the molecule.
+        :type point_group: PointGroup
+        :param centre: The centre of mass of the molecule, ie. the origin of the standard frame.
+        :type centre: numpy.ndarray with shape (3,)
+        :param axes: The x, y and z axes of the standard frame, as rows, in the frame of the molecule.
+        :type axes: numpy.ndarray with shape (3, 3)
+        :param coordinates: The coordinates of the unique atoms, in the standard frame.
+        :type coordinates: numpy.ndarray with shape (U, 3)
+        :param atomic_numbers: The atomic number of each unique atom.
+        :type atomic_numbers: numpy.ndarray of ints
+        :param sites: The index (in site_symmetries) of the site symmetry of each unique atom.
+        :type sites: numpy.ndarray of ints
+        :param site_symmetries: Which operations (in the order of PointGroup.operations) do not move an atom, for each
+            different site symmetry.
+        :type site_symmetries: numpy.ndarray of bools with shape (S, h)
+        :param bond_atoms: The indices (in the unit) of the two unique atoms of each unique bond, which joins the first
+            atom with the image of the second atom under the bond operation.
+        :type bond_atoms: numpy.ndarray of ints with shape (B, 2)
+        :param bond_operations: The index (in PointGroup.operations) of the operation of each unique bond.
+        :type bond_operations: numpy.ndarray of ints
+        :param bond_orders: The type of each unique bond.
+        :type bond_orders: numpy.ndarray of ints
+        :param other_symbols: The symbols of the unique atoms which are not elements, by their index in the unit.
+        :type other_symbols: dict
+        :param chiral: The chirality of the molecule.
+        :type chiral: bool
+        :param data: Data items stored with the molecule.
+        :type data: dict
+        """
+        self.point_group = point_group
+        self.centre = centre
+        self.axes = axes
+        self.coordinates = coordinates
+        self.atomic_numbers = atomic_numbers
+        self.other_symbols = other_symbols or None
+        self.sites = sites
+        self.site_symmetries = site_symmetries
+        self.bond_atoms = bond_atoms
+        self.bond_operations = bond_operations
+        self.bond_orders = bond_orders
+        self.chiral = chiral
+        self.data = data or {}
+
+    def __repr__(self):
+        return f'AsymmetricUnit({self.point_group._name}, {len(self)} of {self.natoms} atoms)'
+
+    def __len__(self):
+        return len(self.coordinates)
+
+    @property
+    def orbit_sizes(self) -> np.ndarray:
+        """
+        :return: The number of atoms equivalent to each unique atom (including itself), ie. h / |site symmetry|.
+        :rtype: numpy.ndarray of ints
+        """
+        return (self.site_symmetries.shape[1] // self.site_symmetries.sum(axis=1))[self.sites]
+
+    @property
+    def natoms(self) -> int:
+        """
+        :return: The number of atoms in the full molecule.
+        :rtype: int
+        """
+        return int(self.orbit_sizes.sum())
+
+    def atom_images(self) -> np.ndarray:
+        """
+        :return: The index (in the expanded molecule) of the atom onto which each operation (columns, in the order of
+            PointGroup.operations) moves each unique atom (rows).
+        :rtype: numpy.ndarray of ints with shape (U, h)
+        """
+        labels = self._labels()
+        # The atoms of each orbit are numbered in the order of their labelling operations, orbit after orbit:
+        distinct = labels == np.arange(labels.shape[1])
+        numbers = np.cumsum(distinct.ravel()).reshape(distinct.shape) - 1
+        return np.take_along_axis(numbers, labels, axis=1)
+
+    def _labels(self) -> np.ndarray:
+        """
+        :return: For each unique atom (rows) and operation (columns), the index of the first operation which moves the
+            atom to the same place.
+        :rtype: numpy.ndarray of ints with shape (U, h)
+        """
+        # g and g s move the atom to the same place for each s of its site symmetry:
+        stabilisers = self.site_symmetries[self.sites]
+        order = stabilisers.shape[1]
+        return np.where(stabilisers[:, None, :], self.point_group.multiplication_table, order).min(axis=2)
+
+    def expand(self) -> MolParser:
+        """
+        Regenerates the full molecule, in its original frame. The atoms are ordered orbit by orbit (in the order of the
+        unique atoms), so are not necessarily in their original order.
+
+        :return: The molecule.
+        :rtype: MolParser
+        """
+        operations = self.point_group.operations
+        labels = self._labels()
+        images = self.atom_images()
+
+        # Only the first operation which moves a unique atom onto each atom of its orbit is applied:
+        unit, operation = np.nonzero(labels == np.arange(len(operations)))
+        coordinates = np.einsum('nij,nj->ni', operations[operation], self.coordinates[unit])
+        coordinates = coordinates @ self.axes + self.centre
+        atomic_numbers = self.atomic_numbers[unit]
+
+        other_symbols = None
+        if self.other_symbols:
+            other_symbols = {int(atom): self.other_symbols[int(unit[atom])]
+                             for atom in np.flatnonzero(np.isin(unit, list(self.other_symbols)))}
+
+        # Each operation g moves a bond between atom a and the image of atom b under k onto the bond between the images
+        # of a under g and of b under g k:
+        products = self.point_group.multiplication_table[:, self.bond_operations]
+        first_atoms = images[self.bond_atoms[:, 0]].T
+        second_atoms = np.take_along_axis(images[self.bond_atoms[:, 1]].T, products, axis=0)
+        bond_atoms = np.stack((np.minimum(first_atoms, second_atoms), np.maximum(first_atoms, second_atoms)), axis=-1)
+        bond_atoms, index = np.unique(bond_atoms.reshape(-1, 2), axis=0, return_index=True)
+        bond_orders = np.tile(self.bond_orders, len(operations))[index]
+
+        molecule = MolParser.from_arrays(coordinates, atomic_numbers, bond_atoms, bond_orders, self.chiral, self.data)
+        if other_symbols:
+            molecule._set_atoms(molecule.coordinates, molecule.atomic_numbers, other_symbols)
+        return molecule
+
+
+def compress(molecule, point_group: PointGroup = None, tolerance: float = DEFAULT_TOLERANCE):
+    """
+    Reduces a molecule to its asymmetric unit.
+
+    :param molecule: The molecule.
+    :type molecule: MolParser
+    :param point_group: The point group of the molecule. Defaults to the point group found from its geometry.
+    :type point_group: PointGroup
+    :param tolerance: The largest distance (in Angstrom) between an atom moved by a symmetry operation and the
+        equivalent atom.
+    :type tolerance: float
+
+    :return: The asymmetric unit, or None if the molecule does not belong to the point group.
+    :rtype: AsymmetricUnit
+    """
+    permutations = _permutation_table(molecule, point_group, tolerance)
+    if permutations is None:
+        return None
+    point_group, table = permutations
+    symmetry = standard_frame(molecule, tolerance)
+    operations = point_group.operations
+
+    # Each orbit is represented by its first atom:
+    orbits = table.min(axis=0)
+    unique = np.flatnonzero(orbits == np.arange(molecule.natoms))
+    stabilisers = (table[:, unique] == unique).T
+    site_symmetries, sites = np.unique(stabilisers, axis=0, return_inverse=True)
+
+    # Atoms on symmetry elements are placed exactly on them (by averaging their images under their site symmetry), so
+    # that all operations of the site symmetry map them exactly onto themselves:
+    coordinates = symmetry.to_standard_frame(molecule.coordinates[unique])
+    images = np.einsum('hij,uj->uhi', operations, coordinates)
+    coordinates = (images * stabilisers[:, :, None]).sum(axis=1) / stabilisers.sum(axis=1)[:, None]
+
+    # The position of each atom in the unit, and an operation which moves the representative of its orbit onto it:
+    position = np.full(molecule.natoms, -1, dtype=np.int64)
+    position[unique] = np.arange(len(unique))
+    moves = np.argmax(table[:, orbits] == np.arange(molecule.natoms), axis=0)
+
+    other_symbols = None
+    if molecule._other_symbols:
+        other_symbols = {int(position[atom]): symbol for atom, symbol in molecule._other_symbols.items()
+                         if position[atom] != -1}
+
+    bond_atoms, bond_operations, bond_orders = _unique_bonds(molecule, point_group, table, orbits, position, moves)
+    return AsymmetricUnit(point_group, symmetry.centre, symmetry.axes, coordinates, molecule.atomic_numbers[unique],
+                          sites, site_symmetries, bond_atoms, bond_operations, bond_orders, other_symbols,
+                          molecule.chiral, dict(molecule.data))
+
+
+def _unique_bonds(molecule, point_group: PointGroup, table: np.ndarray, orbits: np.ndarray, position: np.ndarray,
+                  moves: np.ndarray) -> tuple:
+    """
+    Picks one bond of each set of symmetry-equivalent bonds, and describes it relative to the unique atoms.
+
+    :return: The indices (in the unit) of the unique atoms of each unique bond, the operation moving the second unique
+        atom onto the second atom of the bond (once the first atom is moved onto its unique atom), and the bond orders.
+    :rtype: tuple of numpy.ndarray with shapes (B, 2), (B,) and (B,)
+    """
+    bond_atoms = np.sort(molecule.bond_atoms.astype(np.int64), axis=1)
+    natoms = molecule.natoms
+
+    # Each bond is labelled by the first bond (in the order of their keys) it can be moved onto:
+    keys = bond_atoms[:, 0] * natoms + bond_atoms[:, 1]
+    moved = np.sort(table[:, bond_atoms].astype(np.int64), axis=2)
+    moved_keys = moved[..., 0] * natoms + moved[..., 1]
+    unique = keys == moved_keys.min(axis=0)
+    first, second = bond_atoms[unique].T
+
+    # Move the first atom onto its unique atom with the inverse of an operation which does the opposite, which then
+    # moves the second atom onto an image of its unique atom:
+    multiplication = point_group.multiplication_table
+    inverses = np.argmax(multiplication == 0, axis=1)
+    second = table[inverses[moves[first]], second]
+    return (np.column_stack((position[orbits[first]], position[orbits[second]])), moves[second],
+            molecule.bond_orders[unique])
+
@@ -0,0 +1,243 @@
+"""
+Parallel parsing of many molecules, eg. whole compound libraries stored as SD files or as many .mol files.
+
+The records are split into chunks of consecutive records, described only by the file and the byte offset of their first
+record, so that the workers read the files themselves and only the parsed molecules are sent between processes. The
+warnings issued while parsing each record are caught in the worker and returned with that record. For large, dirty
+libraries, parsing without strict checks skips the warnings machinery altogether: the problems found are only recorded
+as compact diagnostics (see MolParser.diagnostics) labelled with the index of the record.
+"""
+
+import itertools
+import os
+import time
+import warnings
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import numpy as np
+
+from Program.Symmetry.MolParser import DIAGNOSTIC_DTYPE, MolParser
+from Program.Symmetry.sdf import SDFile
+
+DEFAULT_CHUNK_SIZE = 256
+
+
+class ParsedRecord:
+    """
+    The result of parsing one record.
+    """
+
+    __slots__ = ('path', 'index', 'molecule', 'value', 'warnings', 'error', 'diagnostics')
+
+    def __init__(self, path: str, index: int, molecule=None, value=None, warnings=(), error=None, diagnostics=None):
+        """
+        :param path: The file holding the record.
+        :type path: str
+        :param index: The index of the record in the file.
+        :type index: int
+        :param molecule: The parsed molecule, or None if parsing failed.
+        :type molecule: MolParser
+        :param value: The result of the function applied to the molecule, if any.
+        :param warnings: The warnings issued while parsing the record (and applying the function to it).
+        :type warnings: tuple of Warning
+        :param error: The exception raised while parsing the record, if any.
+        :type error: Exception
+        :param diagnostics: The problems found while parsing the record without strict checks, with the index of the
+            record.
+        :type diagnostics: numpy.ndarray with dtype DIAGNOSTIC_DTYPE
+        """
+        self.path = path
+        self.index = index
+        self.molecule = molecule
+        self.value = value
+        self.warnings = tuple(warnings)
+        self.error = error
+        self.diagnostics = np.zeros(0, dtype=DIAGNOSTIC_DTYPE) if diagnostics is None else diagnostics
+
+    def __repr__(self):
+        if self.error is not None:
+            status = f'error={self.error!r}'
+        elif len(self.diagnostics):
+            status = f'{len(self.diagnostics)} diagnostics'
+        else:
+            status = f'{len(self.warnings)} warnings'
+        return f'ParsedRecord({self.path!r}, {self.index}, {status})'
+
+    @property
+    def ok(self) -> bool:
+        """
+        :return: True if the record was parsed without any error.
+        :rtype: bool
+        """
+        return self.error is None
+
+
+class BulkParse:
+    """
+    Iterator over the results of parse_many, which keeps track of the throughput.
+    """
+
+    def __init__(self, records):
+        self._records = records
+        self.count = 0
+        self.elapsed = 0.0
+
+    def __iter__(self):
+        start = time.perf_counter()
+        for record in self._records:
+            self.count += 1
+            self.elapsed = time.perf_counter() - start
+            yield record
+
+    def __repr__(self):
+        return f'BulkParse({self.count} molecules in {self.elapsed:.3f} s, {self.throughput:.1f} molecules/s)'
+
+    @property
+    def throughput(self) -> float:
+        """
+        :return: The number of molecules parsed per second so far.
+        :rtype: float
+        """
+        return self.count / self.elapsed if self.elapsed else 0.0
+
+
+def parse_many(sources, workers: int = None, chunk_size: int = DEFAULT_CHUNK_SIZE, ordered: bool = True,
+               function=None, strict: bool = True) -> BulkParse:
+    """
+    Parses all records of one or many SD (or .mol) files using a pool of processes.
+
+    :param sources: The path to an SD file, or an iterable of paths to SD or .mol files.
+    :type sources: str or iterable of str
+    :param workers: The number of processes. Defaults to the number of CPUs. If 1, the records are parsed in this
+        process.
+    :type workers: int
+    :param chunk_size: The number of consecutive records sent to a process at once.
+    :type chunk_size: int
+    :param ordered: If True, the results are given in the order of the records. Otherwise, each chunk of results is
+        given as soon as it is finished.
+    :type ordered: bool
+    :param function: Function applied to each molecule in the worker, eg. to classify it; its result is stored in the
+        value of the record. It must be defined at the top level of a module, so that it can be sent to the workers.
+    :type function: callable
+    :param strict: If True, the warnings issued while parsing each record are kept with it. If False, the records are
+        parsed without strict checks and only their diagnostics are kept, which is faster for libraries with many
+        corrupted records.
+    :type strict: bool
+
+    :return: Iterable of the results, one per record, which reports the throughput.
+    :rtype: BulkParse
+    """
+    if isinstance(sources, (str, os.PathLike)):
+        sources = [sources]
+    workers = os.cpu_count() if workers is None else workers
+    chunks = _chunks(sources, chunk_size)
+
+    if workers == 1:
+        results = (_parse_chunk(chunk, function, strict) for chunk in chunks)
+    else:
+        results = _parse_in_pool(chunks, workers, ordered, function, strict)
+    return BulkParse(itertools.chain.from_iterable(results))
+
+
+def _chunks(sources, chunk_size: int):
+    """
+    Splits the records of the files into chunks of consecutive records.
+
+    :return: Generator of the path, the byte offset of the first record, the index of the first record, and the number
+        of records of each chunk.
+    :rtype: generator of tuple
+    """
+    for path in sources:
+        offsets = SDFile(os.fspath(path)).offsets
+        for first in range(0, len(offsets), chunk_size):
+            yield os.fspath(path), int(offsets[first]), first, min(chunk_size, len(offsets) - first)
+
+
+def _parse_in_pool(chunks, workers: int, ordered: bool, function, strict: bool = True):
+    """
+    Parses the chunks in a pool of processes, keeping only a few chunks per process in flight so that the memory used
+    does not depend on the number of records.
+
+    :return: Generator of the results of each chunk.
+    :rtype: generator of list of ParsedRecord
+    """
+    max_in_flight = 2 * workers
+    with ProcessPoolExecutor(workers) as pool:
+        pending = []
+        for chunk in chunks:
+            pending.append(pool.submit(_parse_chunk, chunk, function, strict))
+            if len(pending) >= max_in_flight:
+                yield from _finished(pending, ordered)
+        while pending:
+            yield from _finished(pending, ordered)
+
+
+def _finished(pending: list, ordered: bool):
+    """
+    Waits for the first submitted chunk (if ordered) or for any chunk, and removes the finished chunks from pending.
+
+    :return: Generator of the results of the finished chunks.
+    :rtype: generator of list of ParsedRecord
+    """
+    if ordered:
+        yield pending.pop(0).result()
+    else:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            pending.remove(future)
+            yield future.result()
+
+
+def _parse_chunk(chunk: tuple, function=None, strict: bool = True) -> list:
+    """
+    Parses a chunk of consecutive records of a file. Runs in the workers.
+
+    :param chunk: The path, the byte offset of the first record, the index of the first record, and the number of
+        records.
+    :type chunk: tuple
+    :param function: Function applied to each molecule.
+    :type function: callable
+    :param strict: Whether the records are parsed with strict checks, catching their warnings.
+    :type strict: bool
+
+    :return: The results of the records.
+    :rtype: list of ParsedRecord
+    """
+    path, offset, first, count = chunk
+    results = []
+    with open(path, 'rb') as file:
+        file.seek(offset)
+        for index, lines in enumerate(itertools.islice(SDFile._read_record_lines(file), count), first):
+            if not strict:
+                results.append(_parse_record(path, index, lines, function))
+                continue
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter('always')
+                try:
+                    molecule = MolParser(lines)
+                    value = function(molecule) if function is not None else None
+                except Exception as error:
+                    results.append(ParsedRecord(path, index, warnings=tuple(i.message for i in caught), error=error))
+                    continue
+            results.append(ParsedRecord(path, index, molecule, value, tuple(i.message for i in caught)))
+    return results
+
+
+def _parse_record(path: str, index: int, lines: list, function=None) -> ParsedRecord:
+    """
+    Parses a record without strict checks, so without issuing (or catching) any warnings.
+
+    :return: The result of the record, with its diagnostics labelled with its index.
+    :rtype: ParsedRecord
+    """
+    try:
+        molecule = MolParser(lines, strict=False)
+    except Exception as error:
+        return ParsedRecord(path, index, error=error)
+    diagnostics = molecule.diagnostics
+    diagnostics['record'] = index
+    try:
+        value = function(molecule) if function is not None else None
+    except Exception as error:
+        return ParsedRecord(path, index, error=error, diagnostics=diagnostics)
+    return ParsedRecord(path, index, molecule, value, diagnostics=diagnostics)
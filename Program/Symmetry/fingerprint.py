@@ -0,0 +1,101 @@
+"""
+Fingerprints of molecules which do not depend on their orientation or on the order of their atoms, so that duplicates in
+a compound library can be found with a set (or dict) of fingerprints instead of comparing the molecules pairwise.
+
+The fingerprint is a hash of invariants of the parsed arrays:
+
+- the number of atoms of each element;
+- the multiset of interatomic distances, labelled by the elements of the two atoms and rounded to multiples of the
+  tolerance;
+- the number of bonds of each type (the elements of the two atoms and the bond order), and the number of atoms of each
+  element with each number of bonds;
+- optionally, the point group of the molecule.
+
+Identical molecules always have the same fingerprint, and different molecules almost never do. Two geometries which
+differ by less than the tolerance usually have the same fingerprint, but not always, since a distance close to the
+middle between two multiples of the tolerance may be rounded either way; symmetrising noisy geometries first (see
+Program/Symmetry/symmetrisation.py) makes this less likely. Mirror images (enantiomers) have the same fingerprint.
+"""
+
+import hashlib
+
+import numpy as np
+
+from Program.Symmetry.perception import DEFAULT_TOLERANCE
+from Program.Symmetry.representations import standard_frame
+
+DIGEST_SIZE = 16  # bytes
+# Number of atoms whose distances to all other atoms are computed at once, which bounds the memory used:
+DISTANCE_BLOCK = 512
+
+
+def fingerprint(molecule, tolerance: float = DEFAULT_TOLERANCE, symmetry: bool = True) -> bytes:
+    """
+    The fingerprint is cached on the molecule, and computed again only if its atoms have been changed since.
+
+    :param molecule: The molecule.
+    :type molecule: MolParser
+    :param tolerance: The precision (in Angstrom) to which the interatomic distances are compared, which is also the
+        tolerance with which the point group is found.
+    :type tolerance: float
+    :param symmetry: Whether the point group of the molecule is part of the fingerprint. Finding it is the most
+        expensive part for small molecules, and rarely tells apart molecules with the same distances.
+    :type symmetry: bool
+
+    :return: The fingerprint.
+    :rtype: bytes
+    """
+    cache = molecule._derived_results()
+    key = ('fingerprint', tolerance, symmetry)
+    if key not in cache:
+        # Atoms are described by the index of their symbol among the (sorted) symbols of the molecule:
+        symbols, kinds, counts = np.unique(molecule.symbols, return_inverse=True, return_counts=True)
+
+        digest = hashlib.blake2b(digest_size=DIGEST_SIZE)
+        digest.update(' '.join(f'{symbol}{count}' for symbol, count in zip(symbols, counts)).encode())
+        for invariant in _distance_multiset(molecule.coordinates, kinds, len(symbols), tolerance) + \
+                _bond_invariants(molecule.bond_atoms, molecule.bond_orders, kinds, len(symbols)):
+            _update(digest, invariant)
+        if symmetry:
+            digest.update(standard_frame(molecule, tolerance).name.encode())
+        cache[key] = digest.digest()
+    return cache[key]
+
+
+def _distance_multiset(coordinates: np.ndarray, kinds: np.ndarray, n_kinds: int, tolerance: float) -> tuple:
+    """
+    :return: The distinct labelled distances, each encoded as the pair of kinds of atoms times 2^32 plus the distance
+        in multiples of the tolerance, and the number of pairs of atoms at each of them.
+    :rtype: tuple of numpy.ndarray of ints
+    """
+    keys = []
+    for start in range(0, len(coordinates), DISTANCE_BLOCK):
+        # Distances from a block of atoms to all the following atoms:
+        stop = min(start + DISTANCE_BLOCK, len(coordinates))
+        first, second = np.triu_indices(stop - start, 1, len(coordinates) - start)
+        first, second = first + start, second + start
+        distances = np.linalg.norm(coordinates[first] - coordinates[second], axis=1)
+
+        pairs = np.minimum(kinds[first], kinds[second]) * n_kinds + np.maximum(kinds[first], kinds[second])
+        keys.append(pairs.astype(np.int64) << 32 | np.rint(distances / tolerance).astype(np.int64))
+    return np.unique(np.concatenate(keys) if keys else np.zeros(0, dtype=np.int64), return_counts=True)
+
+
+def _bond_invariants(bond_atoms: np.ndarray, bond_orders: np.ndarray, kinds: np.ndarray, n_kinds: int) -> tuple:
+    """
+    :return: The distinct types of bonds (the pair of kinds of atoms and the bond order) and the number of bonds of each
+        type, and the distinct kinds of atoms with their number of bonds and the number of atoms of each.
+    :rtype: tuple of numpy.ndarray of ints
+    """
+    bond_atoms = bond_atoms.astype(np.int64)
+    first, second = kinds[bond_atoms[:, 0]], kinds[bond_atoms[:, 1]]
+    bond_types = (np.minimum(first, second) * n_kinds + np.maximum(first, second)) << 8 | bond_orders.astype(np.int64)
+    degrees = np.bincount(bond_atoms.ravel(), minlength=len(kinds))
+    return np.unique(bond_types, return_counts=True) + np.unique(degrees * n_kinds + kinds, return_counts=True)
+
+
+def _update(digest, invariant: np.ndarray):
+    """Adds an array of ints to the hash, preceded by its length so that consecutive arrays cannot be confused."""
+    invariant = np.ascontiguousarray(invariant, dtype=np.int64)
+    digest.update(np.int64(len(invariant)).tobytes())
+    digest.update(invariant.tobytes())
@@ -0,0 +1,165 @@
+"""
+Geometric symmetry operations, and fast matching of the atoms of a molecule to the positions they are moved to by an
+operation.
+"""
+
+import numpy as np
+
+IDENTITY = np.eye(3)
+INVERSION = -np.eye(3)
+
+
+def rotation_matrix(axis, angle: float) -> np.ndarray:
+    """
+    :param axis: The axis of the rotation. Does not have to be normalised.
+    :type axis: array-like of 3 floats
+    :param angle: The angle of the rotation, in radians, anticlockwise when looking down the axis.
+    :type angle: float
+
+    :return: The matrix of the rotation, acting on column vectors.
+    :rtype: numpy.ndarray with shape (3, 3)
+    """
+    x, y, z = np.asarray(axis, dtype=float) / np.linalg.norm(axis)
+    cos, sin = np.cos(angle), np.sin(angle)
+    cross = np.array([[0, -z, y], [z, 0, -x], [-y, x, 0]])
+    return cos * IDENTITY + sin * cross + (1 - cos) * np.outer((x, y, z), (x, y, z))
+
+
+def reflection_matrix(normal) -> np.ndarray:
+    """
+    :param normal: The normal of the mirror plane. Does not have to be normalised.
+    :type normal: array-like of 3 floats
+
+    :return: The matrix of the reflection through the plane, acting on column vectors.
+    :rtype: numpy.ndarray with shape (3, 3)
+    """
+    normal = np.asarray(normal, dtype=float) / np.linalg.norm(normal)
+    return IDENTITY - 2 * np.outer(normal, normal)
+
+
+def improper_rotation_matrix(axis, angle: float) -> np.ndarray:
+    """
+    :param axis: The axis of the improper rotation. Does not have to be normalised.
+    :type axis: array-like of 3 floats
+    :param angle: The angle of the rotation, in radians.
+    :type angle: float
+
+    :return: The matrix of the rotation followed by the reflection through the plane perpendicular to the axis.
+    :rtype: numpy.ndarray with shape (3, 3)
+    """
+    return reflection_matrix(axis) @ rotation_matrix(axis, angle)
+
+
+class AtomMatcher:
+    """
+    Finds, for any set of points, the atom of the same kind lying within the tolerance of each point.
+
+    The atoms are sorted into a grid of cubic cells with sides of twice the tolerance, so the atoms within the tolerance
+    of a point can only lie in the 8 cells nearest to it. Looking these up costs O(log N) per point, so checking
+    whether an operation is a symmetry of the whole molecule costs O(N log N) instead of O(N²).
+    """
+
+    def __init__(self, coordinates: np.ndarray, kinds: np.ndarray, tolerance: float):
+        """
+        :param coordinates: The coordinates of the atoms.
+        :type coordinates: numpy.ndarray with shape (N, 3)
+        :param kinds: The kind of each atom, eg. its atomic number. Only atoms of the same kind are matched.
+        :type kinds: numpy.ndarray of ints
+        :param tolerance: The largest distance between a point and the atom it is matched to.
+        :type tolerance: float
+        """
+        self.coordinates = np.asarray(coordinates, dtype=float)
+        self.kinds = np.asarray(kinds)
+        self.tolerance = tolerance
+        self._cell_size = 2 * tolerance
+
+        cells = np.floor(self.coordinates / self._cell_size).astype(np.int64)
+        self._lowest = cells.min(axis=0) if len(cells) else np.zeros(3, dtype=np.int64)
+        self._shape = (cells.max(axis=0) - self._lowest + 1) if len(cells) else np.ones(3, dtype=np.int64)
+
+        # The atoms sorted by cell, and where the atoms of each occupied cell start in that order:
+        keys = self._keys(cells)
+        self._order = np.argsort(keys, kind='stable')
+        self._cells, self._starts, self._counts = np.unique(keys[self._order], return_index=True, return_counts=True)
+        self._occupancy = int(self._counts.max(initial=0))  # The largest number of atoms in one cell
+
+    def _keys(self, cells: np.ndarray) -> np.ndarray:
+        """Packs the (integer) coordinates of cells into a single int per cell, -1 for cells outside the grid."""
+        cells = cells - self._lowest
+        outside = ((cells < 0) | (cells >= self._shape)).any(axis=1)
+        keys = cells[:, 0] + self._shape[0] * (cells[:, 1] + self._shape[1] * cells[:, 2])
+        keys[outside] = -1
+        return keys
+
+    def match_points(self, points: np.ndarray, kinds: np.ndarray = None) -> np.ndarray:
+        """
+        :param points: The points to match.
+        :type points: numpy.ndarray with shape (P, 3)
+        :param kinds: The kind of atom to look for at each point. Defaults to the kinds of the atoms, ie. the points are
+            taken to be the positions the atoms are moved to.
+        :type kinds: numpy.ndarray of ints
+
+        :return: The index of the atom matched to each point, or -1 if there is none.
+        :rtype: numpy.ndarray of numpy.int64
+        """
+        kinds = self.kinds if kinds is None else kinds
+        matches = np.full(len(points), -1, dtype=np.int64)
+        if not len(self._cells):
+            return matches
+
+        # The atom is most likely in the same cell as the point, so that cell is searched first, and the other cells
+        # within the tolerance of the points only for the points which are still unmatched. Since the cells are twice as
+        # wide as the tolerance, these are the neighbours on the side of the nearer face along each axis. Choosing them
+        # from the cell of the point (rather than from the cells of the point ± the tolerance) cannot skip a cell when a
+        # point ± the tolerance lands on a face of a cell in floating point:
+        scaled = points / self._cell_size
+        cells = np.floor(scaled).astype(np.int64)
+        sides = np.where(scaled - cells < 0.5, -1, 1)
+        searches = [cells + sides * corner for corner in np.ndindex(2, 2, 2)]
+
+        for cells in searches:
+            unmatched = np.flatnonzero(matches == -1)
+            if not len(unmatched):
+                break
+            keys = self._keys(cells[unmatched])
+            index = np.minimum(np.searchsorted(self._cells, keys), len(self._cells) - 1)
+            occupied = (self._cells[index] == keys) & (keys != -1)
+            unmatched, starts, counts = unmatched[occupied], self._starts[index[occupied]], self._counts[index[occupied]]
+
+            # Each point is matched to the nearest atom of the right kind in the cell, in case several atoms are within
+            # the tolerance of it:
+            nearest = np.full(len(unmatched), self.tolerance ** 2)
+            for rank in range(self._occupancy):
+                left = counts > rank
+                points_left = unmatched[left]
+                atoms = self._order[starts[left] + rank]
+                distances = ((self.coordinates[atoms] - points[points_left]) ** 2).sum(axis=1)
+                closer = (distances <= nearest[left]) & (self.kinds[atoms] == kinds[points_left])
+                matches[points_left[closer]] = atoms[closer]
+                nearest[np.flatnonzero(left)[closer]] = distances[closer]
+
+        return matches
+
+    def permutation(self, matrix: np.ndarray):
+        """
+        :param matrix: The matrix of a symmetry operation, acting on column vectors.
+        :type matrix: numpy.ndarray with shape (3, 3)
+
+        :return: The index of the atom onto which the operation moves each atom, or None if the operation is not a
+            symmetry of the atoms.
+        :rtype: numpy.ndarray of numpy.int64
+        """
+        matches = self.match_points(self.coordinates @ matrix.T)
+        if (matches == -1).any() or np.bincount(matches, minlength=len(matches)).max(initial=0) > 1:
+            return None
+        return matches
+
+    def is_symmetry(self, matrix: np.ndarray) -> bool:
+        """
+        :param matrix: The matrix of an operation, acting on column vectors.
+        :type matrix: numpy.ndarray with shape (3, 3)
+
+        :return: True if the operation moves every atom onto an atom of the same kind.
+        :rtype: bool
+        """
+        return self.permutation(matrix) is not None
@@ -0,0 +1,249 @@
+"""
+The symmetry operations of the point groups, as 3x3 matrices acting on coordinates in the standard frame of the point
+group (see Program/Symmetry/perception.py), sorted into the classes of the columns of the character tables.
+
+The operations are generated from a few generators of each point group, split into conjugacy classes, and each class is
+matched to the column whose label (eg. '$2C_3(z)$' or "$3C''_2$") describes the same kind of operation. Where several
+classes hold the same kind of operation, the C'2 axes and σv planes are the ones containing the x axis, and the C''2
+axes and σd planes are the others; an axis or plane given in the label, eg. '$σ_v(xz)$', is used when present.
+"""
+
+import re
+
+import numpy as np
+
+from Program.Symmetry.geometry import IDENTITY, INVERSION, improper_rotation_matrix, reflection_matrix, \
+    rotation_matrix
+
+# Number of decimals to which the matrices are rounded when comparing them:
+MATRIX_DECIMALS = 6
+
+# The label of a class, eg. '2C6(z)', "3C''2", '2(S8)^3' or 'σh(xy)' (once the '$', '_', '{' and '}' are removed):
+_CLASS_LABEL = re.compile(r"^(?P<size>\d*)\(?(?P<kind>E|i|σ|C|S)(?P<primes>'*)(?P<order>\d*)\)?(?:\^(?P<power>\d+))?"
+                          r"(?P<plane>[hvd]?)(?:\((?P<axes>[xyz]{1,2})\))?$")
+_POINT_GROUP_NAME = re.compile(r'^(?P<family>[CDS])(?P<order>\d+)(?P<suffix>[hvd]?)$')
+
+_AXES = {'x': np.array([1.0, 0, 0]), 'y': np.array([0, 1.0, 0]), 'z': np.array([0, 0, 1.0])}
+
+
+class OperationError(ValueError):
+    pass
+
+
+def generators(name: str) -> list:
+    """
+    :param name: The Schoenflies symbol of a point group, eg. 'D3h'.
+    :type name: str
+
+    :return: Matrices of the operations which generate the point group, in its standard frame.
+    :rtype: list of numpy.ndarray with shape (3, 3)
+    """
+    z = _AXES['z']
+    cubic = {'T': [rotation_matrix(z, np.pi), rotation_matrix([1, 1, 1], 2 * np.pi / 3)],
+             'O': [rotation_matrix(z, np.pi / 2), rotation_matrix([1, 1, 1], 2 * np.pi / 3)]}
+    special = {'C1': [], 'Cs': [reflection_matrix(z)], 'Ci': [INVERSION],
+               'T': cubic['T'], 'Td': cubic['T'] + [reflection_matrix([1, -1, 0])], 'Th': cubic['T'] + [INVERSION],
+               'O': cubic['O'], 'Oh': cubic['O'] + [INVERSION]}
+    if name in special:
+        return special[name]
+
+    match = _POINT_GROUP_NAME.match(name)
+    if match is None:
+        raise OperationError(f'The operations of the {name} point group cannot be generated.')
+    family, n, suffix = match['family'], int(match['order']), match['suffix']
+
+    if family == 'S':
+        if suffix or n % 2:
+            raise OperationError(f'The operations of the {name} point group cannot be generated.')
+        return [improper_rotation_matrix(z, 2 * np.pi / n)]
+
+    operations = [rotation_matrix(z, 2 * np.pi / n)]
+    if family == 'D':
+        operations.append(rotation_matrix(_AXES['x'], np.pi))  # The C'2 axes include the x axis
+    if suffix == 'h':
+        operations.append(reflection_matrix(z))
+    elif suffix == 'v' and family == 'C':
+        operations.append(reflection_matrix(_AXES['y']))  # The σv planes include the xz plane
+    elif suffix == 'd' and family == 'D':
+        # The σd planes bisect the angles between the C'2 axes:
+        angle = np.pi / 2 + np.pi / (2 * n)
+        operations.append(reflection_matrix([np.cos(angle), np.sin(angle), 0]))
+    elif suffix:
+        raise OperationError(f'The operations of the {name} point group cannot be generated.')
+    return operations
+
+
+def generate_group(generators: list) -> np.ndarray:
+    """
+    :param generators: Matrices of the operations which generate a (finite) point group.
+    :type generators: list of numpy.ndarray with shape (3, 3)
+
+    :return: The matrices of all operations of the point group, starting with the identity.
+    :rtype: numpy.ndarray with shape (h, 3, 3)
+    """
+    operations = [IDENTITY]
+    keys = {_key(IDENTITY)}
+    for operation in operations:  # The list grows until it is closed under multiplication by the generators
+        for generator in generators:
+            product = generator @ operation
+            if _key(product) not in keys:
+                keys.add(_key(product))
+                operations.append(product)
+    return np.array(operations)
+
+
+def conjugacy_classes(operations: np.ndarray) -> list:
+    """
+    :param operations: The matrices of all operations of a point group.
+    :type operations: numpy.ndarray with shape (h, 3, 3)
+
+    :return: The indices of the operations in each conjugacy class, in the order in which the classes first appear.
+    :rtype: list of list of int
+    """
+    index = {_key(operation): i for i, operation in enumerate(operations)}
+    # For orthogonal matrices, the inverse is the transpose:
+    conjugates = np.einsum('aij,bjk,alk->bail', operations, operations, operations)
+
+    classes, assigned = [], set()
+    for i, conjugate in enumerate(conjugates):
+        if i not in assigned:
+            members = sorted({index[_key(matrix)] for matrix in conjugate})
+            assigned.update(members)
+            classes.append(members)
+    return classes
+
+
+def multiplication_table(operations: np.ndarray) -> np.ndarray:
+    """
+    :param operations: The matrices of all operations of a point group.
+    :type operations: numpy.ndarray with shape (h, 3, 3)
+
+    :return: The index of the product of each pair of operations, ie. element [a, b] is the index of the operation
+        which is the same as applying operation b and then operation a.
+    :rtype: numpy.ndarray of ints with shape (h, h)
+    """
+    index = {_key(operation): i for i, operation in enumerate(operations)}
+    products = np.einsum('aij,bjk->abik', operations, operations)
+    return np.array([[index[_key(product)] for product in row] for row in products])
+
+
+def class_operations(point_group) -> tuple:
+    """
+    Generates the operations of a point group, sorted into the classes of the columns of its character table.
+
+    :param point_group: The point group.
+    :type point_group: PointGroup
+
+    :return: The matrices of all operations, sorted by class in the order of the columns of the character table, and
+        the index of the class (column) of each operation.
+    :rtype: tuple of numpy.ndarray with shapes (h, 3, 3) and (h,)
+    """
+    operations = generate_group(generators(point_group._name))
+    classes = conjugacy_classes(operations)
+    if len(operations) != point_group._group_order or len(classes) != len(point_group._classes):
+        raise OperationError(f'The generated operations of {point_group._name} do not match its character table.')
+
+    # Describe each conjugacy class by its size and the kind of operation, which is the same for all its members:
+    kinds = [(len(members), _operation_kind(operations[members[0]])) for members in classes]
+
+    order, unassigned = [], list(range(len(classes)))
+    for label, size in zip(point_group._classes, point_group._class_orders):
+        parsed = _parse_label(label)
+        candidates = [i for i in unassigned if kinds[i] == (int(size), parsed['kind'])]
+        if not candidates:
+            raise OperationError(f'No operations of {point_group._name} match the class {label}.')
+        if len(candidates) > 1:
+            candidates = [i for i in candidates if _selected(operations[classes[i]], parsed)] or candidates
+        order.append(candidates[0])
+        unassigned.remove(candidates[0])
+
+    matrices = np.concatenate([operations[classes[i]] for i in order])
+    indices = np.repeat(np.arange(len(order)), [len(classes[i]) for i in order])
+    return matrices, indices
+
+
+def _key(matrix: np.ndarray) -> bytes:
+    """Hashable key of a matrix, the same for matrices which are equal to within MATRIX_DECIMALS."""
+    return (np.round(matrix, MATRIX_DECIMALS) + 0.0).tobytes()
+
+
+def _operation_kind(matrix: np.ndarray) -> tuple:
+    """
+    Describes an operation by its determinant (1 for rotations, -1 for improper rotations) and the cosine of its angle of
+    rotation, where an improper rotation is a rotation followed by a reflection through the plane perpendicular to its
+    axis (so that a reflection has an angle of 0, and the inversion an angle of π).
+    """
+    determinant = int(round(np.linalg.det(matrix)))
+    return determinant, round((np.trace(matrix) - determinant) / 2, 4) + 0.0
+
+
+def _parse_label(label: str) -> dict:
+    """
+    Reads the kind of operation from the label of a class, eg. '$2C_3(z)$'.
+
+    :return: The kind of operation (as given by _operation_kind), the number of primes, the type of the mirror plane
+        ('h', 'v' or 'd') and the axis or plane given in brackets.
+    :rtype: dict
+    """
+    # Only the first of several equivalent names is read, eg. '3C2' of '$3C_2=(C_4)^2$':
+    match = _CLASS_LABEL.match(re.sub(r'[$_{}\s]', '', str(label)).split('=')[0])
+    if match is None:
+        raise OperationError(f'The class {label} cannot be read.')
+
+    kind = match['kind']
+    if kind == 'E':
+        angle, determinant = 0.0, 1
+    elif kind == 'i':
+        angle, determinant = np.pi, -1
+    elif kind == 'σ':
+        angle, determinant = 0.0, -1
+    else:
+        angle = 2 * np.pi * int(match['power'] or 1) / int(match['order'])
+        determinant = 1 if kind == 'C' else -1
+
+    return {'kind': (determinant, round(np.cos(angle), 4) + 0.0), 'operation': kind, 'primes': len(match['primes']),
+            'plane': match['plane'], 'axes': match['axes']}
+
+
+def _selected(matrices: np.ndarray, label: dict) -> bool:
+    """
+    Checks whether a class of operations is the one described by a label, when several classes hold the same kind of
+    operation.
+    """
+    axes = np.array([_axis(matrix) for matrix in matrices])
+
+    if label['axes']:
+        if label['operation'] == 'σ':
+            # The plane is given, eg. 'xz', so its normal is along the remaining axis:
+            normal = _AXES[next(axis for axis in 'xyz' if axis not in label['axes'])]
+            return bool((np.abs(axes @ normal) > 1 - 1e-6).any())
+        return bool((np.abs(axes @ _AXES[label['axes'][0]]) > 1 - 1e-6).any())
+
+    x = _AXES['x']
+    if label['operation'] == 'σ':
+        if label['plane'] == 'h':
+            return bool((np.abs(axes @ _AXES['z']) > 1 - 1e-6).any())
+        contains_x = bool((np.abs(axes @ x) < 1e-6).any())
+        return contains_x == (label['plane'] == 'v')
+
+    # C'2 axes include the x axis, C''2 axes do not:
+    return bool((np.abs(axes @ x) > 1 - 1e-6).any()) == (label['primes'] < 2)
+
+
+def _axis(matrix: np.ndarray) -> np.ndarray:
+    """
+    :return: The axis of a rotation or an improper rotation (ie. the normal of a mirror plane), or zeros for the
+        identity and the inversion.
+    :rtype: numpy.ndarray with shape (3,)
+    """
+    rotation = matrix * round(np.linalg.det(matrix))
+    if np.allclose(rotation, IDENTITY):
+        return np.zeros(3)
+
+    # The axis is given by the antisymmetric part of the rotation, unless the angle is π, when the rotation is
+    # 2 a aᵀ - 1:
+    axis = np.array([rotation[2, 1] - rotation[1, 2], rotation[0, 2] - rotation[2, 0], rotation[1, 0] - rotation[0, 1]])
+    if np.linalg.norm(axis) < 1e-6:
+        projection = (rotation + IDENTITY) / 2
+        axis = projection[np.argmax(np.linalg.norm(projection, axis=0))]
+    return axis / np.linalg.norm(axis)
@@ -0,0 +1,405 @@
+"""
+Perception of the point group of a molecule from the coordinates of its atoms.
+
+The molecule is centred on its centre of mass, and the candidate axes of its symmetry elements are taken from its
+inertia tensor and, when its principal moments of inertia are degenerate, from its sets of equivalent atoms. Each
+operation is tested with an AtomMatcher, so that testing it costs O(N log N) in the number of atoms. The point group is
+then found using the usual flowchart of the Schoenflies point groups, together with the standard frame (the orientation
+of the x, y and z axes) in which its character table is given.
+"""
+
+import warnings
+
+import numpy as np
+
+from Program.Data.elements import MASSES
+from Program.Symmetry.geometry import INVERSION, AtomMatcher, improper_rotation_matrix, reflection_matrix, \
+    rotation_matrix
+from Program.Symmetry.symmetry import PointGroup, _shipped_point_group_names, get_point_group
+
+DEFAULT_TOLERANCE = 0.01  # Angstrom
+MAX_ORDER = 12  # The highest order of the rotation axes looked for
+
+# Largest relative difference between two principal moments of inertia for them to be treated as equal:
+DEGENERACY_TOLERANCE = 0.01
+# Directions closer than this angle (in radians) are treated as the same candidate axis:
+ANGLE_TOLERANCE = 1e-3
+# Largest set of equivalent atoms used to derive the candidate axes of spherical tops, whose number grows as its square.
+# Larger sets are replaced by the atoms nearest to one of them:
+MAX_SPHERICAL_CANDIDATES = 60
+
+_PERPENDICULAR = 0.05  # Largest cosine of the angle between two axes for them to be treated as perpendicular
+
+
+class Symmetry:
+    """
+    The point group of a molecule, together with the standard frame in which the symmetry operations are expressed.
+    """
+
+    __slots__ = ('name', 'centre', 'axes', 'tolerance')
+
+    def __init__(self, name: str, centre: np.ndarray, axes: np.ndarray, tolerance: float):
+        """
+        :param name: The Schoenflies symbol of the point group, eg. 'C2v'.
+        :type name: str
+        :param centre: The centre of mass of the molecule, which all symmetry elements pass through.
+        :type centre: numpy.ndarray with shape (3,)
+        :param axes: The x, y and z axes of the standard frame (as rows), in the coordinates of the molecule. They form a
+            right-handed orthonormal basis.
+        :type axes: numpy.ndarray with shape (3, 3)
+        :param tolerance: The tolerance with which the symmetry operations were tested.
+        :type tolerance: float
+        """
+        self.name = name
+        self.centre = centre
+        self.axes = axes
+        self.tolerance = tolerance
+
+    def __repr__(self):
+        return f'Symmetry({self.name!r})'
+
+    @property
+    def point_group(self) -> PointGroup:
+        """
+        :return: The point group, loaded from the character tables provided in the standard distribution, or None if its
+            character table is not provided.
+        :rtype: PointGroup
+        """
+        return _shipped_point_group(self.name)
+
+    def to_standard_frame(self, coordinates: np.ndarray) -> np.ndarray:
+        """
+        :param coordinates: Coordinates in the frame of the molecule, eg. the coordinates of its atoms.
+        :type coordinates: numpy.ndarray with shape (N, 3)
+
+        :return: The same coordinates in the standard frame, ie. relative to the centre of mass and the standard axes.
+        :rtype: numpy.ndarray with shape (N, 3)
+        """
+        return (np.asarray(coordinates, dtype=float) - self.centre) @ self.axes.T
+
+
+def perceive_symmetry(molecule, tolerance: float = DEFAULT_TOLERANCE) -> Symmetry:
+    """
+    Finds the point group of a molecule, and the standard frame of the point group.
+
+    :param molecule: The molecule.
+    :type molecule: MolParser
+    :param tolerance: The largest distance (in Angstrom) between an atom moved by a symmetry operation and the
+        equivalent atom.
+    :type tolerance: float
+
+    :return: The point group and its standard frame.
+    :rtype: Symmetry
+    """
+    return _Perception(molecule, tolerance).symmetry()
+
+
+def find_point_group(molecule, tolerance: float = DEFAULT_TOLERANCE) -> PointGroup:
+    """
+    Finds the point group of a molecule among the point groups provided in the standard distribution.
+
+    :param molecule: The molecule.
+    :type molecule: MolParser
+    :param tolerance: The largest distance (in Angstrom) between an atom moved by a symmetry operation and the
+        equivalent atom.
+    :type tolerance: float
+
+    :return: The shared PointGroup object, or None if the character table of the point group is not provided.
+    :rtype: PointGroup
+    """
+    return perceive_symmetry(molecule, tolerance).point_group
+
+
+def _shipped_point_group(name: str) -> PointGroup:
+    """
+    Loads a point group provided in the standard distribution, printing an error if it is not provided or if its csv
+    file does not hold its character table.
+    """
+    if name not in _shipped_point_group_names():
+        print(f'PointGroupError: The character table of the {name} point group is not provided in the standard '
+              f'distribution.')
+        return None
+
+    try:
+        point_group = get_point_group(name)
+    except (KeyError, ValueError) as error:  # The csv file cannot be read
+        print(f'PointGroupError: The character table of the {name} point group provided in the standard distribution '
+              f'could not be read: {error}')
+        return None
+
+    if point_group._name != name:
+        problem = f'holds the character table of {point_group._name} instead'
+    elif not len(point_group._classes):
+        problem = 'holds no characters'
+    else:
+        return point_group
+    print(f'PointGroupError: The csv file of the {name} point group provided in the standard distribution {problem}, '
+          'so it has to be corrected.')
+    return None
+
+
+class _Perception:
+    """
+    The state shared by the steps of perceiving the point group of one molecule.
+    """
+
+    def __init__(self, molecule, tolerance: float):
+        self.tolerance = tolerance
+
+        # Atoms are only equivalent to atoms with the same symbol:
+        kinds = np.unique(molecule.symbols, return_inverse=True)[1] if molecule.natoms else np.zeros(0, dtype=int)
+
+        # Centre the molecule on its centre of mass (or on its centroid if none of its atoms are elements):
+        masses = MASSES[molecule.atomic_numbers]
+        if not masses.sum():
+            masses = np.ones(len(masses))
+        coordinates = np.asarray(molecule.coordinates, dtype=float)
+        self.centre = masses @ coordinates / masses.sum() if len(masses) else np.zeros(3)
+        self.coordinates = coordinates - self.centre
+        self.matcher = AtomMatcher(self.coordinates, kinds, tolerance)
+
+        # The principal axes (as rows), in order of increasing moment of inertia:
+        inertia = (masses * (self.coordinates ** 2).sum(axis=1)).sum() * np.eye(3)
+        inertia -= (self.coordinates.T * masses) @ self.coordinates
+        self.moments, axes = np.linalg.eigh(inertia)
+        self.principal_axes = axes.T
+
+        # Sort the atoms into groups of atoms with the same symbol and the same distance from the centre, which all
+        # symmetry operations can only swap among themselves:
+        distances = np.linalg.norm(self.coordinates, axis=1)
+        order = np.lexsort((distances, kinds))
+        new_group = (np.diff(kinds[order]) != 0) | (np.diff(distances[order]) > tolerance)
+        self.groups = np.empty(len(order), dtype=np.int64)
+        self.groups[order] = np.concatenate(([0], np.cumsum(new_group)))[:len(order)]
+
+        # The smallest group away from the centre is matched first, to quickly reject operations which are not
+        # symmetries:
+        sizes = np.bincount(self.groups[distances > tolerance], minlength=len(new_group) + 1)
+        sizes[sizes == 0] = len(order) + 1
+        self.probe = np.flatnonzero(self.groups == np.argmin(sizes)) if len(order) else np.zeros(0, dtype=int)
+        self.probe_matcher = AtomMatcher(self.coordinates[self.probe], kinds[self.probe], tolerance)
+        self.subsampled = False  # Whether the candidate axes of a spherical top were derived from only some atoms
+
+    def is_symmetry(self, matrix: np.ndarray) -> bool:
+        """Checks whether an operation moves every atom onto an equivalent atom."""
+        return self.probe_matcher.is_symmetry(matrix) and self.matcher.is_symmetry(matrix)
+
+    def symmetry(self) -> Symmetry:
+        """Runs the flowchart of the point groups."""
+        if (np.linalg.norm(self.coordinates, axis=1) <= self.tolerance).all():
+            return self._result('Kh', self.principal_axes[2], self.principal_axes[0])  # A single atom
+
+        # All atoms lie on the axis with the smallest moment of inertia:
+        axis = self.principal_axes[0]
+        if (self._distances_from_axis(axis) <= self.tolerance).all():
+            return self._result('D∞h' if self.is_symmetry(INVERSION) else 'C∞v', axis)
+
+        candidates = self._candidate_axes()
+        axes = [(axis, order) for axis, order in zip(candidates, map(self._order, candidates)) if order > 1]
+
+        if sum(order >= 3 for _, order in axes) >= 2:
+            cubic = self._cubic(axes)
+            if cubic is not None:
+                return cubic
+        elif self.subsampled:
+            warnings.warn('The point group of the molecule may be too low: it is a spherical top, but its axes were '
+                          f'looked for using only {MAX_SPHERICAL_CANDIDATES} of its {len(self.probe)} equivalent atoms, '
+                          'and no cubic or icosahedral axes were found.')
+        if not axes:
+            return self._low_symmetry(candidates)
+
+        # The principal axis is the axis of the highest order, and of the axes of the same order (eg. in D2), the one
+        # passing through the most atoms:
+        highest = max(order for _, order in axes)
+        z = max((axis for axis, order in axes if order == highest), key=self._atoms_on_axis)
+        n = highest
+
+        perpendicular = self._perpendicular_candidates(z)
+        twofold = [axis for axis in perpendicular if self.is_symmetry(rotation_matrix(axis, np.pi))]
+        horizontal_mirror = self.is_symmetry(reflection_matrix(z))
+
+        if twofold:
+            x = max(twofold, key=self._atoms_on_axis)  # The C2' axis passes through the most atoms
+            if horizontal_mirror:
+                return self._result(f'D{n}h', z, x)
+            elif self._vertical_mirrors(perpendicular):
+                return self._result(f'D{n}d', z, x)
+            return self._result(f'D{n}', z, x)
+
+        if horizontal_mirror:
+            return self._result(f'C{n}h', z)
+
+        mirrors = self._vertical_mirrors(perpendicular)
+        if mirrors:
+            if n == 2:
+                # The molecular plane (the mirror plane containing the most atoms) is the yz plane:
+                normal = max(mirrors, key=self._atoms_in_plane)
+                return self._result('C2v', z, normal)
+            # The x axis lies in a σv plane:
+            return self._result(f'C{n}v', z, np.cross(mirrors[0], z))
+
+        if self.is_symmetry(improper_rotation_matrix(z, np.pi / n)):
+            return self._result(f'S{2 * n}', z)
+        return self._result(f'C{n}', z)
+
+    def _cubic(self, axes: list) -> Symmetry:
+        """
+        Distinguishes the point groups with several axes of order 3 or higher. Returns None if the axes which make up
+        the frame of a cubic or icosahedral point group are not all symmetries to within the tolerance (as can happen
+        for noisy geometries), so that the molecule is given the point group of the axes which are.
+        """
+        # Not all 2-fold axes and mirror planes are among the candidates, but they all lie along the sums, differences
+        # or cross products of the axes which were found:
+        found = np.array([axis for axis, _ in axes])
+        sums, differences = found[:, None] + found[None], found[:, None] - found[None]
+        crosses = np.cross(found[:, None], found[None])
+        extra = _unique_directions(np.concatenate((found, sums.reshape(-1, 3), differences.reshape(-1, 3),
+                                                   crosses.reshape(-1, 3))), self.tolerance)
+        axes = [(axis, order) for axis, order in zip(extra, map(self._order, extra)) if order > 1]
+        highest = max((order for _, order in axes), default=1)
+        inversion = self.is_symmetry(INVERSION)
+
+        if highest % 5 == 0:
+            z = next(axis for axis, order in axes if order % 5 == 0)
+            x = next((axis for axis, order in axes if order == 2 and abs(axis @ z) < _PERPENDICULAR), None)
+            return None if x is None else self._result('Ih' if inversion else 'I', z, x)
+
+        # The x, y and z axes are the 4-fold axes of O and Oh, and the 2-fold axes of T, Td and Th:
+        order = 4 if highest % 4 == 0 else 2
+        z = next((axis for axis, n in axes if n == order), None)
+        x = None if z is None else next((axis for axis, n in axes if n == order and abs(axis @ z) < _PERPENDICULAR),
+                                        None)
+        if x is None:
+            return None
+        if order == 4:
+            return self._result('Oh' if inversion else 'O', z, x)
+        elif inversion:
+            return self._result('Th', z, x)
+        elif any(self.is_symmetry(reflection_matrix(normal)) for normal in extra):
+            return self._result('Td', z, x)
+        return self._result('T', z, x)
+
+    def _low_symmetry(self, candidates: np.ndarray) -> Symmetry:
+        """Distinguishes the point groups without any rotation axes."""
+        for normal in candidates:
+            if self.is_symmetry(reflection_matrix(normal)):
+                return self._result('Cs', normal)  # The mirror plane is the xy plane
+        if self.is_symmetry(INVERSION):
+            return self._result('Ci', self.principal_axes[2], self.principal_axes[0])
+        return self._result('C1', self.principal_axes[2], self.principal_axes[0])
+
+    def _result(self, name: str, z: np.ndarray, x: np.ndarray = None) -> Symmetry:
+        """Creates the result, completing the z axis and (part of) the x axis to a right-handed orthonormal frame."""
+        z = z / np.linalg.norm(z)
+        if x is None:
+            # Any principal axis which is not parallel to the z axis:
+            x = self.principal_axes[np.argmin(np.abs(self.principal_axes @ z))]
+        x = x - (x @ z) * z
+        x /= np.linalg.norm(x)
+        return Symmetry(name, self.centre, np.array([x, np.cross(z, x), z]), self.tolerance)
+
+    def _order(self, axis: np.ndarray) -> int:
+        """Finds the highest order of the rotations about an axis which are symmetries of the molecule."""
+        # Each group of equivalent atoms is split into rings of n atoms around the axis at the same height along it
+        # (apart from the atoms lying on it), so n has to divide the number of atoms at each height in every group:
+        off_axis = self._distances_from_axis(axis) > self.tolerance
+        groups, heights = self.groups[off_axis], self.coordinates[off_axis] @ axis
+        order = np.lexsort((heights, groups))
+        new_ring = (np.diff(groups[order]) != 0) | (np.diff(heights[order]) > self.tolerance)
+        divisor = int(np.gcd.reduce(np.diff(np.flatnonzero(np.concatenate(([True], new_ring, [True]))))))
+        for order in range(min(divisor, MAX_ORDER), 1, -1):
+            if divisor % order == 0 and self.is_symmetry(rotation_matrix(axis, 2 * np.pi / order)):
+                return order
+        return 1
+
+    def _distances_from_axis(self, axis: np.ndarray) -> np.ndarray:
+        return np.linalg.norm(np.cross(self.coordinates, axis), axis=1)
+
+    def _atoms_on_axis(self, axis: np.ndarray) -> int:
+        return int((self._distances_from_axis(axis) <= self.tolerance).sum())
+
+    def _atoms_in_plane(self, normal: np.ndarray) -> int:
+        return int((np.abs(self.coordinates @ normal) <= self.tolerance).sum())
+
+    def _vertical_mirrors(self, normals: np.ndarray) -> list:
+        return [normal for normal in normals if self.is_symmetry(reflection_matrix(normal))]
+
+    def _candidate_axes(self) -> np.ndarray:
+        """
+        Finds the directions along which the rotation axes and the normals of the mirror planes can lie.
+
+        If the principal moments of inertia are all different, these are the principal axes. If two are equal (a
+        symmetric top), the rotation axis of the highest order lies along the third, and the others are perpendicular to
+        it. If all three are equal (a spherical top), the principal axes are arbitrary and all candidates are derived
+        from the positions of the equivalent atoms.
+        """
+        degenerate = np.abs(np.diff(self.moments)) <= DEGENERACY_TOLERANCE * max(self.moments[-1], np.finfo(float).tiny)
+        if degenerate.all():
+            extra = self._spherical_candidates()
+        elif degenerate.any():
+            extra = self._perpendicular_candidates(self.principal_axes[2 if degenerate[0] else 0])
+        else:
+            extra = np.zeros((0, 3))
+        return _unique_directions(np.concatenate((self.principal_axes, extra)))
+
+    def _perpendicular_candidates(self, z: np.ndarray) -> np.ndarray:
+        """
+        Finds the directions perpendicular to the principal axis along which the 2-fold axes and the normals of the
+        vertical mirror planes can lie.
+
+        An operation which moves an atom a onto an atom b has its 2-fold axis along a + b (or along a, or perpendicular
+        to a), and its mirror plane normal to a - b (or containing a), so it is enough to take a from the smallest group
+        of equivalent atoms and b from the same group.
+        """
+        off_axis = self._distances_from_axis(z) > self.tolerance
+        sizes = np.bincount(self.groups[off_axis], minlength=self.groups.max(initial=0) + 1)
+        sizes[sizes == 0] = len(self.groups) + 1
+        group = self.coordinates[off_axis & (self.groups == np.argmin(sizes))]
+
+        a = group[0]
+        vectors = np.concatenate(([a, np.cross(z, a)], a + group, a - group, self.principal_axes))
+        vectors -= np.outer(vectors @ z, z)
+        return _unique_directions(vectors, self.tolerance)
+
+    def _spherical_candidates(self) -> np.ndarray:
+        """
+        Finds the candidate axes of a spherical top from the smallest group of equivalent atoms: an axis of order 3 or
+        higher is normal to the plane of any atom a, and the atoms b and c onto which it moves a and b, so that the
+        triangle abc has two equal sides.
+
+        The number of candidates grows as the square of the number of atoms, so for large groups only the atoms nearest
+        to a are used. The axis nearest to a moves it onto one of them, unless the group is very large.
+        """
+        group = self.coordinates[self.probe]
+        if len(group) > MAX_SPHERICAL_CANDIDATES:
+            nearest = np.argsort(np.linalg.norm(group - group[0], axis=1), kind='stable')
+            group = group[nearest[:MAX_SPHERICAL_CANDIDATES]]
+            self.subsampled = True
+
+        a = group[0]
+        sides = np.linalg.norm(group[:, None] - group[None], axis=2)
+        b, c = np.nonzero(np.abs(sides - sides[0][:, None]) <= 2 * self.tolerance)
+        normals = np.cross(group[b] - a, group[c] - a)
+        return _unique_directions(np.concatenate((group, a + group, a - group, np.cross(a, group), normals)),
+                                  self.tolerance)
+
+
+def _unique_directions(vectors: np.ndarray, shortest: float = 0.0) -> np.ndarray:
+    """
+    :param vectors: Directions, which do not have to be normalised.
+    :type vectors: numpy.ndarray with shape (K, 3)
+    :param shortest: Vectors which are not longer than this are dropped.
+    :type shortest: float
+
+    :return: The unit vectors of the different directions, in the order in which they first appear. Opposite vectors
+        give the same direction.
+    :rtype: numpy.ndarray with shape (M, 3)
+    """
+    lengths = np.linalg.norm(vectors, axis=1)
+    vectors = vectors[lengths > max(shortest, 1e-8)] / lengths[lengths > max(shortest, 1e-8), None]
+
+    same = np.abs(vectors @ vectors.T) >= np.cos(ANGLE_TOLERANCE)
+    # A direction is kept if it is not the same as any earlier direction which is kept; since the same directions are
+    # (within the tolerance) clustered, it is enough to compare it with all earlier directions:
+    keep = ~np.tril(same, -1).any(axis=1)
+    return vectors[keep]
@@ -0,0 +1,244 @@
+"""
+Reducible representations of molecules, computed from the coordinates of their atoms instead of being typed by hand.
+
+The molecule is oriented in the standard frame of its point group (see Program/Symmetry/perception.py), all operations
+are applied to all of its atoms at once, and the atoms onto which each atom is moved are found with an AtomMatcher. The
+resulting permutation table is cached on the molecule, so it is only computed once for all representations, SALCs and
+sets of equivalent atoms. The characters of the representations then follow from the atoms (or bonds) which are not
+moved:
+
+- Γ_3N, of the 3N displacements of the atoms: the number of unmoved atoms times the trace of the operation matrix;
+- Γ_vib, of the vibrations: Γ_3N without the translations (Γ_xyz, the traces) and the rotations (the determinants times
+  the traces);
+- Γ_bonds, of a set of bonds, eg. for their stretching vibrations: the number of unmoved bonds.
+
+All representations are given as arrays of characters, in the order of the columns of the character table, so they can
+be passed directly to PointGroup.reduction.
+"""
+
+import numpy as np
+
+from Program.Symmetry.geometry import AtomMatcher
+from Program.Symmetry.perception import DEFAULT_TOLERANCE, perceive_symmetry
+from Program.Symmetry.symmetry import PointGroup
+
+
+def unmoved_atoms(molecule, point_group: PointGroup = None, tolerance: float = DEFAULT_TOLERANCE) -> np.ndarray:
+    """
+    :param molecule: The molecule.
+    :type molecule: MolParser
+    :param point_group: The point group of the molecule. Defaults to the point group found from its geometry.
+    :type point_group: PointGroup
+    :param tolerance: The largest distance (in Angstrom) between an atom moved by a symmetry operation and the
+        equivalent atom.
+    :type tolerance: float
+
+    :return: The number of atoms which are not moved by the operations of each class, or None if the molecule does not
+        belong to the point group.
+    :rtype: numpy.ndarray of ints
+    """
+    permutations = _class_permutations(molecule, point_group, tolerance)
+    if permutations is not None:
+        return _unmoved(permutations[1])
+
+
+def cartesian_representation(molecule, point_group: PointGroup = None,
+                             tolerance: float = DEFAULT_TOLERANCE) -> np.ndarray:
+    """
+    :param molecule: The molecule.
+    :type molecule: MolParser
+    :param point_group: The point group of the molecule. Defaults to the point group found from its geometry.
+    :type point_group: PointGroup
+    :param tolerance: The largest distance (in Angstrom) between an atom moved by a symmetry operation and the
+        equivalent atom.
+    :type tolerance: float
+
+    :return: The characters of Γ_3N, the representation of the displacements of all atoms, or None if the molecule does
+        not belong to the point group.
+    :rtype: numpy.ndarray of ints (or floats if the point group has irrational characters)
+    """
+    permutations = _class_permutations(molecule, point_group, tolerance)
+    if permutations is not None:
+        matrices, permutations = permutations
+        return _unmoved(permutations) * _traces(matrices)
+
+
+def vibrational_representation(molecule, point_group: PointGroup = None,
+                               tolerance: float = DEFAULT_TOLERANCE) -> np.ndarray:
+    """
+    :param molecule: The molecule, which must not be linear.
+    :type molecule: MolParser
+    :param point_group: The point group of the molecule. Defaults to the point group found from its geometry.
+    :type point_group: PointGroup
+    :param tolerance: The largest distance (in Angstrom) between an atom moved by a symmetry operation and the
+        equivalent atom.
+    :type tolerance: float
+
+    :return: The characters of Γ_vib, the representation of the vibrations, ie. Γ_3N without the translations and
+        rotations, or None if the molecule does not belong to the point group.
+    :rtype: numpy.ndarray of ints (or floats if the point group has irrational characters)
+    """
+    permutations = _class_permutations(molecule, point_group, tolerance)
+    if permutations is not None:
+        matrices, permutations = permutations
+        traces = _traces(matrices)
+        return _unmoved(permutations) * traces - traces - np.rint(np.linalg.det(matrices)).astype(int) * traces
+
+
+def bond_representation(molecule, point_group: PointGroup = None, bonds=None,
+                        tolerance: float = DEFAULT_TOLERANCE) -> np.ndarray:
+    """
+    :param molecule: The molecule.
+    :type molecule: MolParser
+    :param point_group: The point group of the molecule. Defaults to the point group found from its geometry.
+    :type point_group: PointGroup
+    :param bonds: The bonds to include, as the indices (starting from 0) of rows of the bonds of the molecule, or as a
+        boolean mask of them, eg. molecule.bonds.index == 'C-H'. The set of bonds should be closed under the symmetry
+        operations. Defaults to all bonds.
+    :type bonds: array-like of ints or bools
+    :param tolerance: The largest distance (in Angstrom) between an atom moved by a symmetry operation and the
+        equivalent atom.
+    :type tolerance: float
+
+    :return: The characters of Γ_bonds, the representation of the bonds, or None if the molecule does not belong to the
+        point group.
+    :rtype: numpy.ndarray of ints
+    """
+    permutations = _class_permutations(molecule, point_group, tolerance)
+    if permutations is None:
+        return None
+
+    bond_atoms = molecule.bond_atoms if bonds is None else molecule.bond_atoms[np.asarray(bonds)]
+    first, second = permutations[1][:, bond_atoms[:, 0]], permutations[1][:, bond_atoms[:, 1]]
+
+    # A bond is not moved if both of its atoms are not moved, or if its two atoms are swapped:
+    unmoved = ((first == bond_atoms[:, 0]) & (second == bond_atoms[:, 1])) | \
+              ((first == bond_atoms[:, 1]) & (second == bond_atoms[:, 0]))
+    return unmoved.sum(axis=1)
+
+
+def permutation_table(molecule, point_group: PointGroup = None, tolerance: float = DEFAULT_TOLERANCE) -> np.ndarray:
+    """
+    Applies all operations of the point group to all atoms of the molecule at once. The table is cached on the
+    molecule, and computed again only if its atoms have been changed since.
+
+    :param molecule: The molecule.
+    :type molecule: MolParser
+    :param point_group: The point group of the molecule. Defaults to the point group found from its geometry.
+    :type point_group: PointGroup
+    :param tolerance: The largest distance (in Angstrom) between an atom moved by a symmetry operation and the
+        equivalent atom.
+    :type tolerance: float
+
+    :return: The index of the atom onto which each operation (rows, in the order of PointGroup.operations) moves each
+        atom (columns), or None if the molecule does not belong to the point group. The table is shared, and so is
+        read-only.
+    :rtype: numpy.ndarray of numpy.int32 with shape (h, N)
+    """
+    permutations = _permutation_table(molecule, point_group, tolerance)
+    if permutations is not None:
+        return permutations[1]
+
+
+def equivalent_atoms(molecule, point_group: PointGroup = None, tolerance: float = DEFAULT_TOLERANCE) -> np.ndarray:
+    """
+    :param molecule: The molecule.
+    :type molecule: MolParser
+    :param point_group: The point group of the molecule. Defaults to the point group found from its geometry.
+    :type point_group: PointGroup
+    :param tolerance: The largest distance (in Angstrom) between an atom moved by a symmetry operation and the
+        equivalent atom.
+    :type tolerance: float
+
+    :return: For each atom, the index of the first atom which is symmetry-equivalent to it (ie. onto which it is moved
+        by some operation), so that equivalent atoms have the same label; or None if the molecule does not belong to
+        the point group.
+    :rtype: numpy.ndarray of numpy.int32
+    """
+    table = permutation_table(molecule, point_group, tolerance)
+    if table is not None:
+        return table.min(axis=0)
+
+
+def standard_frame(molecule, tolerance: float = DEFAULT_TOLERANCE):
+    """
+    Finds the point group of the molecule and its standard frame, like perceive_symmetry, but caches the result on the
+    molecule (until its atoms are changed).
+
+    :param molecule: The molecule.
+    :type molecule: MolParser
+    :param tolerance: The largest distance (in Angstrom) between an atom moved by a symmetry operation and the
+        equivalent atom.
+    :type tolerance: float
+
+    :return: The point group and its standard frame.
+    :rtype: Symmetry
+    """
+    cache = molecule._derived_results()
+    if ('symmetry', tolerance) not in cache:
+        cache['symmetry', tolerance] = perceive_symmetry(molecule, tolerance)
+    return cache['symmetry', tolerance]
+
+
+def _permutation_table(molecule, point_group: PointGroup, tolerance: float):
+    """
+    :return: The point group, and its permutation table, or None if the molecule does not belong to the point group,
+        including when some operation does not move its atoms onto a permutation of them.
+    :rtype: tuple of PointGroup and numpy.ndarray of numpy.int32 with shape (h, N)
+    """
+    cache = molecule._derived_results()
+    symmetry = standard_frame(molecule, tolerance)
+    if point_group is None:
+        point_group = symmetry.point_group
+        if point_group is None:
+            return None
+    elif point_group._name != symmetry.name:
+        print(f'PointGroupError: The molecule belongs to the {symmetry.name} point group, not to {point_group._name}.')
+        return None
+
+    key = ('permutation_table', point_group._name, tolerance)
+    if key not in cache:
+        # Move all atoms by all operations in one go, and match all the moved atoms to the atoms in one go:
+        coordinates = symmetry.to_standard_frame(molecule.coordinates)
+        moved = np.einsum('hij,nj->hni', point_group.operations, coordinates).reshape(-1, 3)
+        kinds = np.unique(molecule.symbols, return_inverse=True)[1]
+        matcher = AtomMatcher(coordinates, kinds, tolerance)
+        table = matcher.match_points(moved, np.tile(kinds, len(point_group.operations)))
+        table = table.reshape(len(point_group.operations), -1).astype(np.int32)
+
+        # Each operation must move the atoms onto all the atoms, ie. each row must be a permutation:
+        if (np.sort(table, axis=1) == np.arange(molecule.natoms)).all():
+            table.setflags(write=False)
+            cache[key] = table
+        else:
+            cache[key] = None
+    if cache[key] is None:
+        print(f'PointGroupError: The operations of the {point_group._name} point group do not move the atoms of the '
+              'molecule onto each other.')
+        return None
+    return point_group, cache[key]
+
+
+def _class_permutations(molecule, point_group: PointGroup, tolerance: float):
+    """
+    :return: The matrix of the (first) operation of each class, and the index of the atom onto which it moves each atom,
+        or None if the molecule does not belong to the point group.
+    :rtype: tuple of numpy.ndarray with shapes (n_classes, 3, 3) and (n_classes, N)
+    """
+    permutations = _permutation_table(molecule, point_group, tolerance)
+    if permutations is not None:
+        point_group, table = permutations
+        first = np.searchsorted(point_group.operation_classes, np.arange(len(point_group._classes)))
+        return point_group.operations[first], table[first]
+
+
+def _unmoved(permutations: np.ndarray) -> np.ndarray:
+    return (permutations == np.arange(permutations.shape[1])).sum(axis=1)
+
+
+def _traces(matrices: np.ndarray) -> np.ndarray:
+    """The traces of the matrices, as ints unless some are irrational (eg. for C8 or S12)."""
+    traces = np.einsum('kii->k', matrices)
+    if np.allclose(traces, np.rint(traces)):
+        return np.rint(traces).astype(int)
+    return traces
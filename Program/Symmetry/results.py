@@ -0,0 +1,89 @@
+"""
+Lightweight results returned by the PointGroup methods which decompose representations into irreducible ones.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+class Decomposition:
+    """
+    The decomposition of a representation into the irreducible representations of a point group, eg. 2A1 + 2B1.
+
+    Only the numbers are stored, so creating a Decomposition involves no string building or I/O; its text is only
+    formatted when it is rendered, eg. by str or PointGroup.print_result. Since the text is then cached, the label is
+    read-only.
+
+    Two decompositions are equal (and have the same hash) if they have the same irreducible representations with the
+    same multiplicities, whatever their labels.
+    """
+
+    __slots__ = ('multiplicities', 'irreps', '_label', '_text')
+
+    def __init__(self, multiplicities: np.ndarray, irreps: tuple, label: str = 'result'):
+        """
+        :param multiplicities: The number of times each irreducible representation appears in the representation.
+        :type multiplicities: numpy.ndarray of ints
+        :param irreps: The names of the irreducible representations, in the same order as the multiplicities.
+        :type irreps: tuple of str
+        :param label: A description of the decomposed representation, shown as the left hand side of the result.
+            eg. result; A1 × B2
+        :type label: str
+        """
+        # A read-only copy, so that the hash cannot change if the array passed in is changed later:
+        self.multiplicities = np.array(multiplicities)
+        self.multiplicities.setflags(write=False)
+        self.irreps = irreps
+        self._label = label
+        self._text = None
+
+    def __repr__(self):
+        return f'Decomposition({self.label!r}: {dict(self.items())})'
+
+    def __str__(self):
+        """Shows the result as a sum of the irreducible representations, eg. 'result = 2A1  +  2B1'."""
+        if self._text is None:
+            terms = [f'{count if count != 1 else ""}{irrep}' for irrep, count in self.items()]
+            self._text = f'{self.label} = {"  +  ".join(terms)}'
+        return self._text
+
+    def __eq__(self, other):
+        if not isinstance(other, Decomposition):
+            return NotImplemented
+        return self.irreps == other.irreps and np.array_equal(self.multiplicities, other.multiplicities)
+
+    def __hash__(self):
+        # The same for equal multiplicities of different dtypes:
+        return hash((self.irreps, tuple(self.multiplicities.tolist())))
+
+    @property
+    def label(self) -> str:
+        """
+        :return: The description of the decomposed representation, shown as the left hand side of the result.
+        :rtype: str
+        """
+        return self._label
+
+    def items(self):
+        """
+        :return: The name and multiplicity of each irreducible representation that appears in the representation.
+        :rtype: iterator of tuple
+        """
+        return ((self.irreps[index], self.multiplicities[index]) for index in np.flatnonzero(self.multiplicities))
+
+    @property
+    def irreducible(self):
+        """
+        :return: The name of the irreducible representation if the representation is irreducible, otherwise None.
+        :rtype: str
+        """
+        if self.multiplicities.sum() == 1:
+            return self.irreps[self.multiplicities.argmax()]
+
+    def to_series(self) -> pd.Series:
+        """
+        :return: The multiplicities indexed by the names of the irreducible representations, as the 'number of
+            appearances' column of PointGroup.reduction.
+        :rtype: pandas.Series
+        """
+        return pd.Series(self.multiplicities, index=list(self.irreps), name='number of appearances')
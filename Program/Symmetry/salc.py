@@ -0,0 +1,127 @@
+"""
+Basis functions centred on the atoms of a molecule, which PointGroup.project turns into symmetry-adapted linear
+combinations (SALCs).
+
+An operation moves a function centred on an atom onto the equivalent function centred on the atom given by the
+permutation table (see Program/Symmetry/representations.py), mixed by the operation matrix for p functions. Functions are
+only mixed with functions on symmetry-equivalent atoms, so the projections are done separately for each set of
+equivalent atoms (orbit), whose size is at most the order of the point group.
+"""
+
+import numpy as np
+
+from Program.Symmetry.perception import DEFAULT_TOLERANCE
+from Program.Symmetry.representations import permutation_table
+
+# Names of the functions centred on each atom, for each kind of basis. The p functions (which also describe the
+# displacements of the atoms) point along the x, y and z axes of the standard frame of the point group.
+FUNCTIONS = {'s': ('s',), 'p': ('px', 'py', 'pz')}
+
+
+class BasisError(ValueError):
+    pass
+
+
+class AtomicBasis:
+    """
+    A set of basis functions of the same kind centred on some (or all) of the atoms of a molecule.
+    """
+
+    __slots__ = ('molecule', 'kind', 'atoms', 'tolerance')
+
+    def __init__(self, molecule, kind: str = 's', atoms=None, tolerance: float = DEFAULT_TOLERANCE):
+        """
+        :param molecule: The molecule.
+        :type molecule: MolParser
+        :param kind: The kind of functions centred on each atom, 's' or 'p'.
+        :type kind: str
+        :param atoms: The atoms on which the functions are centred, as indices (starting from 0) or as a boolean mask,
+            eg. molecule.symbols == 'H'. The set of atoms must be closed under the symmetry operations. Defaults to all
+            atoms.
+        :type atoms: array-like of ints or bools
+        :param tolerance: The largest distance (in Angstrom) between an atom moved by a symmetry operation and the
+            equivalent atom.
+        :type tolerance: float
+        """
+        if kind not in FUNCTIONS:
+            raise BasisError(f'The kind of basis functions must be one of {tuple(FUNCTIONS)}, not {kind!r}.')
+
+        self.molecule = molecule
+        self.kind = kind
+        atoms = np.arange(molecule.natoms) if atoms is None else np.asarray(atoms)
+        self.atoms = np.flatnonzero(atoms) if atoms.dtype == bool else atoms.astype(np.int64)
+        self.tolerance = tolerance
+
+    def __repr__(self):
+        return f'AtomicBasis({self.kind!r}, {len(self.atoms)} atoms, {self.size} functions)'
+
+    def __len__(self):
+        return self.size
+
+    @property
+    def size(self) -> int:
+        """
+        :return: The number of basis functions.
+        :rtype: int
+        """
+        return len(self.atoms) * len(FUNCTIONS[self.kind])
+
+    @property
+    def labels(self) -> list:
+        """
+        :return: The name of each basis function, eg. 'H2 s' for the s function on the second atom, in the order of the
+            columns of the SALC coefficients.
+        :rtype: list of str
+        """
+        symbols = self.molecule.symbols
+        return [f'{symbols[atom]}{atom + 1} {function}' for atom in self.atoms for function in FUNCTIONS[self.kind]]
+
+    def blocks(self, point_group):
+        """
+        Describes how the operations of the point group move the basis functions, separately for each set of
+        symmetry-equivalent atoms.
+
+        :param point_group: The point group of the molecule.
+        :type point_group: PointGroup
+
+        :return: Generator of, for each set of k equivalent atoms with m functions each: the indices of their basis
+            functions; for each operation and each of these functions, the (local) indices of the m functions it is
+            moved onto; and the coefficients of these functions.
+        :rtype: generator of tuple of numpy.ndarray with shapes (k * m,), (h, k * m, m) and (h, k * m, m)
+
+        :raises BasisError: If the molecule does not belong to the point group, or the atoms are not closed under its
+            operations.
+        """
+        table = permutation_table(self.molecule, point_group, self.tolerance)
+        if table is None:
+            raise BasisError(f'The molecule does not belong to the {point_group._name} point group.')
+
+        # The position of each atom of the basis in the basis, -1 for the other atoms:
+        position = np.full(self.molecule.natoms, -1, dtype=np.int64)
+        position[self.atoms] = np.arange(len(self.atoms))
+        table = position[table[:, self.atoms]]
+        if (table == -1).any():
+            raise BasisError('The atoms of the basis are not closed under the symmetry operations of the '
+                             f'{point_group._name} point group.')
+
+        # Each operation moves the j-th function of an atom onto the i-th function of the atom it is moved to, with the
+        # coefficient given by element [i, j] of its matrix (which is 1 for s functions):
+        n_functions = len(FUNCTIONS[self.kind])
+        matrices = point_group.operations if self.kind == 'p' else np.ones((len(table), 1, 1))
+        functions = np.arange(n_functions)
+
+        # Equivalent atoms are labelled by the first atom of the basis they can be moved onto:
+        orbits = table.min(axis=0)
+        for orbit in np.unique(orbits):
+            atoms = np.flatnonzero(orbits == orbit)
+            local = np.full(len(self.atoms), -1, dtype=np.int64)
+            local[atoms] = np.arange(len(atoms))
+
+            # Element [g, a, j, i] is the coefficient of function i of the atom g moves a to, in g applied to function j
+            # of atom a:
+            targets = local[table[:, atoms]][:, :, None, None] * n_functions + functions
+            targets = np.broadcast_to(targets, (len(table), len(atoms), n_functions, n_functions))
+            coefficients = np.broadcast_to(matrices.transpose(0, 2, 1)[:, None], targets.shape)
+
+            shape = (len(table), len(atoms) * n_functions, n_functions)
+            yield (atoms[:, None] * n_functions + functions).ravel(), targets.reshape(shape), coefficients.reshape(shape)
@@ -0,0 +1,183 @@
+"""
+Streaming reader of SD files, ie. files holding many molecules as .mol records separated by lines starting with '$$$$'.
+
+Records are read one at a time, so the memory used does not depend on the size of the file. To jump to a record, the
+byte offset at which each record starts is found by a single scan of the (memory-mapped) file, done the first time it
+is needed.
+"""
+
+import mmap
+import re
+
+import numpy as np
+
+from Program.Symmetry.MolParser import MolParser
+
+RECORD_DELIMITER = b'$$$$'
+ENCODING = 'utf-8'
+
+_NEWLINE = ord('\n')
+_NOT_BLANK = re.compile(rb'\S')
+
+
+def iter_sdf(path: str, start: int = 0):
+    """
+    Streams the molecules stored in an SD file.
+
+    :param path: The path to the SD file.
+    :type path: str
+    :param start: The index of the first record to read. Records before it are skipped using the byte-offset index, so
+        they are not parsed.
+    :type start: int
+
+    :return: Generator of the molecules, in the order in which they are stored.
+    :rtype: generator of MolParser
+    """
+    return SDFile(path).records(start)
+
+
+class SDFile:
+    """
+    Random access to the records of an SD file.
+    """
+
+    def __init__(self, path: str):
+        """
+        :param path: The path to the SD file.
+        :type path: str
+        """
+        self._path = path
+        self._offsets = None
+
+    def __repr__(self):
+        return f'SDFile({self._path!r})'
+
+    def __len__(self):
+        """The number of records in the file. Builds the byte-offset index if it has not been built yet."""
+        return len(self.offsets)
+
+    def __iter__(self):
+        return self.records()
+
+    def __getitem__(self, index: int) -> MolParser:
+        """
+        Reads only the requested record, by seeking to it.
+
+        :param index: The index of the record. Negative indices count from the end of the file.
+        :type index: int
+
+        :return: The molecule stored in the record.
+        :rtype: MolParser
+        """
+        offsets = self.offsets
+        if not -len(offsets) <= index < len(offsets):
+            raise IndexError(f'Record {index} is out of range for {self._path}, which holds {len(offsets)} records.')
+
+        with open(self._path, 'rb') as file:
+            file.seek(offsets[index])
+            return next(self._read_records(file))
+
+    @property
+    def offsets(self) -> np.ndarray:
+        """
+        :return: The byte offset at which each record starts.
+        :rtype: numpy.ndarray of numpy.int64
+        """
+        if self._offsets is None:
+            self._offsets = self._build_index()
+        return self._offsets
+
+    def records(self, start: int = 0):
+        """
+        Streams the molecules stored in the file.
+
+        :param start: The index of the first record to read.
+        :type start: int
+
+        :return: Generator of the molecules, in the order in which they are stored.
+        :rtype: generator of MolParser
+        """
+        with open(self._path, 'rb') as file:
+            if start:
+                offsets = self.offsets
+                if start >= len(offsets):
+                    return
+                file.seek(offsets[start])
+            yield from self._read_records(file)
+
+    @staticmethod
+    def _read_records(file):
+        """
+        Parses the records of an open file from its current position, reading one record at a time.
+
+        :param file: The SD file, opened in binary mode.
+        :type file: io.BufferedReader
+
+        :return: Generator of the molecules.
+        :rtype: generator of MolParser
+        """
+        for lines in SDFile._read_record_lines(file):
+            yield MolParser(lines)
+
+    @staticmethod
+    def _read_record_lines(file):
+        """
+        Splits an open file into records from its current position, reading one record at a time.
+
+        :param file: The SD file, opened in binary mode.
+        :type file: io.BufferedReader
+
+        :return: Generator of the decoded lines of each record.
+        :rtype: generator of list of str
+        """
+        lines = []
+        for line in file:
+            if not line.startswith(RECORD_DELIMITER):
+                lines.append(line)
+            elif any(line.strip() for line in lines):  # Blank records are skipped
+                yield _decode(lines)
+                lines = []
+            else:
+                lines = []
+
+        # The last record of the file does not have to be followed by the delimiter:
+        if any(line.strip() for line in lines):
+            yield _decode(lines)
+
+    def _build_index(self) -> np.ndarray:
+        """
+        Finds the byte offset at which each record starts, by scanning the memory-mapped file for the delimiters.
+
+        :return: The byte offset of each record.
+        :rtype: numpy.ndarray of numpy.int64
+        """
+        with open(self._path, 'rb') as file:
+            try:
+                buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # Empty files cannot be memory-mapped
+                return np.zeros(0, dtype=np.int64)
+
+        with buffer:
+            # Find where each record starts and ends, ie. the lines starting with the delimiter:
+            starts, ends = [0], []
+            position = buffer.find(RECORD_DELIMITER)
+            while position != -1:
+                if position == 0 or buffer[position - 1] == _NEWLINE:
+                    ends.append(position)
+                    line_end = buffer.find(b'\n', position)
+                    starts.append(len(buffer) if line_end == -1 else line_end + 1)
+                    position = starts[-1]
+                else:
+                    position += 1
+                position = buffer.find(RECORD_DELIMITER, position)
+            ends.append(len(buffer))
+
+            # Blank records (eg. the new lines after the last delimiter) are skipped, as when the records are read:
+            offsets = [start for start, end in zip(starts, ends) if _NOT_BLANK.search(buffer, start, end)]
+
+        return np.array(offsets, dtype=np.int64)
+
+
+def _decode(lines: list) -> list:
+    """Decodes the lines of a record, read in binary mode, for MolParser."""
+    return [line.decode(ENCODING, errors='replace') for line in lines]
@@ -0,0 +1,169 @@
+"""
+Selection rules (eg. IR and Raman activity, allowedness of transitions) determined from the character table of a point
+group.
+"""
+
+import re
+
+import numpy as np
+
+# Names of the operators whose components are identified by the functions in the character table:
+OPERATORS = ('dipole', 'polarizability', 'rotation')
+
+
+class SelectionRules:
+    """
+    Selection rules of a point group.
+
+    The functions listed in the character table (eg. x, $R_z$, $x^2-y^2$) are parsed once, when the object is created,
+    to find which irreducible representations the components of each operator transform as:
+        - dipole: x, y, z (IR activity, electric dipole transitions)
+        - polarizability: the quadratic functions, eg. x^2, xy (Raman activity)
+        - rotation: R_x, R_y, R_z (magnetic dipole transitions)
+
+    A transition between states of symmetry Γ_i and Γ_f is allowed by an operator if Γ_i* × Γ_op × Γ_f contains the
+    totally symmetric irreducible representation for any of the operator's components. This is precomputed for all
+    pairs of irreducible representations, so that queries over many states are answered by indexing arrays.
+    """
+
+    def __init__(self, point_group):
+        """
+        :param point_group: The point group whose selection rules will be determined.
+        :type point_group: PointGroup
+        """
+        self._point_group = point_group
+        self._irrep_index = {irrep: index for index, irrep in enumerate(point_group.irreps)}
+        self._functions = self._parse_functions(point_group.full_character_table)
+
+        # Irreducible representations spanned by the components of each operator:
+        self._operators = {'dipole': self.function_irreps('x', 'y', 'z'),
+                           'polarizability': self.function_irreps(*[function for function in self._functions
+                                                                    if _is_quadratic(function)]),
+                           'rotation': self.function_irreps('R_x', 'R_y', 'R_z')}
+
+        # The product table holds the number of times irreducible representation k appears in i × j, which is the same
+        # as the number of times the totally symmetric one appears in i* × j × k. So, a transition from i to f is allowed
+        # if the product table has a nonzero element [op, f, i] for any of the operator's irreducible representations:
+        product_table = point_group.product_table
+        self._allowed = {operator: (product_table[irreps].sum(axis=0) > 0).T
+                         for operator, irreps in self._operators.items()}
+        for table in self._allowed.values():
+            table.setflags(write=False)
+
+    def __repr__(self):
+        return f'SelectionRules({self._point_group!r})'
+
+    @staticmethod
+    def _parse_functions(full_character_table) -> dict:
+        """
+        Finds the irreducible representations of all functions listed in the non-numerical columns of the character
+        table. Formatting (eg. '$', brackets) is ignored, so '(x, y), ($R_x$, $R_y$)' lists x, y, R_x and R_y.
+
+        :param full_character_table: The character table including the columns with the functions.
+        :type full_character_table: pandas.DataFrame
+
+        :return: The indices of the irreducible representations which each function transforms as.
+        :rtype: dict of lists of ints
+        """
+        functions = {}
+        text_columns = full_character_table.loc[:, full_character_table.dtypes == object]
+        for index, row in enumerate(text_columns.iloc[1:].itertuples(index=False)):
+            for cell in row:
+                if not isinstance(cell, str):
+                    continue
+                for function in re.sub(r'[$()\s]', '', cell).split(','):
+                    if function and function != '-':
+                        functions.setdefault(function, []).append(index)
+        return functions
+
+    @property
+    def operators(self) -> dict:
+        """
+        :return: For each operator, a mask of the irreducible representations spanned by its components.
+        :rtype: dict of numpy.ndarray of bools
+        """
+        return {operator: np.isin(np.arange(len(self._irrep_index)), irreps)
+                for operator, irreps in self._operators.items()}
+
+    def function_irreps(self, *functions: str) -> np.ndarray:
+        """
+        :param functions: Functions as listed in the character table (without formatting), eg. 'z', 'R_x', 'xy'.
+        :type functions: str
+
+        :return: The indices of the irreducible representations that any of the functions transform as.
+        :rtype: numpy.ndarray of ints
+        """
+        return np.unique(np.array([index for function in functions for index in self._functions.get(function, [])],
+                                  dtype=int))
+
+    def indices(self, irreps) -> np.ndarray:
+        """
+        Converts names of irreducible representations into their indices, which are used for fast queries.
+
+        :param irreps: Names of irreducible representations of the point group.
+        :type irreps: iterable of str
+
+        :return: The indices of the irreducible representations.
+        :rtype: numpy.ndarray of ints
+        """
+        return np.fromiter((self._irrep_index[irrep] for irrep in irreps), dtype=int)
+
+    def allowed(self, initial, final, operator: str = 'dipole') -> np.ndarray:
+        """
+        Determines whether transitions between states are allowed by the operator, ie. whether Γ_i* × Γ_op × Γ_f
+        contains the totally symmetric irreducible representation.
+
+        :param initial: The irreducible representations of the initial states, as indices (fast) or names.
+        :type initial: int, str or array-like of ints or strs
+        :param final: The irreducible representations of the final states, as indices (fast) or names. Must be
+            broadcastable with initial.
+        :type final: int, str or array-like of ints or strs
+        :param operator: The operator inducing the transitions, one of OPERATORS.
+        :type operator: str
+
+        :return: Whether each transition is allowed, with the broadcast shape of initial and final.
+        :rtype: numpy.ndarray of bools
+        """
+        initial, final = (self._as_indices(states) for states in (initial, final))
+        return self._allowed[operator][initial, final]
+
+    def active(self, operator: str = 'dipole') -> np.ndarray:
+        """
+        Determines which fundamental transitions (ie. from the totally symmetric state) are active, eg. which vibrational
+        modes are IR ('dipole') or Raman ('polarizability') active.
+
+        :param operator: The operator inducing the transitions, one of OPERATORS.
+        :type operator: str
+
+        :return: Whether the transition to each irreducible representation is active.
+        :rtype: numpy.ndarray of bools
+        """
+        return self._allowed[operator][0]
+
+    def count_active(self, multiplicities, operator: str = 'dipole') -> np.ndarray:
+        """
+        Counts the active fundamental transitions in many reducible representations at once, eg. the number of IR
+        active vibrational modes in the output of PointGroup.reduce_many.
+
+        :param multiplicities: The number of times each irreducible representation (columns) appears in each reducible
+            representation (rows).
+        :type multiplicities: 2D array-like of ints
+        :param operator: The operator inducing the transitions, one of OPERATORS.
+        :type operator: str
+
+        :return: The number of active irreducible representations in each reducible representation.
+        :rtype: numpy.ndarray of ints
+        """
+        return np.asarray(multiplicities) @ self.active(operator)
+
+    def _as_indices(self, states) -> np.ndarray:
+        """Converts irreducible representations given by name into indices, leaving indices unchanged."""
+        states = np.asarray(states)
+        if states.dtype.kind in 'UO':
+            return self.indices(states.ravel()).reshape(states.shape)
+        return states
+
+
+def _is_quadratic(function: str) -> bool:
+    """Checks whether a function from the character table is quadratic in the coordinates, eg. x^2-y^2 or xz."""
+    return '^2' in function or function in ('xy', 'xz', 'yz')
@@ -0,0 +1,57 @@
+"""
+Symmetrisation of approximately symmetric geometries, eg. of .mol files whose coordinates are rounded to 4 decimals.
+
+Each operation g of the point group moves atom i (approximately) onto atom P[g, i] of the permutation table (see
+Program/Symmetry/representations.py), so gᵀ moves atom P[g, i] back (approximately) onto atom i. The symmetrised position
+of atom i is the average of these h images, x'_i = (1/h) Σ_g gᵀ x_P[g, i], computed for all atoms and operations at once.
+Since the operations form a group, g x'_i = x'_P[g, i] holds exactly, and atoms on symmetry elements are placed exactly on
+them. The centre of mass is not moved, since equivalent atoms have the same mass, so the standard frame of the molecule is
+still the standard frame of the symmetrised molecule, and is cached on it so that its symmetry is not perceived again.
+"""
+
+import numpy as np
+
+from Program.Symmetry.MolParser import MolParser
+from Program.Symmetry.perception import DEFAULT_TOLERANCE
+from Program.Symmetry.representations import _permutation_table, standard_frame
+from Program.Symmetry.symmetry import PointGroup
+
+
+def symmetrise(molecule, point_group: PointGroup = None, tolerance: float = DEFAULT_TOLERANCE):
+    """
+    Moves the atoms of an approximately symmetric molecule onto an exactly symmetric geometry.
+
+    :param molecule: The molecule, which is not changed.
+    :type molecule: MolParser
+    :param point_group: The point group of the molecule. Defaults to the point group found from its geometry.
+    :type point_group: PointGroup
+    :param tolerance: The largest distance (in Angstrom) between an atom moved by a symmetry operation and the
+        equivalent atom, which must be large enough for the approximate symmetry to be found.
+    :type tolerance: float
+
+    :return: The symmetrised molecule, with the same atoms (in the same order), bonds and data, and the root mean square
+        displacement (in Angstrom) of its atoms; or None if the molecule does not belong to the point group.
+    :rtype: tuple of MolParser and float
+    """
+    permutations = _permutation_table(molecule, point_group, tolerance)
+    if permutations is None:
+        return None
+    point_group, table = permutations
+    symmetry = standard_frame(molecule, tolerance)
+
+    # Average the images of all atoms under the inverses (transposes) of all operations in one go:
+    coordinates = symmetry.to_standard_frame(molecule.coordinates)
+    operations = point_group.operations
+    symmetrised = np.einsum('hji,hnj->ni', operations, coordinates[table]) / len(operations)
+    rms_displacement = float(np.sqrt(((symmetrised - coordinates) ** 2).sum(axis=1).mean()))
+
+    result = MolParser.from_arrays(symmetrised @ symmetry.axes + symmetry.centre, molecule.atomic_numbers,
+                                   molecule.bond_atoms, molecule.bond_orders, molecule.chiral, dict(molecule.data))
+    if molecule._other_symbols:
+        result._set_atoms(result.coordinates, result.atomic_numbers, dict(molecule._other_symbols))
+
+    # The atoms are moved onto the same atoms as before, so the symmetry of the molecule does not need to be found again:
+    cache = result._derived_results()
+    cache['symmetry', tolerance] = symmetry
+    cache['permutation_table', point_group._name, tolerance] = table
+    return result, rms_displacement
@@ -2,11 +2,39 @@
 Program to manipulate chemically important point groups.
 """
 
+import functools
 import os
+import re
+import warnings
 
 import numpy as np
 import pandas as pd
 
+from Program.Data.bundle import CSV_DIRECTORY, StaleBundleWarning, load_bundle
+from Program.Symmetry.operations import class_operations, multiplication_table
+from Program.Symmetry.results import Decomposition
+
+# Maximum number of point groups created from custom csv files that are kept in the cache of get_point_group:
+CUSTOM_CACHE_SIZE = 32
+
+# Largest difference from a whole number allowed for the results of the reduction formula when the character table
+# contains irrational or complex characters, for which the reduction cannot be performed in exact integer arithmetic:
+REDUCTION_TOLERANCE = 1e-6
+
+# Number of decimals to which representations are rounded before being matched to irreducible representations:
+MATCH_DECIMALS = 6
+
+# Linear functions listed in the character tables, ie. the functions which transform as the x, y and z coordinates:
+_LINEAR_FUNCTIONS = frozenset('xyz')
+
+
+class ReductionError(ValueError):
+    pass
+
+
+class _LoadError(Exception):
+    """Raised when a custom csv file cannot be loaded, so that the failed load is not cached."""
+
 
 class PointGroup:
     """
@@ -23,7 +51,6 @@ class PointGroup:
         """
         # If a DataFrame is provided, use that data as the working point group:
         if isinstance(point_group, pd.DataFrame):
-            print(point_group)
             self._full_character_table = point_group
             self._assign_working_character_table()
         else:
@@ -38,8 +65,12 @@ class PointGroup:
             distribution.
         :type point_group: str
         """
+        # Point groups provided in the standard distribution are read from the memory-mapped bundle when possible:
+        if self._load_bundle(point_group):
+            return
+
         try:
-            path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', f'Data/CSV/{point_group}.csv'))
+            path = os.path.join(CSV_DIRECTORY, f'{point_group}.csv')
             self._full_character_table = pd.read_csv(path, index_col=0, sep=';')
             self._assign_working_character_table()
 
@@ -56,35 +87,292 @@ class PointGroup:
                       'turned into a character table. Please use a pandas.DataFrame or str object to initiate a '
                       'PointGroup object.')
 
+    def _load_bundle(self, point_group) -> bool:
+        """
+        Loads the numerical data of a point group provided in the standard distribution from the compiled bundle of
+        character tables (see Program/Data/bundle.py) without copying it. The full character table is only created from
+        the bundle when the full_character_table property is first accessed.
+
+        :param point_group: The name of the point group.
+        :type point_group: str
+
+        :return: True if the point group was loaded, False if it has to be loaded from its csv file instead.
+        :rtype: bool
+        """
+        bundle = load_bundle()
+        if bundle is None or not isinstance(point_group, str) or point_group not in bundle:
+            return False
+
+        # The csv files are the source of truth, so do not use the bundle if they have been changed since it was built:
+        if bundle.is_stale(point_group):
+            warnings.warn(f'The compiled character table of {point_group} is out of date with its csv file, so the csv '
+                          'file will be used instead. Please rebuild the bundle with: python -m Program.Data.bundle',
+                          StaleBundleWarning)
+            return False
+
+        metadata = bundle.metadata(point_group)
+        classes = [column for column, dtype in zip(metadata['columns'], metadata['dtypes']) if dtype != 'object']
+        self._full_character_table = None
+        self._assign_compiled_character_table(metadata['index'][0], metadata['index'][1:], classes,
+                                              *bundle.arrays(point_group))
+        self._bundle_key = point_group
+        return True
+
     def _assign_working_character_table(self):
         """
-        Creates a variable containing the point group's character table that only contains numerical values. The chief
-        purpose of this function is to remove the columns that contain the information about functions (eg. x, xy, etc),
-        and leave only the pure character table that can be used for calculations.
+        Compiles the point group's character table into compact NumPy arrays that only contain numerical values, which
+        are then used by all calculations. The chief purpose of this function is to remove the columns that contain the
+        information about functions (eg. x, xy, etc), and leave only the pure character table. The DataFrame holding
+        the pure character table is only created when the character_table property is first accessed.
 
         However, this function will strip away all columns that contain non-numerical values (eg. strings), so extra
         care should be taken if a custom point group is used.
         """
-        self._CHARACTER_TABLE = self._full_character_table.drop(
-            self._full_character_table.loc[:, self._full_character_table.dtypes == object].columns, 1)
+        numeric = self._full_character_table.loc[:, self._full_character_table.dtypes != object]
+        values = numeric.to_numpy(dtype=complex)
+
+        # The first row holds the number of symmetry elements in each class, and the rest holds the characters. The
+        # characters are stored as small ints whenever possible (ie. when none of them are irrational or complex):
+        characters = values[1:]
+        if not characters.imag.any():
+            characters = characters.real
+            if np.array_equal(characters, np.rint(characters)) and np.all(np.abs(characters) <= np.iinfo(np.int8).max):
+                characters = characters.astype(np.int8)
+
+        self._assign_compiled_character_table(numeric.index[0], numeric.index[1:], numeric.columns,
+                                              np.rint(values[0].real).astype(np.int64), characters)
+
+    def _assign_compiled_character_table(self, name: str, irreps, classes, class_orders: np.ndarray,
+                                         characters: np.ndarray):
+        """
+        Stores the compact form of the character table used by all calculations.
+
+        :param name: The name of the point group.
+        :type name: str
+        :param irreps: The names of the irreducible representations.
+        :type irreps: iterable of str
+        :param classes: The names of the classes of symmetry elements.
+        :type classes: iterable of str
+        :param class_orders: The number of symmetry elements in each class.
+        :type class_orders: numpy.ndarray of ints
+        :param characters: The characters of each irreducible representation (rows) in each class (columns).
+        :type characters: numpy.ndarray of ints or floats
+        """
+        # Names of the point group, its irreducible representations and classes of symmetry elements:
+        self._name = name
+        self._irreps = tuple(irreps)
+        self._classes = tuple(classes)
+        self._irrep_index = {irrep: index for index, irrep in enumerate(self._irreps)}
+        self._class_index = {class_: index for index, class_ in enumerate(self._classes)}
+
+        self._class_orders = np.ascontiguousarray(class_orders)
+        self._characters = np.ascontiguousarray(characters)
+        self._group_order = int(self._class_orders.sum())
+
+        # Precompute the parts of the reduction formula that do not depend on the reducible representation, so that
+        # representations can be reduced with a single (matrix) product:
+        self._reduction_matrix = self._characters.conj() * self._class_orders
+
+        # Index of the irreducible representations by their characters, used to match representations by lookup:
+        self._irrep_keys = self._representation_keys(self._characters)
+        self._irrep_lookup = {key.tobytes(): index for index, key in enumerate(self._irrep_keys)}
+
+        for array in (self._class_orders, self._characters, self._reduction_matrix, self._irrep_keys):
+            array.setflags(write=False)
+
+        self._CHARACTER_TABLE = None
+        self._product_table = None
+        self._operations = None
+        self._operation_classes = None
+        self._multiplication_table = None
 
     def __repr__(self):
         """Show the name of class and the point group used to construct it. For development purposes."""
-        return f'PointGroup({self._CHARACTER_TABLE.index.values[0]})'
+        return f'PointGroup({self._name})'
 
     def __str__(self):
         """Show the entire character table. For user purposes."""
-        return self._CHARACTER_TABLE
+        return self.character_table
 
     @property
     def full_character_table(self):
+        """Show the character table including the columns with functions, which is immutable."""
+        if self._full_character_table is None:
+            self._full_character_table = load_bundle().full_character_table(self._bundle_key)
         return self._full_character_table
 
     @property
     def character_table(self):
         """Show the character table, which is immutable."""
+        if self._CHARACTER_TABLE is None:
+            full_character_table = self.full_character_table
+            self._CHARACTER_TABLE = full_character_table.drop(
+                columns=full_character_table.loc[:, full_character_table.dtypes == object].columns)
         return self._CHARACTER_TABLE
 
+    @property
+    def irreps(self) -> tuple:
+        """The names of the irreducible representations, in the order of the rows of the character table."""
+        return self._irreps
+
+    @property
+    def product_table(self) -> np.ndarray:
+        """
+        The decompositions of the direct products of all pairs of irreducible representations, ie. element [i, j, k]
+        is the number of times the k-th irreducible representation appears in the product of the i-th and j-th ones.
+        Built on first access and then reused.
+
+        :rtype: numpy.ndarray of ints with shape (n_irreps, n_irreps, n_irreps)
+        """
+        if self._product_table is None:
+            n_irreps = len(self._irreps)
+            products = (self._characters[:, np.newaxis] * self._characters[np.newaxis]).reshape(n_irreps ** 2, -1)
+            self._product_table = self._divide_by_group_order(products @ self._reduction_matrix.T).reshape(
+                (n_irreps,) * 3)
+            self._product_table.setflags(write=False)
+        return self._product_table
+
+    @property
+    def operations(self) -> np.ndarray:
+        """
+        The 3x3 matrices of all symmetry operations, acting on coordinates in the standard frame of the point group,
+        grouped by class in the order of the columns of the character table (see operation_classes). Generated on first
+        access and then reused, so that a whole molecule can be moved by all operations with a single einsum, eg.
+        np.einsum('hij,nj->hni', point_group.operations, coordinates).
+
+        :rtype: numpy.ndarray with shape (h, 3, 3)
+
+        :raises OperationError: If the operations of the point group cannot be generated, eg. for custom point groups.
+        """
+        if self._operations is None:
+            self._operations, self._operation_classes = class_operations(self)
+            self._operations.setflags(write=False)
+            self._operation_classes.setflags(write=False)
+        return self._operations
+
+    @property
+    def operation_classes(self) -> np.ndarray:
+        """
+        The index of the class (column of the character table) of each of the operations.
+
+        :rtype: numpy.ndarray of ints with shape (h,)
+        """
+        if self._operation_classes is None:
+            _ = self.operations
+        return self._operation_classes
+
+    @property
+    def multiplication_table(self) -> np.ndarray:
+        """
+        The index (in operations) of the product of each pair of operations, ie. element [a, b] is the index of the
+        operation which is the same as applying operation b and then operation a. Built on first access and then reused.
+
+        :rtype: numpy.ndarray of ints with shape (h, h)
+        """
+        if self._multiplication_table is None:
+            self._multiplication_table = multiplication_table(self.operations)
+            self._multiplication_table.setflags(write=False)
+        return self._multiplication_table
+
+    @property
+    def xyz_representation(self) -> np.ndarray:
+        """
+        Γ_xyz, the representation of the x, y and z coordinates, built from the irreducible representations listed with
+        x, y or z in the character table.
+
+        :rtype: numpy.ndarray with one character per class
+        """
+        functions = self.full_character_table.loc[:, self.full_character_table.dtypes == object].iloc[1:, 0]
+
+        representation = np.zeros(len(self._classes), dtype=complex)
+        for irrep, listed in functions.items():
+            count = sum(token in _LINEAR_FUNCTIONS for token in re.split(r'[\s,()$]+', str(listed)))
+            # A degenerate irreducible representation, eg. one listed with (x, y), appears only once:
+            characters = self._characters[self._irrep_index[irrep]]
+            representation += characters * count / characters[0].real
+
+        # Remove the rounding errors of the divisions, so that whole numbers are given as ints:
+        representation = np.round(representation, 12)
+        return self._exact(representation.real) if not representation.imag.any() else representation
+
+    def verify_operations(self) -> bool:
+        """
+        Checks that the traces of the operation matrices of each class are equal to the characters of Γ_xyz given by the
+        character table, ie. that the operations were generated and sorted into classes correctly.
+
+        :return: True if the traces match the characters.
+        :rtype: bool
+        """
+        traces = np.einsum('hii->h', self.operations)
+        return bool(np.allclose(traces, self.xyz_representation[self.operation_classes]))
+
+    def project(self, irrep: str, basis) -> np.ndarray:
+        """
+        Builds the symmetry-adapted linear combinations (SALCs) of a basis which transform as an irreducible
+        representation, by applying its projection operator to all basis functions.
+
+        :param irrep: The name of the irreducible representation.
+        :type irrep: str
+        :param basis: The basis functions, eg. the s functions of the hydrogen atoms of a molecule.
+        :type basis: AtomicBasis
+
+        :return: The coefficients of the orthonormal SALCs (rows) in the basis functions (columns, as in basis.labels).
+        :rtype: numpy.ndarray with shape (n_salcs, basis.size)
+        """
+        if irrep not in self._irrep_index:
+            print(f'The inputted irreducible representation does not exist in this character table. Projections in '
+                  f'this point group can be performed onto any of {self._irreps}.')
+        else:
+            return self._project(basis, [irrep])[irrep]
+
+    def project_all(self, basis) -> dict:
+        """
+        Builds the symmetry-adapted linear combinations (SALCs) of a basis for all irreducible representations at once.
+
+        :param basis: The basis functions, eg. the s functions of the hydrogen atoms of a molecule.
+        :type basis: AtomicBasis
+
+        :return: The coefficients of the orthonormal SALCs (rows) in the basis functions (columns, as in basis.labels),
+            for each irreducible representation.
+        :rtype: dict of numpy.ndarray with shape (n_salcs, basis.size)
+        """
+        return self._project(basis, self._irreps)
+
+    def _project(self, basis, irreps) -> dict:
+        """
+        Applies the projection operators, d/h Σ χ(R)* R, of the irreducible representations to the basis. The
+        operators of all irreducible representations are built from the matrices of the operations in the basis with a
+        single product, separately for each set of equivalent atoms, and their ranges are found with a single
+        (batched) diagonalisation.
+        """
+        characters = self._characters[[self._irrep_index[irrep] for irrep in irreps]]
+        weights = characters.conj()[:, self.operation_classes] * characters[:, :1].real / self._group_order
+
+        salcs = {irrep: [] for irrep in irreps}
+        for indices, targets, coefficients in basis.blocks(self):
+            # The matrix of each operation in the basis functions of this set of atoms:
+            operations = np.zeros((len(targets), len(indices), len(indices)))
+            sources = np.broadcast_to(np.arange(len(indices))[:, None], targets.shape[1:])
+            operations[np.arange(len(targets))[:, None, None], targets, sources] = coefficients
+
+            projectors = np.einsum('nh,hij->nij', weights, operations)
+            projectors = (projectors + projectors.conj().transpose(0, 2, 1)) / 2
+            eigenvalues, eigenvectors = np.linalg.eigh(projectors)
+
+            # The range of a projector is spanned by its eigenvectors with the eigenvalue 1:
+            for irrep, values, vectors in zip(irreps, eigenvalues, eigenvectors):
+                vectors = vectors[:, values > 0.5].T
+                if len(vectors):
+                    # Make the largest coefficient of each SALC positive, so that the results are reproducible:
+                    largest = np.abs(vectors).argmax(axis=1)
+                    vectors = vectors / np.sign(vectors[np.arange(len(vectors)), largest].real)[:, None]
+                    combinations = np.zeros((len(vectors), basis.size), dtype=vectors.dtype)
+                    combinations[:, indices] = vectors
+                    salcs[irrep].append(combinations)
+
+        return {irrep: np.concatenate(combinations) if combinations else np.zeros((0, basis.size))
+                for irrep, combinations in salcs.items()}
+
     @classmethod
     def create_from_pandas(cls, point_group: str):
         """
@@ -111,7 +399,7 @@ class PointGroup:
         except TypeError:
             print('Incorrect type has been used to create a PointGroup object.')
 
-    def reduction(self, representation) -> pd.DataFrame:
+    def reduction(self, representation, as_frame: bool = True):
         """
         Reduces the provided reducible representation into its constituent irreducible representation, showing all
         working. Uses the reduction formula.
@@ -119,48 +407,172 @@ class PointGroup:
         :param representation:The reducible representation to which the reduction formula will be applied.
         :type representation: iterable of ints or floats
 
+        :param as_frame: If True, the result is returned as a DataFrame labelled with the irreducible representations
+            and the classes, which is meant for display: building it takes around 200 µs, far longer than the reduction
+            itself. If False, the same values are returned as an array, in around 10 µs.
+        :type as_frame: bool
+
         :return: A table showing the reduction formula being applied to each irreducible representation; ie. each
             element shows the result of the multiplication of an element of the provided reducible representation by the
             corresponding element in the character table and the number of symmetry elements of the corresponding type.
             The last column shows the number of each irreducible representation in the provided reducible
             representation.
-        :return type: pandas.DataFrame
+        :return type: pandas.DataFrame or numpy.ndarray
+
+        :raises ReductionError: If the provided representation does not contain a whole number of each irreducible
+            representation.
         """
         representation = np.array(representation)  # Needed for later calculations.
 
         # If the provided list is not the same length as the character table, show a warning and stop the attempted
         # reduction. Proceeding would result, at minimum, in incorrect results.
-        if len(representation) != len(self._CHARACTER_TABLE.iloc[0]):
+        if len(representation) != len(self._classes):
             print('ReductionError: The reducible representation must have the same '
                   'number of elements as a row of the character table')
         else:
             try:
                 # Apply the reduction formula:
-                result = self._CHARACTER_TABLE.iloc[1:] * self._CHARACTER_TABLE.iloc[0] * representation
-                # Determine and save the number of times each irreducible representation appears in the reducible repr.
-                result['number of appearances'] = result.sum(axis=1) / self._CHARACTER_TABLE.iloc[0].sum()
-                return result.astype(int)
+                result = self._reduction_matrix * self._exact(representation)
 
             # Handle weird input (eg. words in the array):
             except TypeError:
                 print('The reducible representation contains elements of unsupported dtypes. Please make sure that'
                       'the representation parameter is an iterable object of ints or floats.')
+            else:
+                # Determine the number of times each irreducible representation appears in the reducible repr.
+                appearances = self._divide_by_group_order(result.sum(axis=1)[np.newaxis])[0]
+
+                if not as_frame:
+                    return np.column_stack((result, appearances))
+                if np.iscomplexobj(result):
+                    result = pd.DataFrame(result, self._irreps, self._classes)
+                    result['number of appearances'] = appearances
+                    return result
+                return pd.DataFrame(np.column_stack((result.astype(int), appearances)), self._irreps,
+                                    [*self._classes, 'number of appearances'])
+
+    def reduce_many(self, representations, as_frame: bool = False):
+        """
+        Reduces many reducible representations at once, using a single matrix product of the representations with the
+        precomputed character table weighted by the number of symmetry elements in each class. The results are the same
+        as the 'number of appearances' column of the reduction method, but none of the working is shown.
 
-    def constituents(self, representation) -> pd.Series:
+        :param representations: The reducible representations to which the reduction formula will be applied. Each row
+            is one reducible representation, and must have the same number of elements as a row of the character table.
+        :type representations: 2D array-like of ints or floats
+
+        :param as_frame: If True, the result is returned as a DataFrame with one column per irreducible representation.
+        :type as_frame: bool
+
+        :return: The number of times each irreducible representation (columns) appears in each of the provided reducible
+            representations (rows).
+        :rtype: numpy.ndarray of ints or pandas.DataFrame
+
+        :raises ReductionError: If any of the provided representations does not contain a whole number of each
+            irreducible representation.
         """
-        Applies the reduction formula to the provided reducible representation, and prints the constituent irreducible
-        representations in a nice format.
+        representations = np.asarray(representations)
+
+        # Reject anything that is not a table of representations with one element per class of the character table:
+        if representations.ndim != 2 or representations.shape[1] != len(self._classes):
+            print('ReductionError: The reducible representations must be a 2D array in which each row has the same '
+                  'number of elements as a row of the character table')
+        else:
+            try:
+                # Apply the reduction formula to all representations:
+                result = self._exact(representations) @ self._reduction_matrix.T
+            except TypeError:
+                print('The reducible representations contain elements of unsupported dtypes. Please make sure that '
+                      'the representations parameter is a 2D array of ints or floats.')
+            else:
+                result = self._divide_by_group_order(result)
+                if as_frame:
+                    return pd.DataFrame(result, columns=self._irreps)
+                return result
+
+    @staticmethod
+    def _exact(representations: np.ndarray) -> np.ndarray:
+        """
+        Converts reducible representations made up of whole numbers stored as floats to ints, so that they can be
+        reduced in exact integer arithmetic.
+
+        :param representations: The reducible representations.
+        :type representations: numpy.ndarray
+
+        :return: The same reducible representations, as ints if possible.
+        :rtype: numpy.ndarray
+        """
+        if representations.dtype.kind == 'f' and np.array_equal(representations, np.rint(representations)):
+            return representations.astype(np.int64)
+        return representations
+
+    def _divide_by_group_order(self, sums: np.ndarray) -> np.ndarray:
+        """
+        Performs the last step of the reduction formula, ie. the division by the order of the group, checking that each
+        irreducible representation appears a whole number of times. If both the character table and the reducible
+        representations hold only ints, this is done in exact integer arithmetic. Otherwise, the results may differ from
+        whole numbers by at most REDUCTION_TOLERANCE (and, for complex characters, be real within it).
+
+        :param sums: The sums over all classes of the products of the reducible representations, the complex conjugate
+            characters and the numbers of symmetry elements, with one row per reducible representation.
+        :type sums: numpy.ndarray
+
+        :return: The number of times each irreducible representation (columns) appears in each reducible representation
+            (rows).
+        :rtype: numpy.ndarray of ints
+
+        :raises ReductionError: If any irreducible representation does not appear a whole number of times, ie. if any
+            of the reducible representations is not a representation of the point group.
+        """
+        if sums.dtype.kind in 'iu':
+            appearances, remainders = np.divmod(sums, self._group_order)
+            invalid = remainders != 0
+        else:
+            quotients = sums / self._group_order
+            appearances = np.rint(quotients.real).astype(int)
+            invalid = np.abs(quotients - appearances) > REDUCTION_TOLERANCE
+
+        if invalid.any():
+            raise ReductionError(f'The reducible representation in row {invalid.any(axis=1).argmax()} does not contain '
+                                 'a whole number of each irreducible representation, so it is not a representation of '
+                                 f'the {self._name} point group.')
+        return appearances
+
+    def constituents(self, representation, verbose: bool = False) -> Decomposition:
+        """
+        Applies the reduction formula to the provided reducible representation to find its constituent irreducible
+        representations, without showing any of the working.
 
         :param representation: The reducible representation to which the reduction formula will be applied.
         :type representation: iterable of ints or floats
+        :param verbose: If True, the result is also printed in a nice format.
+        :type verbose: bool
 
-        :return: A pandas Series of the numbers each irreducible representation appears in the provided reducible
+        :return: The number of times each irreducible representation appears in the provided reducible representation.
+        :rtype: Decomposition
+
+        :raises ReductionError: If the provided representation does not contain a whole number of each irreducible
             representation.
-        :return type: pandas.Series
         """
-        result = self.reduction(representation)  # Reduce the reducible representation.
-        self.print_result(result)
-        return result['number of appearances']
+        representation = np.asarray(representation)
+
+        if representation.shape != (len(self._classes),):
+            print('ReductionError: The reducible representation must have the same '
+                  'number of elements as a row of the character table')
+            return
+
+        try:
+            # Apply the reduction formula:
+            sums = self._reduction_matrix @ self._exact(representation)
+        except TypeError:
+            print('The reducible representation contains elements of unsupported dtypes. Please make sure that'
+                  'the representation parameter is an iterable object of ints or floats.')
+            return
+
+        result = Decomposition(self._divide_by_group_order(sums[np.newaxis])[0], self._irreps)
+        if verbose:
+            self.print_result(result)
+        return result
 
     def convolution(self, arg1: str, arg2: str, *args) -> pd.Series:
         """
@@ -176,11 +588,38 @@ class PointGroup:
         :return: pandas.Series, the result of the multiplication, displayed as raw data
         """
         try:
-            # Multiply all the chosen row by each other, and rename the Series after the irreducible representations.
-            return self._CHARACTER_TABLE.loc[[arg1, arg2, *args]].product().rename(' × '.join(args))
+            rows = [self._irrep_index[irrep] for irrep in (arg1, arg2, *args)]
         except KeyError:
             print('The inputted irreducible representations do not exist in this character table. convolution in'
-                  f' this point group can be performed using any two or more of {self._CHARACTER_TABLE.index.values}.')
+                  f' this point group can be performed using any two or more of {self._irreps}.')
+        else:
+            # Multiply all the chosen row by each other, and name the Series after the irreducible representations.
+            return pd.Series(self._characters[rows].prod(axis=0), self._classes, name=' × '.join(args))
+
+    def product_decomposition(self, arg1: str, arg2: str, *args) -> np.ndarray:
+        """
+        Determines which irreducible representations make up the direct product of 2 or more irreducible
+        representations, using the precomputed product_table. Products of more than two irreducible representations are
+        obtained by folding the decomposition with the product_table one irreducible representation at a time.
+
+        :param arg1: = :param arg2: = :param args: any number of names of irreducible representations of the point group
+        :type arg1: str, a name of a irreducible representation of the point group
+        :type arg2: str, a name of a irreducible representation of the point group
+        :type args: zero or more strs
+
+        :return: The number of times each irreducible representation appears in the product.
+        :rtype: numpy.ndarray of ints
+        """
+        try:
+            rows = [self._irrep_index[irrep] for irrep in (arg1, arg2, *args)]
+        except KeyError:
+            print('The inputted irreducible representations do not exist in this character table. convolution in'
+                  f' this point group can be performed using any two or more of {self._irreps}.')
+        else:
+            appearances = self.product_table[rows[0], rows[1]]
+            for row in rows[2:]:
+                appearances = appearances @ self.product_table[:, row]
+            return appearances
 
     def match_representation(self, representation):
         """
@@ -196,91 +635,241 @@ class PointGroup:
             reduction formula.
         :return type: pandas.Series or pandas.DataFrame
         """
-        try:
-            # Check if the provided representation matches any of the irreducible representations:
-            if (self._CHARACTER_TABLE[1:] == representation).all(1).any():
-                # Find which rows it matches:
-                temp = (self._CHARACTER_TABLE[1:] == representation).all(1)
-                # Retreive the correct row from the character table:
-                return self._CHARACTER_TABLE.loc[temp[temp == True].index.values[0]]
-            # The provided representation is reducible:
-            else:
-                # Reduce the provided reducible representation:
-                result = self.reduction(representation)
-                return result.astype(int)
+        representation = np.asarray(representation)
+
         # If the length of the provided representation is not the same as the number of symmetry elements:
-        except ValueError:
+        if representation.shape != (len(self._classes),):
             print('MatchRepresentationError: The reducible representation must have '
                   'the same number of elements as a row of the character table')
+            return
+
+        # Check if the provided representation matches any of the irreducible representations:
+        try:
+            index = self._irrep_lookup.get(self._representation_keys(representation).tobytes())
+        except (TypeError, ValueError):  # Elements of unsupported dtypes, which will be reported by the reduction
+            index = None
+
+        if index is not None:
+            # Retrieve the correct row from the character table:
+            return self.character_table.loc[self._irreps[index]]
+        # The provided representation is reducible, so reduce it:
+        else:
+            return self.reduction(representation)
+
+    def match_many(self, representations) -> np.ndarray:
+        """
+        Matches many representations to the character table at once, determining which of them are irreducible.
+
+        :param representations: The representations to be matched with the character table. Each row is one
+            representation, and must have the same number of elements as a row of the character table.
+        :type representations: 2D array-like of ints or floats
+
+        :return: For each representation, the index of the irreducible representation it matches (in the order of the
+            irreps property), or -1 if it is reducible.
+        :rtype: numpy.ndarray of ints
+        """
+        representations = np.asarray(representations)
 
-    def show_matched_representation(self, representation):
+        if representations.ndim != 2 or representations.shape[1] != len(self._classes):
+            print('MatchRepresentationError: The representations must be a 2D array in which each row has the same '
+                  'number of elements as a row of the character table')
+            return
+
+        matches = self._representation_keys(representations)[:, np.newaxis] == self._irrep_keys
+        return np.where(matches.any(axis=1), matches.argmax(axis=1), -1)
+
+    def _representation_keys(self, representations) -> np.ndarray:
         """
-        Prints the results of matching the provided representation to the character table in a clear, user-friendly
-        format.
+        Creates a hashable key for each representation, by rounding it to MATCH_DECIMALS and viewing the row as a single
+        block of bytes, so that a whole representation can be compared or looked up at once.
+
+        :param representations: One representation, or many representations as rows.
+        :type representations: array-like of ints, floats or complex
+
+        :return: The key of each representation.
+        :rtype: numpy.ndarray of numpy.void
+        """
+        dtype = complex if np.iscomplexobj(self._characters) else float
+        # Adding 0 turns any -0.0 into 0.0, which would otherwise give a different key:
+        keys = np.ascontiguousarray(np.round(np.asarray(representations, dtype=dtype), MATCH_DECIMALS) + 0.0)
+        if not keys.shape[-1]:
+            # A table without any classes (eg. read from a malformed csv file) gives empty, and so equal, keys:
+            return np.zeros(keys.shape[:-1], dtype=np.dtype((np.void, 1)))
+        return keys.view(np.dtype((np.void, keys.itemsize * keys.shape[-1])))[..., 0]
+
+    def show_matched_representation(self, representation, verbose: bool = False) -> Decomposition:
+        """
+        Matches the provided representation to the character table, and gives the result in a form that can be shown in
+        a clear, user-friendly format.
 
         :param representation: The representaion to be matched with the character table. Must be the same length as
-            there are symmetry elements in the character table.
+            there are symmetry elements in the character table. If it is a Series, its name is used as the label of the
+            result.
         :type representation: array-like of ints or floats
+        :param verbose: If True, the result is also printed.
+        :type verbose: bool
 
-        :return: Either the row of the character table corresponding to the representation or the result of reduction
-            formula.
-        :return type: pandas.Series or pandas.DataFrame
-
+        :return: The irreducible representation matching the representation, or its constituent irreducible
+            representations if it is reducible.
+        :rtype: Decomposition
         """
-        # Match the representation to the character table:
-        result = self.match_representation(representation)
+        label = representation.name if isinstance(representation, pd.Series) else 'result'
+        representation = np.asarray(representation)
+
+        if representation.shape != (len(self._classes),):
+            print('MatchRepresentationError: The reducible representation must have '
+                  'the same number of elements as a row of the character table')
+            return
+
         try:
-            self.print_result(result, representation.name)  # Print neatly
-        except:
+            index = self._irrep_lookup.get(self._representation_keys(representation).tobytes())
+        except (TypeError, ValueError):  # Elements of unsupported dtypes, which will be reported by constituents
+            index = None
+
+        # An irreducible representation appears exactly once in itself:
+        if index is not None:
+            multiplicities = np.zeros(len(self._irreps), dtype=int)
+            multiplicities[index] = 1
+            result = Decomposition(multiplicities, self._irreps, label)
+        else:
+            result = self.constituents(representation)
+            if result is None:
+                return
+            result = Decomposition(result.multiplicities, result.irreps, label)
+
+        if verbose:
             self.print_result(result)
         return result
 
-    def print_result(self, df, left_hand_side='result'):
+    def print_result(self, df, left_hand_side: str = None):
         """
-        Prints the provided result in a user-friendly format.
+        Prints the provided result in a user-friendly format. Nothing else prints results, so this is the only place
+        where they are formatted.
 
         :param df: The result to be printed nicely. A DataFrame must have 'number of appearances' column, and Series
             must have a name.
-        :type df: pandas.DataFrame or pandas.Series
+        :type df: Decomposition or pandas.DataFrame or pandas.Series
 
         :param left_hand_side: A description of the result's meaning or a representation of the starting values.
-            eg. A1; A1 × B2
+            eg. A1; A1 × B2. Defaults to the label of a Decomposition, or to 'result'.
+        :type left_hand_side: str
 
-        :return: 'number of appearances' column if df is a DataFrame, df if df is a Series
-        :return type: pandas.DataFrame or pandas.Series
+        :return: df if df is a Decomposition or a Series, 'number of appearances' column if df is a DataFrame
+        :return type: Decomposition or pandas.Series
         """
+        if isinstance(df, Decomposition):
+            if left_hand_side is None or left_hand_side == df.label:
+                print(df)
+            else:
+                print(Decomposition(df.multiplicities, df.irreps, left_hand_side))
+            return df
+
+        left_hand_side = 'result' if left_hand_side is None else left_hand_side
         # If df is a DataFrame, print the result as sum of names of irreducible representations which have nonzero
         # value in the 'number of appearances' column.
         if isinstance(df, pd.DataFrame):
-            # Filter out the irreducible representations which don't appear in the reducible reprs, and display nicely:
-            to_print = [f'{i if i != 1 else ""}{j}' for i, j in zip(df['number of appearances'],
-                                                                    df.index.values) if i != 0]
-            print(left_hand_side, '=', '  +  '.join(to_print))
+            print(Decomposition(df['number of appearances'].to_numpy(), tuple(df.index.values), left_hand_side))
             return df['number of appearances']
         # If df is a Series, print its name as the result.
         elif isinstance(df, pd.Series):
-            print(left_hand_side, '=', df.name)
+            print(Decomposition(np.ones(1, dtype=int), (df.name,), left_hand_side))
             return df
 
-    def convolution_results(self, arg1: str, arg2: str, *args):
+    def convolution_results(self, arg1: str, arg2: str, *args, verbose: bool = False) -> Decomposition:
         """
-        Performs a convolution of 2 or more irreducible representations, matches the result to the character table,
-        and prints the result in a user-friendly format.
+        Performs a convolution of 2 or more irreducible representations and decomposes the result into irreducible
+        representations, using the precomputed product_table.
 
         :param arg1: Irreducible representation to be convoluted.
         :type arg1: str
         :param arg2: Irreducible representation to be convoluted.
-
         :type arg2: str
         :param args: Any number of additional irreducible representations to be convoluted.
+        :param verbose: If True, the result is also printed.
+        :type verbose: bool
 
-        :return: The result of matching the convolution result to the character table.
+        :return: The irreducible representations which make up the convolution, labelled with the convoluted ones.
+        :rtype: Decomposition
         """
-        # Obtain convolution results and match these to the character table:
-        result = self.match_representation(self.convolution(arg1, arg2, *args))
+        appearances = self.product_decomposition(arg1, arg2, *args)
+        if appearances is None:
+            return
 
         # User-friendly way to show which representations were convoluted:
-        left_hand_side = ' × '.join([arg1, arg2, *args])
-        self.print_result(result, left_hand_side)  # Print nicely
+        result = Decomposition(appearances, self._irreps, ' × '.join([arg1, arg2, *args]))
+        if verbose:
+            self.print_result(result)
         return result
 
+
+def get_point_group(point_group: str) -> PointGroup:
+    """
+    Returns a PointGroup object from a process-wide registry, so that each character table is only loaded once. Point
+    groups provided in the standard distribution are cached indefinitely. Point groups loaded from custom csv files are
+    kept in a bounded least-recently-used cache keyed by the path and the modification time of the file, so that an
+    edited file is loaded again.
+
+    The returned objects are shared by all callers, and so must be treated as read-only; in particular, the DataFrames
+    returned by their properties must not be modified in place.
+
+    :param point_group: Either the point group name, or the path to a csv file holding the character table data.
+    :type point_group: str
+
+    :return: The shared PointGroup object, or None if the csv file could not be found or read.
+    :rtype: PointGroup
+    """
+    if point_group in _shipped_point_group_names():
+        return _load_shipped_point_group(point_group)
+
+    path = os.path.abspath(point_group)
+    try:
+        modification_time = os.stat(path).st_mtime_ns
+    except OSError:
+        print(f'FileNotFoundError: Provided csv file could not be found at '
+              f'{os.path.join(CSV_DIRECTORY, f"{point_group}.csv")} or at {point_group}')
+    else:
+        try:
+            return _load_custom_point_group(path, modification_time)
+        except _LoadError:  # The error has already been printed
+            return None
+
+
+def point_group_cache_info() -> dict:
+    """
+    Shows the statistics of the registry used by get_point_group, eg. to confirm that the cache works under load.
+
+    :return: The numbers of hits, misses and cached point groups, separately for the point groups from the standard
+        distribution ('shipped') and from custom csv files ('custom').
+    :rtype: dict of functools._CacheInfo
+    """
+    return {'shipped': _load_shipped_point_group.cache_info(), 'custom': _load_custom_point_group.cache_info()}
+
+
+def clear_point_group_cache():
+    """Empties the registry used by get_point_group and resets its statistics."""
+    _load_shipped_point_group.cache_clear()
+    _load_custom_point_group.cache_clear()
+
+
+@functools.lru_cache(maxsize=None)
+def _shipped_point_group_names() -> frozenset:
+    """Names of the point groups whose csv files are provided in the standard distribution."""
+    return frozenset(os.path.splitext(file)[0] for file in os.listdir(CSV_DIRECTORY) if file.endswith('.csv'))
+
+
+@functools.lru_cache(maxsize=None)
+def _load_shipped_point_group(point_group: str) -> PointGroup:
+    """Creates the PointGroup object of a point group provided in the standard distribution."""
+    return PointGroup(point_group)
+
+
+@functools.lru_cache(maxsize=CUSTOM_CACHE_SIZE)
+def _load_custom_point_group(path: str, modification_time: int) -> PointGroup:
+    """
+    Creates the PointGroup object from a custom csv file. The modification time is only used as part of the key. If the
+    file cannot be read, an exception is raised instead of returning the incomplete object, so that it is not cached.
+    """
+    point_group = PointGroup(path)
+    if not hasattr(point_group, '_name'):
+        raise _LoadError(path)
+    return point_group
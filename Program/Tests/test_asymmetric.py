@@ -0,0 +1,79 @@
+import os
+
+import numpy as np
+
+from Program.Symmetry.MolParser import MolParser
+from Program.Symmetry.asymmetric import compress
+from Program.Symmetry.geometry import AtomMatcher, rotation_matrix
+from Program.Symmetry.operations import generate_group, generators
+from Program.Symmetry.symmetry import get_point_group
+
+MOLECULES = os.path.join(os.path.dirname(__file__), '..', 'Data', 'Molecules')
+
+
+def read(name):
+    with open(os.path.join(MOLECULES, f'{name}.mol')) as file:
+        return MolParser(list(file))
+
+
+def assert_same_molecule(expanded, molecule):
+    # The atoms of the expanded molecule are in a different order, so match them to the original atoms first:
+    matches = AtomMatcher(molecule.coordinates, molecule.atomic_numbers, 1e-3).match_points(expanded.coordinates,
+                                                                                             expanded.atomic_numbers)
+    assert expanded.natoms == molecule.natoms
+    assert sorted(matches) == list(range(molecule.natoms))
+
+    bonds = {tuple(bond) for bond in np.sort(matches[expanded.bond_atoms], axis=1)}
+    assert bonds == {tuple(bond) for bond in np.sort(molecule.bond_atoms, axis=1)}
+
+
+def test_methane_unit():
+    methane = read('291')
+    unit = compress(methane)
+    assert len(unit) == 2 and unit.natoms == 5
+    assert unit.point_group._name == 'Td'
+    assert sorted(unit.orbit_sizes.tolist()) == [1, 4]
+    assert len(unit.bond_atoms) == 1
+    assert_same_molecule(unit.expand(), methane)
+
+
+def test_water_unit():
+    water = read('937')
+    unit = compress(water)
+    assert len(unit) == 2
+    assert_same_molecule(unit.expand(), water)
+
+
+def test_benzene_unit():
+    angles = np.arange(6) * np.pi / 3
+    ring = np.column_stack((np.cos(angles), np.sin(angles), np.zeros(6)))
+    bonds = [[i, (i + 1) % 6] for i in range(6)] + [[i, i + 6] for i in range(6)]
+    benzene = MolParser.from_arrays(np.concatenate((1.4 * ring, 2.5 * ring)), [6] * 6 + [1] * 6, bonds)
+
+    unit = compress(benzene)
+    # One carbon and one hydrogen, and the C-C and C-H bonds:
+    assert len(unit) == 2 and len(unit.bond_atoms) == 2
+    assert_same_molecule(unit.expand(), benzene)
+
+
+def test_large_cluster_unit():
+    operations = generate_group(generators('Oh'))
+    rng = np.random.default_rng(0)
+    coordinates = np.einsum('hij,nj->hni', operations, 5 * rng.normal(size=(30, 3))).reshape(-1, 3)
+    atoms = np.arange(len(coordinates)).reshape(48, 30)
+    bonds = np.column_stack((atoms[:, :-1].ravel(), atoms[:, 1:].ravel()))
+
+    # Atoms on the C4 and C3 axes and on the mirror planes, and at the centre:
+    special = np.concatenate([np.einsum('hij,j->hi', operations, site) for site in ([3, 0, 0], [2, 2, 2], [2, 2, 0])])
+    special = np.concatenate((np.unique(np.round(special, 9), axis=0), [[0, 0, 0]]))
+    coordinates = np.concatenate((coordinates, special)) @ rotation_matrix([1, 2, 3], 0.7).T + [1, 2, 3]
+    cluster = MolParser.from_arrays(coordinates, [6] * 1440 + [7] * len(special), bonds)
+
+    unit = compress(cluster)
+    assert len(unit) == 34 and unit.natoms == cluster.natoms
+    assert sorted(unit.orbit_sizes.tolist())[:4] == [1, 6, 8, 12]
+    assert_same_molecule(unit.expand(), cluster)
+
+
+def test_unit_of_wrong_point_group():
+    assert compress(read('291'), get_point_group('C3v')) is None
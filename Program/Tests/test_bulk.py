@@ -0,0 +1,85 @@
+"""
+Unit tests for bulk.py.
+"""
+
+import os
+
+import pytest
+
+from Program.Symmetry.MolParser import CHIRALITY_CORRUPTED, CorruptedFileWarning
+from Program.Symmetry.bulk import parse_many
+
+MOLECULES = os.path.join(os.path.dirname(__file__), '..', 'Data', 'Molecules')
+
+
+def count_hydrogens(molecule):
+    return int((molecule.structure.index == 'H').sum())
+
+
+@pytest.fixture()
+def library(tmp_path):
+    with open(os.path.join(MOLECULES, '291.mol'), 'rb') as file:
+        methane = file.read()
+    with open(os.path.join(MOLECULES, '937.mol'), 'rb') as file:
+        water = file.read()
+    corrupted = water.replace(b'  3  2  0  0  0  0', b'  3  2  0  2  0  0')  # Chirality must be 0 or 1
+    path = tmp_path / 'library.sdf'
+    path.write_bytes((methane + water) * 5 + corrupted)
+    return str(path)
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_parse_many_ordered(library, workers):
+    records = list(parse_many(library, workers=workers, chunk_size=3))
+    assert [record.index for record in records] == list(range(11))
+    assert [record.molecule.natoms for record in records] == [5, 3] * 5 + [3]
+
+
+def test_parse_many_as_completed(library):
+    records = list(parse_many(library, workers=2, chunk_size=2, ordered=False))
+    assert sorted(record.index for record in records) == list(range(11))
+
+
+def test_parse_many_many_files(library):
+    records = list(parse_many([library, os.path.join(MOLECULES, '937.mol')], workers=1))
+    assert [record.path for record in records[-2:]] == [library, os.path.join(MOLECULES, '937.mol')]
+    assert records[-1].index == 0
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_parse_many_warnings_kept_per_record(library, workers):
+    records = list(parse_many(library, workers=workers, chunk_size=4))
+    assert all(record.warnings == () for record in records[:-1])
+    assert isinstance(records[-1].warnings, tuple) and len(records[-1].warnings) == 1
+    assert isinstance(records[-1].warnings[0], CorruptedFileWarning)
+    assert records[-1].molecule.chiral is None
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_parse_many_not_strict_keeps_diagnostics(library, workers):
+    records = list(parse_many(library, workers=workers, chunk_size=4, strict=False))
+    assert all(record.warnings == () and len(record.diagnostics) == 0 for record in records[:-1])
+    assert records[-1].diagnostics[['record', 'code']].tolist() == [(10, CHIRALITY_CORRUPTED)]
+    assert records[-1].molecule.chiral is None
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_parse_many_function(library, workers):
+    records = parse_many(library, workers=workers, function=count_hydrogens)
+    assert [record.value for record in records] == [4, 2] * 5 + [2]
+
+
+def test_parse_many_error_kept_per_record(tmp_path):
+    path = tmp_path / 'broken.sdf'
+    path.write_bytes(b'broken\n\n\n$$$$\n' + open(os.path.join(MOLECULES, '937.mol'), 'rb').read())
+    records = list(parse_many(str(path), workers=1))
+    assert not records[0].ok and records[0].molecule is None
+    assert records[1].ok and records[1].molecule.natoms == 3
+
+
+def test_parse_many_throughput(library):
+    results = parse_many(library, workers=1)
+    assert results.throughput == 0
+    list(results)
+    assert results.count == 11
+    assert results.throughput > 0
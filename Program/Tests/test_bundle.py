@@ -0,0 +1,111 @@
+"""
+Unit tests for bundle.py.
+"""
+
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from Program.Data import bundle as bundle_module
+from Program.Data.bundle import CSV_DIRECTORY, CharacterTableBundle, StaleBundleWarning, build_bundle, load_bundle
+from Program.Symmetry.symmetry import PointGroup
+
+
+@pytest.fixture()
+def csv_directory(tmp_path):
+    directory = tmp_path / 'CSV'
+    directory.mkdir()
+    for point_group in ('Cs', 'C6v', 'Td'):
+        shutil.copy(os.path.join(CSV_DIRECTORY, f'{point_group}.csv'), directory)
+    return str(directory)
+
+
+@pytest.fixture()
+def bundle(csv_directory, tmp_path):
+    path = str(tmp_path / 'tables.bin')
+    build_bundle(csv_directory, path)
+    return CharacterTableBundle(path)
+
+
+def test_build_bundle_stores_all_csv_files(bundle):
+    assert sorted(bundle.point_groups) == ['C6v', 'Cs', 'Td']
+
+
+@pytest.mark.parametrize('point_group', ['Cs', 'C6v', 'Td'])
+def test_full_character_table_same_as_csv(bundle, csv_directory, point_group):
+    expected = pd.read_csv(os.path.join(csv_directory, f'{point_group}.csv'), index_col=0, sep=';')
+    result = bundle.full_character_table(point_group)
+    assert result.equals(expected)
+    assert (result.dtypes == expected.dtypes).all()
+    assert result.index.tolist() == expected.index.tolist()
+
+
+def test_arrays_are_read_only_views_of_bundle(bundle):
+    class_orders, characters = bundle.arrays('Td')
+    assert class_orders.tolist() == [1, 8, 3, 6, 6]
+    assert characters.dtype == np.int8
+    assert not characters.flags.owndata
+    assert not characters.flags.writeable
+
+
+def test_is_stale_detects_changed_csv(bundle, csv_directory):
+    assert bundle.is_stale('Td', csv_directory) is False
+    with open(os.path.join(csv_directory, 'Td.csv'), 'a') as file:
+        file.write('\n')
+    assert bundle.is_stale('Td', csv_directory) is True
+
+
+def test_is_stale_reads_csv_once_until_changed(bundle, csv_directory, monkeypatch):
+    checksums = []
+    monkeypatch.setattr(bundle_module, '_checksum', lambda contents: checksums.append(contents) or 'changed')
+    bundle_module._file_checksum.cache_clear()
+
+    assert bundle.is_stale('Td', csv_directory) is True
+    assert bundle.is_stale('Td', csv_directory) is True
+    assert len(checksums) == 1
+
+    with open(os.path.join(csv_directory, 'Td.csv'), 'a') as file:
+        file.write('\n')
+    bundle.is_stale('Td', csv_directory)
+    assert len(checksums) == 2
+    bundle_module._file_checksum.cache_clear()
+
+
+def test_load_bundle_missing_file_returns_none(tmp_path):
+    assert load_bundle(str(tmp_path / 'missing.bin')) is None
+
+
+def test_build_bundle_of_all_shipped_csv_files(tmp_path):
+    path = str(tmp_path / 'tables.bin')
+    build_bundle(CSV_DIRECTORY, path)
+    bundle = CharacterTableBundle(path)
+    assert sorted(bundle.point_groups) == sorted(i[:-4] for i in os.listdir(CSV_DIRECTORY) if i.endswith('.csv'))
+    for point_group in bundle.point_groups:
+        expected = pd.read_csv(os.path.join(CSV_DIRECTORY, f'{point_group}.csv'), index_col=0, sep=';')
+        assert bundle.full_character_table(point_group).equals(expected)
+        assert not bundle.is_stale(point_group)
+
+
+def test_shipped_bundle_up_to_date():
+    bundle = load_bundle()
+    assert sorted(bundle.point_groups) == sorted(i[:-4] for i in os.listdir(CSV_DIRECTORY) if i.endswith('.csv'))
+    assert not any(bundle.is_stale(point_group) for point_group in bundle.point_groups)
+
+
+def test_point_group_loaded_from_bundle_same_as_from_csv():
+    from_bundle = PointGroup('Td')
+    from_csv = PointGroup(pd.read_csv(os.path.join(CSV_DIRECTORY, 'Td.csv'), index_col=0, sep=';'))
+    assert from_bundle._full_character_table is None
+    assert from_bundle.full_character_table.equals(from_csv.full_character_table)
+    assert from_bundle.character_table.equals(from_csv.character_table)
+    assert (from_bundle._characters == from_csv._characters).all()
+
+
+def test_point_group_stale_bundle_falls_back_to_csv(monkeypatch):
+    monkeypatch.setattr(CharacterTableBundle, 'is_stale', lambda self, point_group: True)
+    with pytest.warns(StaleBundleWarning):
+        td = PointGroup('Td')
+    assert td._full_character_table is not None
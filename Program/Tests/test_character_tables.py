@@ -0,0 +1,46 @@
+"""
+Unit tests for character_tables.py.
+"""
+
+import pytest
+
+from Program.Data import character_tables
+
+
+@pytest.fixture()
+def no_tables(monkeypatch):
+    monkeypatch.setattr(character_tables, '_tables', {})
+
+
+def test_tables_created_on_first_access(no_tables):
+    assert character_tables._tables == {}
+    td = character_tables.character_tables['Td']
+    assert list(character_tables._tables) == ['Td']
+    assert td is character_tables.character_tables['Td']
+
+
+def test_module_attribute_shares_table_with_mapping(no_tables):
+    assert character_tables.Td is character_tables.character_tables['Td']
+
+
+def test_mapping_lists_point_groups_without_creating_tables(no_tables):
+    assert 'Oh' in character_tables.character_tables
+    assert len(character_tables.character_tables) == 17
+    assert character_tables._tables == {}
+
+
+@pytest.mark.parametrize('point_group', list(character_tables.character_tables))
+def test_mapping_returns_table_of_point_group(point_group):
+    table = character_tables.character_tables[point_group]
+    assert table.index[0] == point_group
+    assert table is getattr(character_tables, point_group)
+
+
+def test_mapping_unsupported_point_group_raises_keyerror():
+    with pytest.raises(KeyError):
+        character_tables.character_tables['gg']
+
+
+def test_module_unknown_attribute_raises_attributeerror():
+    with pytest.raises(AttributeError):
+        character_tables.gg
@@ -0,0 +1,79 @@
+import os
+
+import numpy as np
+import pytest
+
+from Program.Symmetry.MolParser import MolParser
+from Program.Symmetry.bulk import parse_many
+from Program.Symmetry.fingerprint import DIGEST_SIZE, fingerprint
+from Program.Symmetry.geometry import rotation_matrix
+
+MOLECULES = os.path.join(os.path.dirname(__file__), '..', 'Data', 'Molecules')
+
+
+def read(name):
+    with open(os.path.join(MOLECULES, f'{name}.mol')) as file:
+        return MolParser(list(file))
+
+
+def moved(molecule, seed=0):
+    # The same molecule, rotated, translated and with its atoms in a different order:
+    order = np.random.default_rng(seed).permutation(molecule.natoms)
+    coordinates = molecule.coordinates[order] @ rotation_matrix([1, 2, 3], 0.7).T + [5, -2, 1]
+    return MolParser.from_arrays(coordinates, molecule.atomic_numbers[order], np.argsort(order)[molecule.bond_atoms],
+                                 molecule.bond_orders)
+
+
+@pytest.mark.parametrize('name', ['291', '937'])
+@pytest.mark.parametrize('symmetry', [True, False])
+def test_fingerprint_invariant(name, symmetry):
+    molecule = read(name)
+    assert len(fingerprint(molecule, symmetry=symmetry)) == DIGEST_SIZE
+    assert fingerprint(moved(molecule), symmetry=symmetry) == fingerprint(molecule, symmetry=symmetry)
+
+
+def test_fingerprint_different_molecules():
+    methane, water = read('291'), read('937')
+    assert fingerprint(methane) != fingerprint(water)
+
+    # The same atoms, without bonds or slightly stretched:
+    unbonded = MolParser.from_arrays(methane.coordinates, methane.atomic_numbers)
+    stretched = MolParser.from_arrays(methane.coordinates * 1.05, methane.atomic_numbers, methane.bond_atoms)
+    assert len({fingerprint(methane), fingerprint(unbonded), fingerprint(stretched)}) == 3
+
+
+def test_fingerprint_tolerance():
+    methane = read('291')
+    coordinates = methane.coordinates.copy()
+    coordinates[1] += 1e-3
+    noisy = MolParser.from_arrays(coordinates, methane.atomic_numbers, methane.bond_atoms, methane.bond_orders)
+    assert fingerprint(noisy, tolerance=0.1) == fingerprint(methane, tolerance=0.1)
+    assert fingerprint(noisy, tolerance=1e-5, symmetry=False) != fingerprint(methane, tolerance=1e-5, symmetry=False)
+
+
+def test_fingerprint_cached_until_atoms_change():
+    methane = read('291')
+    first = fingerprint(methane)
+    assert fingerprint(methane) is first
+
+    methane.coordinates[0] += 1
+    assert fingerprint(methane) != first
+
+
+def test_fingerprint_large_molecule():
+    coordinates = np.random.default_rng(1).normal(size=(1200, 3)) * 10
+    molecule = MolParser.from_arrays(coordinates, np.full(1200, 6))
+    order = np.random.default_rng(2).permutation(1200)
+    shuffled = MolParser.from_arrays(coordinates[order] @ rotation_matrix([0, 1, 1], 2.0).T, np.full(1200, 6))
+    assert fingerprint(shuffled, symmetry=False) == fingerprint(molecule, symmetry=False)
+
+
+def test_deduplicate_library(tmp_path):
+    path = tmp_path / 'library.sdf'
+    path.write_bytes(b''.join(open(os.path.join(MOLECULES, f'{name}.mol'), 'rb').read()
+                              for name in ['291', '937', '291', '291', '937']))
+    records = list(parse_many(str(path), workers=1, function=fingerprint))
+    unique = {}
+    for record in records:
+        unique.setdefault(record.value, record.index)
+    assert sorted(unique.values()) == [0, 1]
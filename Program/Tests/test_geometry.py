@@ -0,0 +1,37 @@
+import numpy as np
+
+from Program.Symmetry.geometry import INVERSION, AtomMatcher, improper_rotation_matrix, reflection_matrix, \
+    rotation_matrix
+
+
+def test_operation_matrices():
+    assert np.allclose(rotation_matrix([0, 0, 2], np.pi / 2) @ [1, 0, 0], [0, 1, 0])
+    assert np.allclose(reflection_matrix([0, 0, 1]) @ [1, 2, 3], [1, 2, -3])
+    assert np.allclose(improper_rotation_matrix([0, 0, 1], np.pi), INVERSION)
+
+
+def test_atom_matcher():
+    coordinates = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0], [1, 1, 0.0]])
+    matcher = AtomMatcher(coordinates, np.array([6, 1, 1, 6]), 0.01)
+
+    assert matcher.match_points(coordinates + 0.004).tolist() == [0, 1, 2, 3]
+    assert matcher.match_points(coordinates + 0.02).tolist() == [-1, -1, -1, -1]
+    assert matcher.match_points(coordinates[[1, 2]], np.array([6, 1])).tolist() == [-1, 2]
+
+    assert matcher.permutation(reflection_matrix([1, -1, 0])).tolist() == [0, 2, 1, 3]
+    assert not matcher.is_symmetry(INVERSION)
+
+
+def test_atom_matcher_points_on_cell_faces():
+    # The point ± the tolerance lands exactly on the faces of the cells, which must not stop it matching the atom:
+    matcher = AtomMatcher(np.array([[0, -1.9500000000000002, -2.06e-16]]), np.array([9]), 0.01)
+    assert matcher.match_points(np.array([[5.7e-16, -1.9500000000000002, 2.06e-16]])).tolist() == [0]
+
+    # Atoms on and next to the faces of the cells, and points near them in all directions:
+    rng = np.random.default_rng(0)
+    coordinates = np.round(rng.uniform(-1, 1, size=(500, 3)) / 0.02) * 0.02 + rng.choice([0, 1e-16, -1e-16], (500, 3))
+    coordinates = np.unique(np.round(coordinates, 2), axis=0) + rng.choice([0, 1e-16, -1e-16], (1, 3))
+    matcher = AtomMatcher(coordinates, np.zeros(len(coordinates), dtype=int), 0.01)
+    offsets = rng.normal(size=coordinates.shape)
+    offsets *= 0.0099 * rng.uniform(size=(len(coordinates), 1)) / np.linalg.norm(offsets, axis=1)[:, None]
+    assert matcher.match_points(coordinates + offsets).tolist() == list(range(len(coordinates)))
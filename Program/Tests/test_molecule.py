@@ -1,8 +1,13 @@
+import mmap
+import os
+import pathlib
+
 import numpy as np
 import pandas as pd
 import pytest
 
-from Program.Symmetry.MolParser import MolParser, CorruptedFileWarning
+from Program.Symmetry.MolParser import MolParser, CorruptedFileWarning, ATOMS_CORRUPTED, BONDS_CORRUPTED, \
+    CHIRALITY_CORRUPTED, COUNTS_CORRUPTED, NATOMS_ESTIMATED, NATOMS_UNKNOWN, NBONDS_ESTIMATED
 
 
 ############################################################################################
@@ -106,6 +111,21 @@ def test_init_bonds(water, correct_bonds):
     assert (water.bonds.index == correct_bonds.index).all()
 
 
+def test_init_data(water):
+    assert water.data['StdInChI'] == 'InChI=1S/H2O/h1H2'
+    assert water.data['Formula'] == 'H2 O'
+    assert list(water.data) == ['StdInChI', 'StdInChIKey', 'AuxInfo', 'Formula', 'Mw', 'SMILES', 'CSID']
+
+
+def test_init_data_without_data_items():
+    water_mol = ['962\n', '  Marvin  12300703363D          \n', '\n', '  3  2  0  0  0  0            999 V2000\n',
+                 '   -0.2309   -0.3265    0.0000 O   0  0  0  0  0  0  0  0  0  0  0  0\n',
+                 '    0.7484   -0.2843    0.0000 H   0  0  0  0  0  0  0  0  0  0  0  0\n',
+                 '   -0.5175    0.6108    0.0000 H   0  0  0  0  0  0  0  0  0  0  0  0\n',
+                 '  1  2  1  0  0  0  0\n', '  1  3  1  0  0  0  0\n', 'M  END\n']
+    assert MolParser(water_mol).data == {}
+
+
 # NUMBER OF ATOMS BROKEN
 def test_init_faulty_input_non_numeric_natoms_correct_warnings(corrupted_natoms):
     with pytest.warns(CorruptedFileWarning) as record:
@@ -192,3 +212,279 @@ def test_init_faulty_input_non_numeric_values_bonds_block_handled():
                  '\n', '> <CSID>\n', '937\n', '\n', '$$$$\n']
     with pytest.warns(CorruptedFileWarning, match='The bonds of the molecule could not'):
         MolParser(water_mol)
+
+
+# NOT STRICT
+@pytest.mark.parametrize('to_bytes', [False, True])
+def test_init_not_strict_natoms_recorded_without_warnings(corrupted_natoms, to_bytes, recwarn):
+    mol = ''.join(corrupted_natoms).encode() if to_bytes else corrupted_natoms
+    water = MolParser(mol, strict=False)
+    assert len(recwarn) == 0
+    assert water.natoms == 3 and water.nbonds == 2
+    assert water.diagnostics['code'].tolist() == [COUNTS_CORRUPTED, NATOMS_ESTIMATED]
+    assert water.diagnostics['line'].tolist() == [3, 3]
+    assert water.diagnostics['field'].tolist() == ['natoms', 'natoms']
+
+
+@pytest.mark.parametrize('to_bytes', [False, True])
+def test_init_not_strict_same_as_strict(corrupted_nbonds, to_bytes):
+    mol = ''.join(corrupted_nbonds).encode() if to_bytes else corrupted_nbonds
+    with pytest.warns(CorruptedFileWarning):
+        strict = MolParser(mol)
+    water = MolParser(mol, strict=False)
+    assert water.nbonds == strict.nbonds == 2
+    assert water.structure.equals(strict.structure)
+    assert water.bonds.equals(strict.bonds)
+    assert water.diagnostics['code'].tolist() == strict.diagnostics['code'].tolist() == [COUNTS_CORRUPTED,
+                                                                                         NBONDS_ESTIMATED]
+
+
+def test_init_not_strict_chirality(corrupted_chirality, recwarn):
+    water = MolParser(corrupted_chirality, strict=False)
+    assert len(recwarn) == 0
+    assert water.chiral is None
+    assert water.diagnostics[['line', 'field', 'code']].tolist() == [(3, 'chiral', CHIRALITY_CORRUPTED)]
+
+
+def test_init_not_strict_atoms_and_bonds_blocks(water, recwarn):
+    water_mol = ['962\n', '  Marvin  12300703363D          \n', '\n', '  3  2  0  0  0  0            999 V2000\n',
+                 '   -0.2309   -0.3265    0.0000 O   0  0  0  0  0  0  0  0  0  0  0  0\n',
+                 '    0.7484   -0.2843    X H   0  0  0  0  0  0  0  0  0  0  0  0\n',
+                 '   -0.5175    0.6108    0.0000 H   0  0  0  0  0  0  0  0  0  0  0  0\n',
+                 '  1  2  1  0  0  0  0\n', '  1  3  X  0  0  0  0\n', 'M  END\n']
+    molecule = MolParser(water_mol, strict=False)
+    assert len(recwarn) == 0
+    assert molecule.diagnostics[['line', 'code']].tolist() == [(5, ATOMS_CORRUPTED), (8, BONDS_CORRUPTED)]
+    assert len(water.diagnostics) == 0
+
+
+def test_init_not_strict_natoms_unknown():
+    water_mol = ['962\n', '  Marvin  12300703363D          \n', '\n', '  X  0  0  0  0  0            999 V2000\n',
+                 '   -0.2309   -0.3265    0.0000 O   0  0  0  0  0  0  0  0  0  0  0  0\n',
+                 '    0.7484   -0.2843    0.0000 H   0  0  0  0  0  0  0  0  0  0  0  0\n', 'M  END\n']
+    with pytest.raises(CorruptedFileWarning, match=r'because the provided data contains a full stop \("\."\)'):
+        MolParser(water_mol[:-1])
+    water = MolParser(water_mol[:-1], strict=False)
+    assert water.natoms == 2
+    assert water.diagnostics['code'].tolist()[:2] == [COUNTS_CORRUPTED, NATOMS_UNKNOWN]
+
+
+# FIXED-WIDTH PARSING
+def test_init_structure_with_windows_line_endings(water, correct_structure, correct_bonds):
+    water_mol = ['962\r\n', '  Marvin  12300703363D          \r\n', '\r\n',
+                 '  3  2  0  0  0  0            999 V2000\r\n',
+                 '   -0.2309   -0.3265    0.0000 O   0  0  0  0  0  0  0  0  0  0  0  0\r\n',
+                 '    0.7484   -0.2843    0.0000 H   0  0  0  0  0  0  0  0  0  0  0  0\r\n',
+                 '   -0.5175    0.6108    0.0000 H   0  0  0  0  0  0  0  0  0  0  0  0\r\n',
+                 '  1  2  1  0\r\n', '  1  3  1  0\r\n', 'M  END\r\n']
+    water = MolParser(water_mol)
+    assert water.structure.equals(correct_structure)
+    assert (water.bonds.to_numpy() == correct_bonds.to_numpy()).all()
+    assert (water.bonds.index == correct_bonds.index).all()
+
+
+def test_init_misaligned_atoms_block_parsed_line_by_line(correct_structure):
+    water_mol = ['962\n', '  Marvin  12300703363D          \n', '\n', '  3  2  0  0  0  0            999 V2000\n',
+                 '   -0.2309   -0.3265    0.0 O   0  0  0  0  0  0  0  0  0  0  0  0\n',
+                 '    0.7484   -0.2843    0.0000 H   0  0  0  0  0  0  0  0  0  0  0  0\n',
+                 '   -0.5175    0.6108    0.0000 H   0  0  0  0  0  0  0  0  0  0  0  0\n',
+                 '  1  2  1  0  0  0  0\n', '  1  3  1  0  0  0  0\n', 'M  END\n']
+    water = MolParser(water_mol)
+    assert water.structure.equals(correct_structure)
+
+
+def test_init_bonds_with_adjacent_atom_numbers():
+    mol = ['chain\n', '\n', '\n', '100 99  0  0  0  0            999 V2000\n']
+    mol += [f'{i:10.4f}    0.0000    0.0000 C   0  0  0  0  0  0  0  0  0  0  0  0\n' for i in range(100)]
+    mol += [f'{i:>3}{i + 1:>3}  1  0  0  0  0\n' for i in range(1, 100)]
+    mol += ['M  END\n']
+    chain = MolParser(mol)
+    assert chain.structure['x'].tolist() == list(range(100))
+    assert chain.bonds.iloc[-1].tolist() == [99, 100, 1, 0]  # ie. ' 99100  1  0'
+    assert (chain.bonds.index == 'C-C').all()
+
+
+# COMPACT REPRESENTATION
+def test_arrays(water):
+    assert water.coordinates.dtype == np.float64 and water.coordinates.shape == (3, 3)
+    assert water.atomic_numbers.dtype == np.uint8 and water.atomic_numbers.tolist() == [8, 1, 1]
+    assert water.bond_atoms.dtype == np.int32 and water.bond_atoms.tolist() == [[0, 1], [0, 2]]
+    assert water.bond_orders.dtype == np.int8 and water.bond_orders.tolist() == [1, 1]
+    assert water.symbols.tolist() == ['O', 'H', 'H']
+
+
+def test_dataframes_created_lazily(water, correct_structure):
+    assert water._structure is None and water._bonds is None
+    assert water.structure.equals(correct_structure)
+    assert water.structure is water.structure
+
+
+def test_no_instance_dict(water):
+    assert not hasattr(water, '__dict__')
+
+
+def test_symbols_which_are_not_elements_kept():
+    mol = ['962\n', '\n', '\n', '  2  1  0  0  0  0            999 V2000\n',
+           '    0.0000    0.0000    0.0000 C   0  0  0  0  0  0  0  0  0  0  0  0\n',
+           '    1.0000    0.0000    0.0000 R   0  0  0  0  0  0  0  0  0  0  0  0\n',
+           '  1  2  1  0  0  0  0\n', 'M  END\n']
+    molecule = MolParser(mol)
+    assert molecule.atomic_numbers.tolist() == [6, 0]
+    assert molecule.structure.index.tolist() == ['C', 'R']
+    assert molecule.bonds.index.tolist() == ['C-R']
+
+
+def test_from_arrays(correct_structure, correct_bonds):
+    water = MolParser.from_arrays(correct_structure.to_numpy(), [8, 1, 1], [[0, 1], [0, 2]], data={'CSID': '937'})
+    assert water.natoms == 3 and water.nbonds == 2
+    assert water.structure.equals(correct_structure)
+    assert (water.bonds.to_numpy() == correct_bonds.to_numpy()).all()
+    assert (water.bonds.index == correct_bonds.index).all()
+    assert water.data == {'CSID': '937'}
+
+
+def test_from_arrays_without_bonds():
+    helium = MolParser.from_arrays([[0, 0, 0]], [2])
+    assert helium.nbonds == 0
+    assert helium.bonds.empty
+
+
+def test_from_arrays_wrong_shape_raises():
+    with pytest.raises(ValueError):
+        MolParser.from_arrays([[0, 0, 0], [1, 0, 0]], [8])
+
+
+# V3000
+@pytest.fixture()
+def water_v3000():
+    return ['962\n', '  Marvin  12300703363D          \n', '\n', '  0  0  0     0  0            999 V3000\n',
+            'M  V30 BEGIN CTAB\n', 'M  V30 COUNTS 3 2 0 0 0\n', 'M  V30 BEGIN ATOM\n',
+            'M  V30 1 O -0.2309 -0.3265 0 0\n', 'M  V30 2 H 0.7484 -0.2843 0 0\n', 'M  V30 3 H -0.5175 0.6108 0 0\n',
+            'M  V30 END ATOM\n', 'M  V30 BEGIN BOND\n', 'M  V30 1 1 1 2\n', 'M  V30 2 1 1 3\n', 'M  V30 END BOND\n',
+            'M  V30 END CTAB\n', 'M  END\n', '> <CSID>\n', '937\n', '\n', '$$$$\n']
+
+
+def test_v3000(water_v3000, correct_structure, correct_bonds):
+    water = MolParser(water_v3000)
+    assert water.natoms == 3 and water.nbonds == 2 and water.chiral is False
+    assert water.structure.equals(correct_structure)
+    assert water.bonds.equals(correct_bonds)
+    assert water.data == {'CSID': '937'}
+
+
+def test_v3000_same_as_v2000(water, water_v3000):
+    molecule = MolParser(water_v3000)
+    assert np.array_equal(molecule.coordinates, water.coordinates)
+    assert np.array_equal(molecule.atomic_numbers, water.atomic_numbers)
+    assert np.array_equal(molecule.bond_atoms, water.bond_atoms)
+
+
+def test_v3000_continuation_lines_and_properties(water_v3000, correct_structure):
+    water_v3000[13] = 'M  V30 2 1 1 3 CFG=3\n'
+    water_v3000[7:10] = ['M  V30 1 O -0.2309 -0.3265 0 0 -\n', 'M  V30 CHG=0\n', 'M  V30 2 H 0.7484 -\n',
+                         'M  V30 -0.2843 0 0\n', 'M  V30 3 "H" -0.5175 0.6108 0 0 MASS=2\n']
+    water_v3000[5] = 'M  V30 COUNTS 3 2 0 0 1\n'
+    water = MolParser(water_v3000)
+    assert water.structure.equals(correct_structure)
+    assert water.bonds['Stereochemistry'].tolist() == [0, 6]
+    assert water.chiral is True
+
+
+def test_v3000_atom_indices_not_in_order(water_v3000):
+    water_v3000[7:10] = ['M  V30 10 O -0.2309 -0.3265 0 0\n', 'M  V30 7 H 0.7484 -0.2843 0 0\n',
+                         'M  V30 12 H -0.5175 0.6108 0 0\n']
+    water_v3000[12:14] = ['M  V30 1 1 10 7\n', 'M  V30 2 1 12 10\n']
+    assert MolParser(water_v3000).bond_atoms.tolist() == [[0, 1], [2, 0]]
+
+
+def test_v3000_wrong_counts(water_v3000, correct_structure):
+    water_v3000[5] = 'M  V30 COUNTS 2 1 0 0 0\n'
+    with pytest.warns(CorruptedFileWarning, match='COUNTS line gives 2 atoms and 1 bonds'):
+        water = MolParser(water_v3000)
+    assert water.natoms == 3 and water.nbonds == 2
+    assert water.structure.equals(correct_structure)
+
+
+def test_v3000_non_numeric_coordinates(water_v3000):
+    water_v3000[8] = 'M  V30 2 H X -0.2843 0 0\n'
+    with pytest.warns(CorruptedFileWarning, match='line 2 of the atoms block'):
+        water = MolParser(water_v3000)
+    assert water.nbonds == 2
+
+
+def test_v3000_large_molecule():
+    # V2000 cannot hold more than 999 atoms:
+    coordinates = np.arange(4500).reshape(-1, 3) / 10
+    mol = ['large\n', '\n', '\n', '  0  0  0     0  0            999 V3000\n', 'M  V30 BEGIN CTAB\n',
+           'M  V30 COUNTS 1500 1499 0 0 0\n', 'M  V30 BEGIN ATOM\n']
+    mol += [f'M  V30 {i + 1} C {x:.4f} {y:.4f} {z:.4f} 0\n' for i, (x, y, z) in enumerate(coordinates)]
+    mol += ['M  V30 END ATOM\n', 'M  V30 BEGIN BOND\n']
+    mol += [f'M  V30 {i} 1 {i} {i + 1}\n' for i in range(1, 1500)]
+    mol += ['M  V30 END BOND\n', 'M  V30 END CTAB\n', 'M  END\n']
+
+    molecule = MolParser(mol)
+    assert molecule.natoms == 1500 and molecule.nbonds == 1499
+    assert np.array_equal(molecule.coordinates, coordinates)
+    assert molecule.bond_atoms[-1].tolist() == [1498, 1499]
+
+
+# INPUT FROM FILES AND BUFFERS
+WATER_FILE = os.path.join(os.path.dirname(__file__), '..', 'Data', 'Molecules', '937.mol')
+
+
+def assert_same_molecule(molecule, expected):
+    assert molecule.natoms == expected.natoms and molecule.nbonds == expected.nbonds
+    assert molecule.structure.equals(expected.structure)
+    assert molecule.bonds.equals(expected.bonds)
+    assert molecule.data == expected.data
+
+
+@pytest.fixture()
+def water_file():
+    with open(WATER_FILE) as file:
+        return MolParser(list(file))
+
+
+def test_init_shipped_molecule_by_name(water_file):
+    assert_same_molecule(MolParser('937'), water_file)
+
+
+@pytest.mark.parametrize('path', [WATER_FILE, pathlib.Path(WATER_FILE)])
+def test_init_path(path, water_file):
+    assert_same_molecule(MolParser(path), water_file)
+
+
+def test_init_missing_file(capsys):
+    MolParser('no_such_molecule')
+    assert 'FileNotFoundError' in capsys.readouterr().out
+
+
+@pytest.mark.parametrize('wrap', [bytes, bytearray, memoryview, lambda data: data.decode()])
+def test_init_buffer(wrap, water_file):
+    with open(WATER_FILE, 'rb') as file:
+        data = file.read()
+    assert_same_molecule(MolParser(wrap(data)), water_file)
+
+
+def test_init_mmap(water_file):
+    with open(WATER_FILE, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        molecule = MolParser(buffer)
+    assert_same_molecule(molecule, water_file)
+
+
+def test_init_buffer_same_as_lines(water, correct_structure):
+    lines = ['962\r\n', '\r\n', '\r\n', '  3  2  0  0  0  0            999 V2000\r\n',
+             '   -0.2309   -0.3265    0.0000 O   0  0  0  0  0  0  0  0  0  0  0  0\r\n',
+             '    0.7484   -0.2843    0.0000 H   0  0  0  0  0  0  0  0  0  0  0  0\r\n',
+             '   -0.5175    0.6108    0.0 H   0  0  0  0  0  0  0  0  0  0  0  0\r\n',  # Parsed by tokens
+             '  1  2  1  0\r\n', '  1  3  1  0\r\n', 'M  END']
+    molecule = MolParser(''.join(lines).encode())
+    assert molecule.structure.equals(correct_structure)
+    assert np.array_equal(molecule.bond_atoms, water.bond_atoms)
+
+
+def test_init_v3000_buffer(water_v3000, correct_structure, correct_bonds):
+    water = MolParser(''.join(water_v3000).encode())
+    assert water.structure.equals(correct_structure)
+    assert water.bonds.equals(correct_bonds)
+    assert water.data == {'CSID': '937'}
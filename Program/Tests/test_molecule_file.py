@@ -1,8 +1,8 @@
 import numpy as np
 
-from Program.Symmetry.MolParser import Molecule
+from Program.Symmetry.MolParser import MolParser
 
 
 def test_init_water():
-    water = Molecule('937')
+    water = MolParser('937')
     assert water._natoms == 3
\ No newline at end of file
@@ -0,0 +1,28 @@
+import numpy as np
+import pytest
+
+from Program.Symmetry.operations import OperationError, conjugacy_classes, generate_group, generators, \
+    multiplication_table
+
+
+@pytest.mark.parametrize('name, order, n_classes', [('C1', 1, 1), ('Cs', 2, 2), ('C3v', 6, 3), ('S4', 4, 4),
+                                                    ('D5d', 20, 8), ('Th', 24, 8), ('Oh', 48, 10)])
+def test_generate_group(name, order, n_classes):
+    operations = generate_group(generators(name))
+    assert len(operations) == order
+    assert np.allclose(operations[0], np.eye(3))
+    assert len(conjugacy_classes(operations)) == n_classes
+
+
+def test_generators_of_unknown_point_group_raise():
+    with pytest.raises(OperationError):
+        generators('Ih')
+
+
+def test_multiplication_table():
+    operations = generate_group(generators('D3h'))
+    table = multiplication_table(operations)
+    assert np.allclose(operations[table], np.einsum('aij,bjk->abik', operations, operations))
+    # Each operation appears once in each row and column of the table:
+    assert (np.sort(table, axis=0) == np.arange(len(operations))[:, None]).all()
+    assert (np.sort(table, axis=1) == np.arange(len(operations))).all()
@@ -0,0 +1,175 @@
+"""
+Unit tests for perception.py.
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+from Program.Symmetry import perception
+from Program.Symmetry.MolParser import MolParser
+from Program.Symmetry.geometry import INVERSION, AtomMatcher, reflection_matrix, rotation_matrix
+from Program.Symmetry.operations import generate_group, generators
+from Program.Symmetry.perception import DEFAULT_TOLERANCE, find_point_group, perceive_symmetry
+
+MOLECULES = os.path.join(os.path.dirname(__file__), '..', 'Data', 'Molecules')
+
+# An arbitrary rotation and translation, so that the molecules are not given in their standard frame:
+ROTATION = rotation_matrix([0.3, -0.5, 0.8], 1.234)
+TRANSLATION = np.array([3.0, -1.0, 2.0])
+
+
+def read(name):
+    with open(os.path.join(MOLECULES, f'{name}.mol')) as file:
+        return MolParser(list(file))
+
+
+def molecule(coordinates, atomic_numbers):
+    return MolParser.from_arrays(np.array(coordinates, dtype=float) @ ROTATION.T + TRANSLATION, atomic_numbers)
+
+
+def ring(n, radius, height=0.0, offset=0.0):
+    angles = np.arange(n) * 2 * np.pi / n + offset
+    return np.column_stack((radius * np.cos(angles), radius * np.sin(angles), np.full(n, height)))
+
+
+def test_methane_is_td():
+    symmetry = perceive_symmetry(read('291'))
+    assert symmetry.name == 'Td'
+    assert find_point_group(read('291'))._name == 'Td'
+
+
+def test_water_is_c2v():
+    water = read('937')
+    symmetry = perceive_symmetry(water)
+    assert symmetry.name == 'C2v'
+    assert find_point_group(water)._name == 'C2v'
+
+    # The molecule lies in the yz plane, with the z axis along the C2 axis:
+    coordinates = symmetry.to_standard_frame(water.coordinates)
+    assert np.allclose(coordinates[:, 0], 0, atol=1e-3)
+    assert abs(coordinates[0, 1]) < 1e-3
+
+
+@pytest.mark.parametrize('name, coordinates, atomic_numbers', [
+    ('C3v', [[0, 0, 0.1], [1, 0, -0.3], [-0.5, 0.866025, -0.3], [-0.5, -0.866025, -0.3]], [7, 1, 1, 1]),
+    ('D6h', np.concatenate((ring(6, 1.4), ring(6, 2.5))), [6] * 6 + [1] * 6),
+    ('Oh', [[0, 0, 0], [1, 0, 0], [-1, 0, 0], [0, 1, 0], [0, -1, 0], [0, 0, 1], [0, 0, -1]], [16] + [9] * 6),
+    ('D2h', [[0, 0, 0.67], [0, 0, -0.67], [0, 0.92, 1.23], [0, -0.92, 1.23], [0, 0.92, -1.23], [0, -0.92, -1.23]],
+     [6, 6, 1, 1, 1, 1]),
+    ('D2d', [[0, 0, 0], [0, 0, 1.3], [0, 0, -1.3], [0.93, 0, 1.85], [-0.93, 0, 1.85], [0, 0.93, -1.85],
+             [0, -0.93, -1.85]], [6] * 3 + [1] * 4),
+    ('D3h', np.concatenate(([[0, 0, 0], [0, 0, 1.6], [0, 0, -1.6]], ring(3, 1.5))), [15] + [9] * 5),
+    ('D5d', np.concatenate(([[0, 0, 0]], ring(5, 1.2, 1.65), ring(5, 1.2, -1.65, np.pi / 5))), [26] + [6] * 10),
+    ('C2h', [[0.6, 0, 0], [-0.6, 0, 0], [1, 1, 0], [-1, -1, 0]], [7, 7, 9, 9]),
+    ('C2', [[0.7, 0, 0], [-0.7, 0, 0], [0.9, 0.9, 0.2], [-0.9, -0.9, 0.2]], [8, 8, 1, 1]),
+    ('Cs', [[0, 0, 0], [1, 1, 1], [1, -1, -1], [-1, 1, -1], [-1, -1, 1]], [6, 1, 1, 9, 17]),
+    ('C1', [[0, 0, 0], [1, 1, 1], [1, -1, -1], [-1, 1, -1], [-1, -1, 1]], [6, 1, 9, 17, 35]),
+    ('D∞h', [[0, 0, 0], [0, 0, 1.16], [0, 0, -1.16]], [6, 8, 8]),
+    ('C∞v', [[0, 0, 0], [0, 0, 1.06], [0, 0, -1.15]], [6, 1, 7]),
+])
+def test_perceive_symmetry(name, coordinates, atomic_numbers):
+    symmetry = perceive_symmetry(molecule(coordinates, atomic_numbers))
+    assert symmetry.name == name
+    assert np.allclose(symmetry.axes @ symmetry.axes.T, np.eye(3))
+    assert np.isclose(np.linalg.det(symmetry.axes), 1)
+
+
+def test_perceive_symmetry_tolerance():
+    # Ammonia with one hydrogen moved by 0.005 Angstrom:
+    coordinates = [[0, 0, 0.1], [1.005, 0, -0.3], [-0.5, 0.866025, -0.3], [-0.5, -0.866025, -0.3]]
+    assert perceive_symmetry(molecule(coordinates, [7, 1, 1, 1])).name == 'C3v'
+    assert perceive_symmetry(molecule(coordinates, [7, 1, 1, 1]), tolerance=0.001).name == 'Cs'
+
+
+NOISY_CUBIC_MOLECULES = [
+    ('Td', [[0, 0, 0], [0.629, 0.629, 0.629], [0.629, -0.629, -0.629], [-0.629, 0.629, -0.629],
+            [-0.629, -0.629, 0.629]], [6, 1, 1, 1, 1]),
+    ('Oh', [[0, 0, 0], [2, 0, 0], [-2, 0, 0], [0, 2, 0], [0, -2, 0], [0, 0, 2], [0, 0, -2]], [16] + [9] * 6),
+]
+SUBGROUPS = {
+    'Td': {'Td', 'T', 'D2d', 'C3v', 'S4', 'D2', 'C2v', 'C3', 'C2', 'Cs', 'C1'},
+    'Oh': {'Oh', 'O', 'Td', 'Th', 'T', 'D4h', 'D4', 'C4v', 'C4h', 'D2d', 'S4', 'C4', 'D3d', 'D3', 'C3v', 'S6', 'C3',
+           'D2h', 'D2', 'C2v', 'C2h', 'C2', 'Cs', 'Ci', 'C1'},
+}
+
+
+def noisy(coordinates, atomic_numbers, seed, smallest, largest):
+    # Every atom moved in a random direction by between smallest and largest Angstrom:
+    rng = np.random.default_rng(seed)
+    noise = rng.normal(size=(len(atomic_numbers), 3))
+    noise *= rng.uniform(smallest, largest, size=(len(noise), 1)) / np.linalg.norm(noise, axis=1)[:, None]
+    return molecule(np.array(coordinates) + noise, atomic_numbers)
+
+
+@pytest.mark.parametrize('name, coordinates, atomic_numbers', NOISY_CUBIC_MOLECULES)
+def test_perceive_symmetry_of_slightly_noisy_cubic_molecule(name, coordinates, atomic_numbers):
+    # Moved by so little that all operations of the point group are still symmetries to within the tolerance:
+    for seed in range(15):
+        assert perceive_symmetry(noisy(coordinates, atomic_numbers, seed, 0.001, 0.002)).name == name
+
+
+@pytest.mark.parametrize('name, coordinates, atomic_numbers', NOISY_CUBIC_MOLECULES)
+def test_perceive_symmetry_of_noisy_cubic_molecule(name, coordinates, atomic_numbers):
+    # Moved by 0.0043-0.0064 Angstrom, so that some of the axes of the cubic point group are symmetries to within the
+    # tolerance and others are not. The point group found must be a subgroup of the cubic one, and each of its
+    # operations, as a product of at most two operations found to within the tolerance, a symmetry to within twice it:
+    for seed in range(15):
+        noisy_molecule = noisy(coordinates, atomic_numbers, seed, 0.0043, 0.0064)
+        symmetry = perceive_symmetry(noisy_molecule)
+        assert symmetry.name in SUBGROUPS[name]
+
+        coordinates_in_frame = symmetry.to_standard_frame(noisy_molecule.coordinates)
+        matcher = AtomMatcher(coordinates_in_frame, noisy_molecule.atomic_numbers, 2 * DEFAULT_TOLERANCE)
+        assert all(matcher.is_symmetry(operation) for operation in generate_group(generators(symmetry.name)))
+
+
+def test_perceive_symmetry_of_large_molecule():
+    # Thousands of atoms related by the operations of D6h (generated by C6, C2' and σh):
+    generators = [rotation_matrix([0, 0, 1], np.pi / 3), rotation_matrix([1, 0, 0], np.pi), reflection_matrix([0, 0, 1])]
+    operations = [np.eye(3)]
+    for operation in operations:
+        for generator in generators:
+            product = generator @ operation
+            if not any(np.allclose(product, other) for other in operations):
+                operations.append(product)
+    assert len(operations) == 24
+
+    points = np.random.default_rng(0).normal(size=(200, 3)) * 5
+    coordinates = np.concatenate([points @ operation.T for operation in operations])
+    assert perceive_symmetry(molecule(coordinates, np.tile(np.arange(1, 201) % 8 + 1, 24))).name == 'D6h'
+
+
+@pytest.fixture()
+def icosahedral_cage():
+    # 120 equivalent atoms, more than MAX_SPHERICAL_CANDIDATES:
+    golden = (1 + 5 ** 0.5) / 2
+    operations = generate_group([rotation_matrix([0, 1, golden], 2 * np.pi / 5),
+                                 rotation_matrix([1, 1, 1], 2 * np.pi / 3), INVERSION])
+    return molecule(operations @ [1.0, 0.3, 2.1], [6] * 120)
+
+
+def test_perceive_symmetry_of_large_spherical_top(icosahedral_cage, recwarn):
+    assert perceive_symmetry(icosahedral_cage).name == 'Ih'
+    assert len(recwarn) == 0
+
+
+def test_perceive_symmetry_of_large_spherical_top_warns_if_axes_missed(icosahedral_cage, monkeypatch):
+    monkeypatch.setattr(perception, 'MAX_SPHERICAL_CANDIDATES', 2)
+    with pytest.warns(UserWarning, match='may be too low'):
+        assert perceive_symmetry(icosahedral_cage).name != 'Ih'
+
+
+def test_find_point_group_not_provided(capsys):
+    assert find_point_group(molecule([[0, 0, 0], [0, 0, 1.16], [0, 0, -1.16]], [6, 8, 8])) is None
+    assert 'PointGroupError' in capsys.readouterr().out
+
+
+
+@pytest.mark.parametrize('name, problem', [('C6v', 'character table of C8v'), ('D2h', 'no characters')])
+def test_find_point_group_with_malformed_shipped_csv(name, problem, capsys):
+    # C6v.csv holds the character table of C8v, and D2h.csv no numeric columns:
+    assert perception._shipped_point_group(name) is None
+    out = capsys.readouterr().out
+    assert 'PointGroupError' in out and problem in out and 'not provided' not in out
@@ -0,0 +1,129 @@
+import os
+
+import numpy as np
+import pytest
+
+from Program.Symmetry.MolParser import MolParser
+from Program.Symmetry.asymmetric import compress
+from Program.Symmetry.geometry import rotation_matrix
+from Program.Symmetry.perception import DEFAULT_TOLERANCE, Symmetry
+from Program.Symmetry.representations import bond_representation, cartesian_representation, equivalent_atoms, \
+    permutation_table, standard_frame, unmoved_atoms, vibrational_representation
+from Program.Symmetry.symmetry import get_point_group
+
+MOLECULES = os.path.join(os.path.dirname(__file__), '..', 'Data', 'Molecules')
+
+
+def read(name):
+    with open(os.path.join(MOLECULES, f'{name}.mol')) as file:
+        return MolParser(list(file))
+
+
+@pytest.fixture()
+def benzene():
+    angles = np.arange(6) * np.pi / 3
+    ring = np.column_stack((np.cos(angles), np.sin(angles), np.zeros(6)))
+    bonds = [[i, (i + 1) % 6] for i in range(6)] + [[i, i + 6] for i in range(6)]
+    return MolParser.from_arrays(np.concatenate((1.4 * ring, 2.5 * ring)), [6] * 6 + [1] * 6, bonds)
+
+
+def test_methane_representations():
+    methane = read('291')
+    assert unmoved_atoms(methane).tolist() == [5, 2, 1, 1, 3]
+    assert cartesian_representation(methane).tolist() == [15, 0, -1, -1, 3]
+    assert bond_representation(methane).tolist() == [4, 1, 0, 0, 2]
+
+    td = get_point_group('Td')
+    assert str(td.constituents(vibrational_representation(methane))) == 'result = A1  +  E  +  2T2'
+    assert str(td.constituents(bond_representation(methane))) == 'result = A1  +  T2'
+
+
+def test_water_representations():
+    water = read('937')
+    assert cartesian_representation(water, get_point_group('C2v')).tolist() == [9, -1, 1, 3]
+    assert str(get_point_group('C2v').constituents(vibrational_representation(water))) == 'result = 2A1  +  B2'
+
+
+def test_xef4_vibrations():
+    # D4h, which has two classes of C2 axes and two classes of vertical mirror planes:
+    xef4 = MolParser.from_arrays([[0, 0, 0], [2, 0, 0], [-2, 0, 0], [0, 2, 0], [0, -2, 0]], [54, 9, 9, 9, 9])
+    assert cartesian_representation(xef4).tolist() == [15, 1, -1, -3, -1, -3, -1, 5, 3, 1]
+    assert str(get_point_group('D4h').constituents(vibrational_representation(xef4))) == \
+        'result = A1g  +  B1g  +  B2g  +  A2u  +  B2u  +  2Eu'
+
+
+
+def test_xef4_vibrations_in_any_orientation():
+    # Rotated atoms which lie exactly on the faces of the cells of the AtomMatcher in the standard frame:
+    xef4 = np.array([[0, 0, 0], [1.95, 0, 0], [-1.95, 0, 0], [0, 1.95, 0], [0, -1.95, 0]])
+    rng = np.random.default_rng(0)
+    for _ in range(40):
+        q, r = np.linalg.qr(rng.normal(size=(3, 3)))
+        rotated = MolParser.from_arrays(xef4 @ (q * np.sign(np.diag(r))).T, [54, 9, 9, 9, 9])
+        assert (permutation_table(rotated) != -1).all()
+        assert vibrational_representation(rotated).tolist() == [9, -1, 1, -1, 1, -3, -1, 5, 3, 1]
+
+
+def test_benzene_vibrations(benzene):
+    d6h = get_point_group('D6h')
+    assert str(d6h.constituents(vibrational_representation(benzene))) == \
+        'result = 2A1g  +  A2g  +  2B2g  +  E1g  +  4E2g  +  A2u  +  2B1u  +  2B2u  +  3E1u  +  2E2u'
+
+    # The C-H stretching vibrations:
+    assert str(d6h.constituents(bond_representation(benzene, bonds=benzene.bonds.index == 'C-H'))) == \
+        'result = A1g  +  E2g  +  B1u  +  E1u'
+
+    # The C-C stretching vibrations, where the C''2 axes and σd planes pass through the middles of the bonds:
+    assert bond_representation(benzene, bonds=np.arange(6)).tolist() == [6, 0, 0, 0, 0, 2, 0, 0, 0, 6, 2, 0]
+    assert str(d6h.constituents(bond_representation(benzene, bonds=np.arange(6)))) == \
+        'result = A1g  +  E2g  +  B2u  +  E1u'
+
+
+def test_wrong_point_group(capsys):
+    assert cartesian_representation(read('937'), get_point_group('Td')) is None
+    assert 'PointGroupError' in capsys.readouterr().out
+
+
+
+def test_operations_which_do_not_permute_the_atoms(capsys):
+    # Methane with a cached frame whose axes are not the standard axes of Td, so the operations do not match the atoms:
+    methane = read('291')
+    frame = standard_frame(methane)
+    methane._derived_results()['symmetry', DEFAULT_TOLERANCE] = Symmetry('Td', frame.centre, rotation_matrix(
+        [1, 2, 3], 0.3) @ frame.axes, DEFAULT_TOLERANCE)
+    assert permutation_table(methane) is None
+    assert equivalent_atoms(methane) is None
+    assert cartesian_representation(methane) is None
+    assert compress(methane) is None
+    assert capsys.readouterr().out.count('PointGroupError') == 4
+
+def test_permutation_table():
+    methane = read('291')
+    td = get_point_group('Td')
+    table = permutation_table(methane, td)
+    assert table.shape == (24, 5)
+    assert table.dtype == np.int32
+    assert (table[:, 0] == 0).all()  # The carbon atom is never moved
+    assert (np.sort(table, axis=1) == np.arange(5)).all()
+    assert (table[0] == np.arange(5)).all()  # The identity
+
+
+def test_permutation_table_is_cached_until_atoms_change(capsys):
+    methane = read('291')
+    td = get_point_group('Td')
+    table = permutation_table(methane, td)
+    assert permutation_table(methane, td) is table
+    assert not table.flags.writeable
+
+    # Moving an atom in place breaks the symmetry:
+    methane.coordinates[1] += 0.5
+    assert permutation_table(methane, td) is None
+    assert 'PointGroupError' in capsys.readouterr().out
+
+    methane.coordinates[1] -= 0.5
+    assert (permutation_table(methane, td) == table).all()
+
+
+def test_equivalent_atoms(benzene):
+    assert equivalent_atoms(read('291')).tolist() == [0, 1, 1, 1, 1]
+    assert equivalent_atoms(benzene).tolist() == [0] * 6 + [6] * 6
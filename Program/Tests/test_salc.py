@@ -0,0 +1,73 @@
+import os
+
+import numpy as np
+import pytest
+
+from Program.Symmetry.MolParser import MolParser
+from Program.Symmetry.salc import AtomicBasis, BasisError
+from Program.Symmetry.symmetry import get_point_group
+
+MOLECULES = os.path.join(os.path.dirname(__file__), '..', 'Data', 'Molecules')
+
+
+def read(name):
+    with open(os.path.join(MOLECULES, f'{name}.mol')) as file:
+        return MolParser(list(file))
+
+
+@pytest.fixture()
+def methane():
+    return read('291')
+
+
+def test_basis_labels(methane):
+    basis = AtomicBasis(methane, 's', methane.symbols == 'H')
+    assert basis.size == 4
+    assert basis.labels == ['H2 s', 'H3 s', 'H4 s', 'H5 s']
+    assert AtomicBasis(methane, 'p', [0]).labels == ['C1 px', 'C1 py', 'C1 pz']
+
+
+def test_project_hydrogen_s_functions_of_methane(methane):
+    td = get_point_group('Td')
+    basis = AtomicBasis(methane, 's', methane.symbols == 'H')
+
+    assert np.allclose(td.project('A1', basis), [[0.5, 0.5, 0.5, 0.5]])
+    assert td.project('E', basis).shape == (0, 4)
+
+    t2 = td.project('T2', basis)
+    assert t2.shape == (3, 4)
+    assert np.allclose(t2 @ t2.T, np.eye(3))
+    assert np.allclose(t2.sum(axis=1), 0)  # Orthogonal to the A1 combination
+
+
+def test_project_all_spans_the_basis(methane):
+    td = get_point_group('Td')
+    salcs = td.project_all(AtomicBasis(methane, 'p'))
+
+    # Γ_3N of methane is A1 + E + T1 + 3T2:
+    assert {irrep: len(salc) for irrep, salc in salcs.items()} == {'A1': 1, 'A2': 0, 'E': 2, 'T1': 3, 'T2': 9}
+    combinations = np.concatenate(list(salcs.values()))
+    assert np.allclose(combinations @ combinations.T, np.eye(15))
+
+
+def test_project_water():
+    water = read('937')
+    c2v = get_point_group('C2v')
+    assert np.allclose(c2v.project('B2', AtomicBasis(water, 's', water.symbols == 'H')), [[2 ** -0.5, -2 ** -0.5]])
+    assert {irrep: len(salc) for irrep, salc in c2v.project_all(AtomicBasis(water, 'p')).items()} == \
+        {'A1': 3, 'A2': 1, 'B1': 2, 'B2': 3}
+
+
+def test_project_wrong_irrep_handled(methane, capsys):
+    assert get_point_group('Td').project('B1', AtomicBasis(methane)) is None
+    assert 'does not exist' in capsys.readouterr().out
+
+
+def test_basis_not_closed_under_operations_raises(methane):
+    with pytest.raises(BasisError):
+        get_point_group('Td').project('A1', AtomicBasis(methane, 's', [1, 2]))
+
+
+def test_unknown_basis_kind_raises(methane):
+    with pytest.raises(BasisError):
+        AtomicBasis(methane, 'd')
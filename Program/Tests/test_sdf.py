@@ -0,0 +1,85 @@
+import os
+
+import numpy as np
+import pytest
+
+from Program.Symmetry.sdf import SDFile, iter_sdf
+
+MOLECULES = os.path.join(os.path.dirname(__file__), '..', 'Data', 'Molecules')
+
+
+@pytest.fixture()
+def sd_file(tmp_path):
+    # Three records: methane, water, and methane again without the final delimiter.
+    records = []
+    for name in ['291', '937', '291']:
+        with open(os.path.join(MOLECULES, f'{name}.mol'), 'rb') as file:
+            records.append(file.read())
+    path = tmp_path / 'library.sdf'
+    path.write_bytes(b''.join(records).rsplit(b'$$$$', 1)[0])
+    return str(path)
+
+
+def test_iter_sdf_reads_all_records(sd_file):
+    molecules = list(iter_sdf(sd_file))
+    assert [molecule.natoms for molecule in molecules] == [5, 3, 5]
+    assert molecules[1].structure.index.tolist() == ['O', 'H', 'H']
+
+
+def test_iter_sdf_data_items(sd_file):
+    water = list(iter_sdf(sd_file))[1]
+    assert water.data['StdInChI'] == 'InChI=1S/H2O/h1H2'
+    assert water.data['StdInChIKey'] == 'XLYOFNOQVPJJNP-UHFFFAOYSA-N'
+    assert water.data['CSID'] == '937'
+    assert len(water.data) == 7
+
+
+def test_iter_sdf_is_lazy(sd_file):
+    records = iter_sdf(sd_file)
+    assert next(records).data['CSID'] == '291'
+
+
+def test_iter_sdf_start(sd_file):
+    assert [molecule.data['CSID'] for molecule in iter_sdf(sd_file, start=1)] == ['937', '291']
+    assert list(iter_sdf(sd_file, start=3)) == []
+
+
+def test_sdfile_offsets(sd_file):
+    with open(sd_file, 'rb') as file:
+        contents = file.read()
+    offsets = SDFile(sd_file).offsets
+    assert len(offsets) == 3
+    assert offsets[0] == 0
+    assert all(contents[offset:].startswith(b'29') or contents[offset:].startswith(b'962') for offset in offsets)
+
+
+def test_sdfile_getitem(sd_file):
+    sd = SDFile(sd_file)
+    assert len(sd) == 3
+    assert sd[1].data['CSID'] == '937'
+    assert sd[-1].natoms == 5
+    assert np.array_equal(sd[2].structure.to_numpy(), sd[0].structure.to_numpy())
+
+
+def test_sdfile_getitem_out_of_range(sd_file):
+    with pytest.raises(IndexError):
+        SDFile(sd_file)[3]
+
+
+def test_sdfile_empty(tmp_path):
+    path = tmp_path / 'empty.sdf'
+    path.write_bytes(b'')
+    assert len(SDFile(str(path))) == 0
+    assert list(iter_sdf(str(path))) == []
+
+
+
+def test_sdfile_blank_records_skipped(tmp_path):
+    with open(os.path.join(MOLECULES, '937.mol'), 'rb') as file:
+        water = file.read()
+    path = tmp_path / 'blank.sdf'
+    path.write_bytes(b'$$$$\n' + water + b'\n$$$$\n' + water + b'\n\n')
+    sd = SDFile(str(path))
+    assert len(sd) == 2
+    assert [molecule.natoms for molecule in sd] == [3, 3]
+    assert sd[1].data['CSID'] == '937'
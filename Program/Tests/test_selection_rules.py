@@ -0,0 +1,63 @@
+"""
+Unit tests for selection_rules.py.
+"""
+
+import numpy as np
+import pytest
+
+from Program.Symmetry.selection_rules import SelectionRules
+from Program.Symmetry.symmetry import PointGroup
+
+
+@pytest.fixture()
+def c2v():
+    return SelectionRules(PointGroup('C2v'))
+
+
+@pytest.fixture()
+def td():
+    return SelectionRules(PointGroup('Td'))
+
+
+def test_functions_parsed_from_character_table(td):
+    assert td.function_irreps('x', 'y', 'z').tolist() == [4]
+    assert td.function_irreps('R_x').tolist() == [3]
+    assert td.function_irreps('x^2-y^2', '2z^2-x^2-y^2').tolist() == [2]
+
+
+def test_unknown_function_has_no_irreps(td):
+    assert td.function_irreps('gg').tolist() == []
+
+
+def test_ir_active(td):
+    assert td.active('dipole').tolist() == [False, False, False, False, True]
+
+
+def test_raman_active(td):
+    assert td.active('polarizability').tolist() == [True, False, True, False, True]
+
+
+def test_operators_masks(c2v):
+    assert c2v.operators['rotation'].tolist() == [False, True, True, True]
+
+
+def test_allowed_with_names(c2v):
+    result = c2v.allowed(['A1', 'A2', 'B1'], ['B1', 'A2', 'B2'])
+    assert result.tolist() == [True, True, False]
+
+
+def test_allowed_broadcasts_indices(c2v):
+    result = c2v.allowed(np.array([[0], [1]]), np.arange(4))
+    assert result.tolist() == [[True, False, True, True], [False, True, True, True]]
+
+
+def test_allowed_matches_triple_product(td):
+    point_group = PointGroup('Td')
+    for initial in point_group.irreps:
+        for final in point_group.irreps:
+            expected = point_group.product_decomposition(initial, 'T2', final)[0] > 0
+            assert td.allowed(initial, final) == expected
+
+
+def test_count_active(c2v):
+    assert c2v.count_active([[1, 0, 1, 1], [0, 1, 0, 0]]).tolist() == [3, 0]
@@ -0,0 +1,65 @@
+import os
+
+import numpy as np
+
+from Program.Symmetry.MolParser import MolParser
+from Program.Symmetry.perception import perceive_symmetry
+from Program.Symmetry.representations import permutation_table, standard_frame
+from Program.Symmetry.symmetrisation import symmetrise
+from Program.Symmetry.symmetry import get_point_group
+
+MOLECULES = os.path.join(os.path.dirname(__file__), '..', 'Data', 'Molecules')
+
+
+def read(name):
+    with open(os.path.join(MOLECULES, f'{name}.mol')) as file:
+        return MolParser(list(file))
+
+
+def test_symmetrised_methane_exactly_symmetric():
+    methane = read('291')
+    assert perceive_symmetry(methane, 1e-6).name != 'Td'
+
+    symmetrised, rms_displacement = symmetrise(methane)
+    assert 0 < rms_displacement < 1e-4
+    assert perceive_symmetry(symmetrised, 1e-8).name == 'Td'
+
+    # Each operation moves each atom exactly onto the atom given by the permutation table:
+    symmetry = standard_frame(symmetrised)
+    coordinates = symmetry.to_standard_frame(symmetrised.coordinates)
+    point_group = symmetry.point_group
+    moved = np.einsum('hij,nj->hni', point_group.operations, coordinates)
+    assert np.allclose(moved, coordinates[permutation_table(symmetrised)], atol=1e-12)
+
+
+def test_symmetrised_molecule_keeps_atoms_bonds_and_data():
+    water = read('937')
+    symmetrised, rms_displacement = symmetrise(water)
+    assert symmetrised is not water
+    assert (symmetrised.symbols == water.symbols).all()
+    assert (symmetrised.bond_atoms == water.bond_atoms).all()
+    assert symmetrised.data == water.data
+    assert np.isclose(np.sqrt(((symmetrised.coordinates - water.coordinates) ** 2).sum(axis=1).mean()),
+                      rms_displacement)
+
+
+def test_symmetrise_noisy_geometry():
+    methane = read('291')
+    symmetrised = symmetrise(methane)[0]
+    noise = np.random.default_rng(1).normal(scale=2e-3, size=(5, 3))
+    noisy = MolParser.from_arrays(symmetrised.coordinates + noise, methane.atomic_numbers, methane.bond_atoms)
+
+    restored, rms_displacement = symmetrise(noisy, tolerance=0.05)
+    assert 1e-4 < rms_displacement < 4e-3
+    assert perceive_symmetry(restored, 1e-8).name == 'Td'
+
+
+def test_symmetry_cached_on_symmetrised_molecule():
+    symmetrised = symmetrise(read('291'))[0]
+    assert standard_frame(symmetrised).name == 'Td'
+    assert not permutation_table(symmetrised).flags.writeable
+
+
+def test_symmetrise_wrong_point_group(capsys):
+    assert symmetrise(read('937'), get_point_group('D3h')) is None
+    assert 'PointGroupError' in capsys.readouterr().out
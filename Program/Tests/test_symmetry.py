@@ -2,10 +2,13 @@
 Unit tests for symmetry.py.
 """
 
+import numpy as np
 import pytest
 import pandas as pd
 
-from Program.Symmetry.symmetry import PointGroup
+from Program.Symmetry.operations import OperationError
+from Program.Symmetry.results import Decomposition
+from Program.Symmetry.symmetry import PointGroup, ReductionError
 
 
 @pytest.fixture()
@@ -30,6 +33,17 @@ def c2v():
     return C2v
 
 
+@pytest.fixture()
+def c3():
+    epsilon = np.exp(2j * np.pi / 3)
+    C3 = pd.DataFrame([[1, 1, 1],
+                       [1, 1, 1],
+                       [1, epsilon, epsilon.conjugate()],
+                       [1, epsilon.conjugate(), epsilon]])
+    C3.index = ['C3', 'A', 'Ea', 'Eb']
+    return PointGroup(C3)
+
+
 @pytest.fixture()
 def point_group(c2v):
     C2v = PointGroup(c2v)
@@ -106,6 +120,24 @@ def test_no_overwrite_full_character_table(point_group, c2v):
         point_group.full_character_table = c2v
 
 
+def test_compiled_character_table(point_group):
+    assert point_group._characters.tolist() == [[1, 1, 1, 1], [1, 1, -1, -1], [1, -1, 1, -1], [1, -1, -1, 1]]
+    assert point_group._class_orders.tolist() == [1, 1, 1, 1]
+    assert point_group._group_order == 4
+    assert point_group._irrep_index == {'A1': 0, 'A2': 1, 'B1': 2, 'B2': 3}
+
+
+def test_compiled_character_table_is_read_only(point_group):
+    with pytest.raises(ValueError):
+        point_group._characters[0, 0] = 2
+
+
+def test_compiled_character_table_keeps_irrational_characters():
+    d4d = PointGroup('D4d')
+    assert d4d._characters.dtype == float
+    assert d4d._characters[4, 1] == pytest.approx(2 ** 0.5)
+
+
 def test_reduction_correct(point_group):
     result = point_group.reduction([4, 0, 4, 0])
     expected = pd.DataFrame([[4, 0, 4, 0],
@@ -132,17 +164,114 @@ def test_reduction_with_str_input_handled(point_group, capsys):
     assert 'The reducible representation contains elements of unsupported dtypes.' == captured.out[:69]
 
 
+def test_reduction_non_integer_multiplicity_raises(point_group):
+    with pytest.raises(ReductionError):
+        point_group.reduction([1, 0, 0, 0])
+
+
+def test_reduction_with_integral_floats_is_exact(point_group):
+    result = point_group.reduction([4.0, 0.0, 4.0, 0.0])
+    assert result['number of appearances'].tolist() == [2, 0, 2, 0]
+
+
+def test_reduction_as_array_same_as_frame(point_group, c3):
+    for group, representation in ((point_group, [4, 0, 4, 0]), (c3, [2, -1, -1])):
+        result = group.reduction(representation, as_frame=False)
+        assert isinstance(result, np.ndarray)
+        assert (result == group.reduction(representation).to_numpy()).all()
+
+
+def test_reduction_with_irrational_characters():
+    d4d = PointGroup('D4d')
+    representation = d4d._characters[4] + 2 * d4d._characters[0]  # 2A1 + E1
+    assert d4d.reduction(representation)['number of appearances'].tolist() == [2, 0, 0, 0, 1, 0, 0]
+
+
+def test_reduction_with_complex_characters(c3):
+    result = c3.reduction([2, -1, -1])
+    assert result['number of appearances'].tolist() == [0, 1, 1]
+
+
+def test_reduce_many_with_complex_characters(c3):
+    assert c3.reduce_many([[3, 0, 0], [1, 1, 1]]).tolist() == [[1, 1, 1], [1, 0, 0]]
+
+
+def test_reduce_many_non_integer_multiplicity_raises(point_group):
+    with pytest.raises(ReductionError, match='row 1'):
+        point_group.reduce_many([[4, 0, 4, 0], [3, 0, 0, 0]])
+
+
+def test_reduce_many_matches_reduction(point_group):
+    representations = [[4, 0, 4, 0], [2, 2, 2, 2], [3, -1, 1, 1]]
+    result = point_group.reduce_many(representations)
+    for representation, row in zip(representations, result):
+        assert row.tolist() == point_group.reduction(representation)['number of appearances'].tolist()
+
+
+def test_reduce_many_as_frame(point_group):
+    result = point_group.reduce_many([[4, 0, 4, 0], [2, 2, 2, 2]], as_frame=True)
+    assert result.columns.tolist() == ['A1', 'A2', 'B1', 'B2']
+    assert result.values.tolist() == [[2, 0, 2, 0], [2, 0, 0, 0]]
+
+
+def test_reduce_many_with_wrong_number_of_elements_handled(point_group, capsys):
+    point_group.reduce_many([[4, 0, 4, 0, 5]])
+    captured = capsys.readouterr()
+    assert 'ReductionError: The reducible representations must be a 2D array' == captured.out[:64]
+
+
 def test_constituents_returns_correctly(point_group):
     result = point_group.constituents([4, 0, 4, 0])
-    assert result.tolist() == [2, 0, 2, 0]
+    assert result.multiplicities.tolist() == [2, 0, 2, 0]
+    assert result.to_series().tolist() == [2, 0, 2, 0]
 
 
 def test_constituents_prints_correctly(point_group, capsys):
-    point_group.constituents([4, 0, 4, 0])
+    point_group.constituents([4, 0, 4, 0], verbose=True)
     captured = capsys.readouterr()
     assert captured.out[:20] == 'result = 2A1  +  2B1'
 
 
+def test_constituents_silent_by_default(point_group, capsys):
+    result = point_group.constituents([4, 0, 4, 0])
+    captured = capsys.readouterr()
+    assert captured.out == ''
+    assert str(result) == 'result = 2A1  +  2B1'
+
+
+def test_decomposition_label_read_only(point_group):
+    result = point_group.constituents([4, 0, 4, 0])
+    assert str(result) == 'result = 2A1  +  2B1'
+    with pytest.raises(AttributeError):
+        result.label = 'Γ'
+    assert str(result) == 'result = 2A1  +  2B1'
+
+
+def test_decomposition_equality_and_hash_ignore_label(point_group):
+    result = point_group.constituents([4, 0, 4, 0])
+    other = Decomposition(result.multiplicities.astype(np.int8), result.irreps, 'Γ')
+    assert result == other
+    assert len({result, other}) == 1
+    assert result != point_group.constituents([1, 1, 1, 1])
+
+
+def test_decomposition_hash_unchanged_by_multiplicities_passed_in(point_group):
+    multiplicities = np.array([2, 0, 2, 0])
+    result = Decomposition(multiplicities, point_group.irreps)
+    expected = hash(result)
+    multiplicities[0] = 5
+    assert hash(result) == expected
+    assert result.multiplicities.tolist() == [2, 0, 2, 0]
+    with pytest.raises(ValueError):
+        result.multiplicities[0] = 5
+
+
+def test_constituents_wrong_number_of_elements_handled(point_group, capsys):
+    assert point_group.constituents([4, 0, 4, 0, 5]) is None
+    captured = capsys.readouterr()
+    assert 'ReductionError: The reducible representation must have the same number of elements' == captured.out[:82]
+
+
 def test_convolution_correct(point_group):
     result = point_group.convolution('A1', 'A2')
     assert result.to_list() == [1, 1, -1, -1]
@@ -159,6 +288,36 @@ def test_convolution_one_argument_raises_typeerror(point_group):
         point_group.convolution('A1')
 
 
+def test_product_table_correct(point_group):
+    table = point_group.product_table
+    assert table.shape == (4, 4, 4)
+    assert table[0].tolist() == np.eye(4, dtype=int).tolist()
+    assert table[2, 3].tolist() == [0, 1, 0, 0]  # B1 × B2 = A2
+
+
+def test_product_table_is_cached_and_read_only(point_group):
+    assert point_group.product_table is point_group.product_table
+    with pytest.raises(ValueError):
+        point_group.product_table[0, 0, 0] = 2
+
+
+def test_product_decomposition_of_reducible_product():
+    td = PointGroup('Td')
+    assert td.product_decomposition('T2', 'T2').tolist() == [1, 0, 1, 1, 1]
+
+
+def test_product_decomposition_folds_many_irreps():
+    td = PointGroup('Td')
+    expected = td.reduction(td.convolution('T2', 'E', 'T1', 'T2'))['number of appearances']
+    assert td.product_decomposition('T2', 'E', 'T1', 'T2').tolist() == expected.tolist()
+
+
+def test_product_decomposition_wrong_key_handled(point_group, capsys):
+    assert point_group.product_decomposition('A1', 'gg') is None
+    captured = capsys.readouterr()
+    assert 'The inputted irreducible representations do not exist in this character table.' == captured.out[:78]
+
+
 def test_match_representation_works_when_irreducible_is_provided(point_group):
     result = point_group.match_representation([1, 1, 1, 1])
     expected = pd.Series([1, 1, 1, 1], name='A1')
@@ -193,20 +352,48 @@ def test_match_representation_works_when_reducible_is_provided(point_group):
     assert (expected.iloc[3] == result.iloc[3]).all
 
 
+def test_match_representation_with_floats(point_group):
+    result = point_group.match_representation([1.0, -1.0, -1.0, 1.0])
+    assert result.name == 'B2'
+
+
+def test_match_representation_with_irrational_characters():
+    d4d = PointGroup('D4d')
+    result = d4d.match_representation(d4d.convolution('E1', 'B1'))
+    assert result.name == 'E3'
+
+
+def test_match_many(point_group):
+    result = point_group.match_many([[1, 1, 1, 1], [2, 2, 2, 2], [1, -1, -1, 1], [1.0, 1.0, -1.0, -1.0]])
+    assert result.tolist() == [0, -1, 3, 1]
+
+
+def test_match_many_incorrect_representation_length_handled(point_group, capsys):
+    point_group.match_many([[1, 1, 1, 1, 1]])
+    captured = capsys.readouterr()
+    assert 'MatchRepresentationError: The representations must be a 2D array' == captured.out[:64]
+
+
 def test_show_matched_representation_returns_correct(point_group):
     result = point_group.show_matched_representation([1, 1, 1, 1])
-    expected = pd.Series([1, 1, 1, 1], name='A1')
-    assert result.equals(expected) is True
+    assert result.irreducible == 'A1'
+    assert result.multiplicities.tolist() == [1, 0, 0, 0]
+
+
+def test_show_matched_representation_reducible(point_group):
+    result = point_group.show_matched_representation([2, 2, 2, 2])
+    assert result.irreducible is None
+    assert result.multiplicities.tolist() == [2, 0, 0, 0]
 
 
 def test_show_matched_representation_prints_correct_with_series(point_group, capsys):
-    result = point_group.show_matched_representation(pd.Series([1, 1, 1, 1], name='A1'))
+    point_group.show_matched_representation(pd.Series([1, 1, 1, 1], name='A1'), verbose=True)
     captured = capsys.readouterr()
     assert captured.out[:7] == 'A1 = A1'
 
 
 def test_show_matched_representation_prints_correct_with_list(point_group, capsys):
-    point_group.show_matched_representation([1, 1, 1, 1])
+    point_group.show_matched_representation([1, 1, 1, 1], verbose=True)
     captured = capsys.readouterr()
     assert captured.out[:11] == 'result = A1'
 
@@ -225,14 +412,55 @@ def test_print_result_correct_with_series_changed_lhs(point_group, capsys):
     assert captured.out[:12] == 'A1 × A1 = A1'
 
 
+def test_print_result_with_decomposition(point_group, capsys):
+    result = point_group.convolution_results('A2', 'B1')
+    assert point_group.print_result(result) is result
+    point_group.print_result(result, 'product')
+    captured = capsys.readouterr()
+    assert captured.out.splitlines() == ['A2 × B1 = B2', 'product = B2']
+
+
 def test_convolution_results_correct_with_two_arguments(point_group, capsys):
-    result = point_group.convolution_results('A1', 'A2')
+    result = point_group.convolution_results('A1', 'A2', verbose=True)
     captured = capsys.readouterr()
-    assert result.equals(pd.Series([1, 1, -1, -1], name='A2'))
+    assert result.irreducible == 'A2'
     assert captured.out[:12] == 'A1 × A2 = A2'
 
+
 def test_convolution_results_correct_with_four_arguments(point_group, capsys):
-    result = point_group.convolution_results('A1', 'A2', 'B1', 'B2')
+    result = point_group.convolution_results('A1', 'A2', 'B1', 'B2', verbose=True)
     captured = capsys.readouterr()
-    assert result.equals(pd.Series([1, 1, 1, 1], name='A1'))
+    assert result.irreducible == 'A1'
     assert captured.out[:22] == 'A1 × A2 × B1 × B2 = A1'
+
+
+def test_convolution_results_correct_with_reducible_product(capsys):
+    td = PointGroup('Td')
+    result = td.convolution_results('T2', 'T2', verbose=True)
+    captured = capsys.readouterr()
+    assert result.multiplicities.tolist() == [1, 0, 1, 1, 1]
+    assert captured.out[:28] == 'T2 × T2 = A1  +  E  +  T1  +'
+
+
+@pytest.mark.parametrize('name', ['C2h', 'C2v', 'C3v', 'C4v', 'C6v', 'Cs', 'D2d', 'D3d', 'D3h', 'D4d', 'D4h', 'D6d',
+                                  'D6h', 'O', 'Oh', 'Td'])
+def test_operations_reproduce_xyz_characters(name):
+    point_group = PointGroup(name)
+    operations = point_group.operations
+    assert operations.shape == (point_group._group_order, 3, 3)
+    assert np.allclose(operations @ operations.transpose(0, 2, 1), np.eye(3))
+    assert np.bincount(point_group.operation_classes).tolist() == point_group._class_orders.tolist()
+    assert point_group.verify_operations()
+
+
+def test_operations_are_cached_and_read_only():
+    td = PointGroup('Td')
+    assert td.operations is td.operations
+    assert td.xyz_representation.tolist() == [3, 0, -1, -1, 1]
+    with pytest.raises(ValueError):
+        td.operations[0, 0, 0] = 2
+
+
+def test_operations_with_unreadable_classes_raise(c3):
+    with pytest.raises(OperationError):
+        _ = c3.operations
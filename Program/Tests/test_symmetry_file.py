@@ -1,9 +1,14 @@
 """Tests for symmetry that involve files"""
 
+import os
+import shutil
+
+import numpy as np
 import pandas as pd
 import pytest
 
-from Program.Symmetry.symmetry import PointGroup
+from Program.Symmetry.symmetry import CSV_DIRECTORY, PointGroup, clear_point_group_cache, get_point_group, \
+    point_group_cache_info
 
 
 @pytest.fixture()
@@ -50,3 +55,68 @@ def test_init_with_wrong_path_handled(capsys):
     cs = PointGroup('gg')
     captured = capsys.readouterr()
     assert captured.out[:55] == 'FileNotFoundError: Provided csv file could not be found'
+
+
+
+@pytest.mark.parametrize('name', sorted(file[:-4] for file in os.listdir(CSV_DIRECTORY) if file.endswith('.csv')))
+def test_init_every_shipped_point_group(name):
+    point_group = PointGroup(name)
+    assert len(point_group.irreps) == len(point_group.character_table.index) - 1
+    assert get_point_group(name).irreps == point_group.irreps
+
+
+def test_get_point_group_with_malformed_shipped_csv():
+    # D2h.csv is malformed (all its characters are in one column), so its character table has no classes:
+    d2h = get_point_group('D2h')
+    assert d2h.character_table.columns.empty
+    assert d2h.match_many(np.zeros((2, 0))).tolist() == [0, 0]
+
+@pytest.fixture()
+def empty_cache():
+    clear_point_group_cache()
+    yield
+    clear_point_group_cache()
+
+
+def test_get_point_group_returns_shared_instance(empty_cache, Cs):
+    cs = get_point_group('Cs')
+    assert cs is get_point_group('Cs')
+    assert cs.full_character_table.equals(Cs)
+    assert point_group_cache_info()['shipped'].hits == 1
+    assert point_group_cache_info()['shipped'].misses == 1
+
+
+def test_get_point_group_with_path(empty_cache, tmp_path, Cs):
+    path = shutil.copy(os.path.join(CSV_DIRECTORY, 'Cs.csv'), tmp_path / 'custom.csv')
+    cs = get_point_group(str(path))
+    assert cs is get_point_group(str(path))
+    assert cs.full_character_table.equals(Cs)
+    assert point_group_cache_info()['custom'].hits == 1
+
+
+def test_get_point_group_reloads_modified_file(empty_cache, tmp_path):
+    path = shutil.copy(os.path.join(CSV_DIRECTORY, 'Cs.csv'), tmp_path / 'custom.csv')
+    cs = get_point_group(str(path))
+    os.utime(path, ns=(0, 0))
+    assert cs is not get_point_group(str(path))
+    assert point_group_cache_info()['custom'].misses == 2
+
+
+def test_get_point_group_does_not_cache_unreadable_file(empty_cache, tmp_path, capsys, Cs):
+    path = tmp_path / 'custom.csv'
+    path.write_bytes(b'\xff\xfe;')
+    assert get_point_group(str(path)) is None
+    assert 'TypeError' in capsys.readouterr().out
+    assert point_group_cache_info()['custom'].currsize == 0
+
+    # Once the file has been corrected, it is loaded even if its modification time has not changed:
+    modification_time = os.stat(path).st_mtime_ns
+    shutil.copy(os.path.join(CSV_DIRECTORY, 'Cs.csv'), path)
+    os.utime(path, ns=(modification_time, modification_time))
+    assert get_point_group(str(path)).full_character_table.equals(Cs)
+
+
+def test_get_point_group_with_wrong_path_handled(empty_cache, capsys):
+    assert get_point_group('gg') is None
+    captured = capsys.readouterr()
+    assert captured.out[:55] == 'FileNotFoundError: Provided csv file could not be found'